@@ -16,6 +16,7 @@
 
 """Main Covalent public functionality."""
 
+from importlib import import_module as _import_module
 from importlib import metadata
 
 from . import _file_transfer as fs  # nopycln: import
@@ -38,11 +39,15 @@ from ._workflow import (  # nopycln: import
     lattice,
 )
 from ._workflow.electron import wait  # nopycln: import
-from ._workflow.qelectron import qelectron  # nopycln: import
 from .executor.utils import get_context  # nopycln: import
-from .quantum import QCluster  # nopycln: import
 
-__all__ = [s for s in dir() if not s.startswith("_")]
+# Quantum functionality, imported on first use since it pulls in PennyLane.
+_LAZY_ATTRIBUTES = {
+    "qelectron": ("._workflow.qelectron", "qelectron"),
+    "QCluster": (".quantum", "QCluster"),
+}
+
+__all__ = [s for s in dir() if not s.startswith("_")] + list(_LAZY_ATTRIBUTES)
 
 for _s in dir():
     if not _s.startswith("_"):
@@ -50,3 +55,18 @@ for _s in dir():
         _obj.__module__ = __name__
 
 __version__ = metadata.version("covalent")
+
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module_name, attr_name = _LAZY_ATTRIBUTES[name]
+    obj = getattr(_import_module(module_name, __name__), attr_name)
+    obj.__module__ = __name__
+    globals()[name] = obj
+    return obj
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -15,9 +15,10 @@
 # limitations under the License.
 
 import os
-from subprocess import PIPE, CalledProcessError, Popen
+from subprocess import CalledProcessError
 from typing import Optional
 
+from ..._shared_files.subprocess_runner import get_ssh_control_options, get_subprocess_runner
 from .. import File
 from .transfer_strategy_base import FileTransferStrategy
 
@@ -30,6 +31,10 @@ class Rsync(FileTransferStrategy):
         user: (optional) Determine user to specify for remote host if using rsync with ssh
         host: (optional) Determine what host to connect to if using rsync with ssh
         private_key_path: (optional) Filepath for ssh private key to use if using rsync with ssh
+        multiplex_ssh: (optional) Reuse a single ssh master connection for all transfers to the host
+
+    Transfers are run through the subprocess runner shared by the process so that the number of
+    concurrent rsync processes connecting to the same host is bounded.
     """
 
     def __init__(
@@ -37,10 +42,12 @@ class Rsync(FileTransferStrategy):
         user: Optional[str] = "",
         host: Optional[str] = "",
         private_key_path: Optional[str] = None,
+        multiplex_ssh: bool = False,
     ):
         self.user = user
         self.private_key_path = private_key_path
         self.host = host
+        self.multiplex_ssh = multiplex_ssh
 
         if self.private_key_path and not os.path.exists(self.private_key_path):
             raise FileNotFoundError(
@@ -53,8 +60,14 @@ class Rsync(FileTransferStrategy):
         local_filepath = local_file.filepath
         remote_filepath = remote_file.filepath
         args = ["rsync"]
+        ssh_args = ["ssh"]
         if self.private_key_path:
-            args.append(f'-ae "ssh -i {self.private_key_path}"')
+            ssh_args.append(f"-i {self.private_key_path}")
+        if self.multiplex_ssh:
+            ssh_args.append(get_ssh_control_options())
+
+        if len(ssh_args) > 1:
+            args.append(f'-ae "{" ".join(ssh_args)}"')
         else:
             args.append("-ae ssh")
 
@@ -76,12 +89,11 @@ class Rsync(FileTransferStrategy):
         to_filepath = to_file.filepath
         return f"rsync -a {from_filepath} {to_filepath}"
 
-    def return_subprocess_callable(self, cmd) -> None:
+    def return_subprocess_callable(self, cmd, host: str = "") -> None:
         def callable():
-            p = Popen(cmd, shell=True, stdout=PIPE, stderr=PIPE)
-            output, error = p.communicate()
-            if p.returncode != 0:
-                raise CalledProcessError(p.returncode, f'"{cmd}" with error: {str(error)}')
+            returncode, output, error = get_subprocess_runner().run_sync(cmd, host=host)
+            if returncode != 0:
+                raise CalledProcessError(returncode, f'"{cmd}" with error: {str(error)}')
 
         return callable
 
@@ -93,9 +105,9 @@ class Rsync(FileTransferStrategy):
     # return callable to download here implies 'from' is a remote source
     def download(self, from_file: File, to_file: File = File()) -> File:
         cmd = self.get_rsync_ssh_cmd(to_file, from_file, transfer_from_remote=True)
-        return self.return_subprocess_callable(cmd)
+        return self.return_subprocess_callable(cmd, host=self.host)
 
     # return callable to upload here implies 'to' is a remote source
     def upload(self, from_file: File, to_file: File) -> None:
         cmd = self.get_rsync_ssh_cmd(from_file, to_file, transfer_from_remote=False)
-        return self.return_subprocess_callable(cmd)
+        return self.return_subprocess_callable(cmd, host=self.host)
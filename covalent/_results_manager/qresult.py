@@ -69,6 +69,13 @@ class QNodeFutureResult:
         self.kwargs = kwargs
         return self
 
+    def __await__(self):
+        """
+        Awaiting the instance retrieves the results without blocking the event loop,
+        e.g. `await qnode.run_later(...)` or `asyncio.gather` over many QNodes.
+        """
+        return self.result_async().__await__()
+
     def result(self) -> Any:
         """
         Retrieve the results for the given `batch_id` from middleware. This method
@@ -80,31 +87,52 @@ class QNodeFutureResult:
 
         if self._result is None:
             # Get raw results from the middleware.
-            results = middleware.get_results(self.batch_id)
+            self._set_result(middleware.get_results(self.batch_id))
 
-            # Required correct gradient post-processing in some cases.
-            if self.interface == "autograd":
-                self._result = results
-                res = results[0]
+        return self._result
 
-            if self.interface != "numpy":
-                interface = self.interface  # re-execute with any non-numpy interface
-                res = results[0]  # re-execute with this result
+    async def result_async(self) -> Any:
+        """
+        Retrieve the results for the given `batch_id` from middleware. Waiting for
+        the results does not block the running event loop.
 
-            elif self.qnode.interface is None:
-                interface = None
-                res = results[0]
+        Returns:
+            The results of the circuit execution.
+        """
 
-            elif self.qnode.interface == "auto":
-                interface = "auto"
-                res = results
+        if self._result is None:
+            # Get raw results from the middleware.
+            self._set_result(await middleware.get_results_async(self.batch_id))
 
-            else:
-                # Skip re-execution.
-                self._result = results
-                return results
+        return self._result
 
-            args, kwargs = self.args, self.kwargs
-            self._result = re_execute(res, self.qnode, self.tape)(interface, *args, **kwargs)
+    def _set_result(self, results) -> None:
+        """
+        Post-process the raw results from the middleware into the output
+        of the original QNode.
+        """
 
-        return self._result
+        # Required correct gradient post-processing in some cases.
+        if self.interface == "autograd":
+            self._result = results
+            res = results[0]
+
+        if self.interface != "numpy":
+            interface = self.interface  # re-execute with any non-numpy interface
+            res = results[0]  # re-execute with this result
+
+        elif self.qnode.interface is None:
+            interface = None
+            res = results[0]
+
+        elif self.qnode.interface == "auto":
+            interface = "auto"
+            res = results
+
+        else:
+            # Skip re-execution.
+            self._result = results
+            return
+
+        args, kwargs = self.args, self.kwargs
+        self._result = re_execute(res, self.qnode, self.tape)(interface, *args, **kwargs)
@@ -27,7 +27,6 @@ from .._shared_files.qelectron_utils import QE_DB_DIRNAME
 from .._shared_files.util_classes import RESULT_STATUS, Status
 from .._workflow.lattice import Lattice
 from .._workflow.transport import TransportableObject
-from ..quantum.qserver import database as qe_db
 
 if TYPE_CHECKING:
     from .._shared_files.util_classes import Status
@@ -387,6 +386,9 @@ Node Outputs
         except KeyError:
             return None
 
+        # Imported here since the quantum stack is slow to import.
+        from ..quantum.qserver import database as qe_db
+
         results_dir = get_config("dispatcher")["results_dir"]
         db_dir = os.path.join(results_dir, self.dispatch_id, QE_DB_DIRNAME)
 
@@ -121,6 +121,12 @@ def get_default_dask_config():
         "mem_per_worker": "auto",
         "threads_per_worker": 1,
         "num_workers": dask.system.CPU_COUNT,
+        "autoscale": "false",
+        "min_workers": 1,
+        "max_workers": dask.system.CPU_COUNT,
+        "autoscale_interval": 5,
+        "autoscale_cooldown": 30,
+        "autoscale_memory_threshold": 0.8,
     }
 
 
@@ -18,15 +18,20 @@
 
 """Hopefully temporary custom tools to handle pickling and/or un-pickling."""
 
+import sys
 from contextlib import contextmanager
+from functools import lru_cache
 from typing import Any, Callable, Tuple
 
-from pennylane.ops.qubit.observables import Projector
 
-_PENNYLANE_METHOD_OVERRIDES = (
-    # class, method_name, method_func
-    (Projector, "__reduce__", lambda self: (Projector, (self.data[0], self.wires))),
-)
+@lru_cache
+def _get_pennylane_method_overrides() -> Tuple[Tuple[Any, str, Callable], ...]:
+    from pennylane.ops.qubit.observables import Projector
+
+    return (
+        # class, method_name, method_func
+        (Projector, "__reduce__", lambda self: (Projector, (self.data[0], self.wires))),
+    )
 
 
 def _qml_mods_pickle(func: Callable) -> Callable:
@@ -36,7 +41,11 @@ def _qml_mods_pickle(func: Callable) -> Callable:
     """
 
     def _wrapper(*args, **kwargs):
-        with _method_overrides(_PENNYLANE_METHOD_OVERRIDES):
+        # Without PennyLane imported there are no PennyLane objects to pickle.
+        if "pennylane" not in sys.modules:
+            return func(*args, **kwargs)
+
+        with _method_overrides(_get_pennylane_method_overrides()):
             return func(*args, **kwargs)
 
     return _wrapper
@@ -15,29 +15,35 @@
 # limitations under the License.
 
 import base64
-import re
+import threading
 from pathlib import Path
-from typing import Tuple
+from typing import Any, Tuple
 
 from ..executor.utils.context import get_context
 from .config import get_config
 from .logger import app_log
 
 _QE_DB_DATA_MARKER = "<====QELECTRON_DB_DATA====>"
+# Key of the task output header which carries the QElectron database
+_QE_DB_HEADER_KEY = "qelectron_db"
 _DATA_FILENAME = "data.mdb"
 
 QE_DB_DIRNAME = ".database"
 
+# Database collected for the task running in the current thread, until it is
+# attached to the task's output by `covalent.executor.base.wrapper_fn`
+_collected = threading.local()
 
-def print_qelectron_db() -> None:
+
+def _read_qelectron_db() -> bytes:
     """
-    Check for QElectron database file and dump it into stdout
+    Read the QElectron database file of the task in the current context
 
     Args(s)
         None
 
     Return(s)
-        None
+        bytes of the `data.mdb` file, or empty bytes if the task has no database
     """
     context = get_context()
     node_id, dispatch_id = context.node_id, context.dispatch_id
@@ -46,14 +52,62 @@ def print_qelectron_db() -> None:
     task_subdir = db_dir / dispatch_id / f"node-{node_id}"
     if not task_subdir.exists():
         # qelectron database not found for dispatch_id/node
-        return
+        return b""
 
     with open(task_subdir / _DATA_FILENAME, "rb") as data_mdb_file:
-        data_bytes = base64.b64encode(data_mdb_file.read())
+        return data_mdb_file.read()
 
-    output_string = "".join([_QE_DB_DATA_MARKER, data_bytes.decode(), _QE_DB_DATA_MARKER])
-    app_log.debug(f"Printing Qelectron data for node_id {node_id}")
-    print(output_string)
+
+def collect_qelectron_db() -> None:
+    """
+    Check for QElectron database file and hold on to it until it can be
+    attached to the task output with `attach_qelectron_db`
+
+    Args(s)
+        None
+
+    Return(s)
+        None
+    """
+    _collected.data = _read_qelectron_db()
+
+
+def attach_qelectron_db(output: Any) -> None:
+    """
+    Attach the collected QElectron database, if any, to the task output
+
+    The database is stored base64-encoded in the header of the output, so
+    it travels back to the dispatcher together with the output in every
+    form the output is transferred in, including its archived
+    `TransportableObject.serialize()` form, instead of through the task's
+    stdout.
+
+    Args(s)
+        output: TransportableObject returned by the task
+
+    Return(s)
+        None
+    """
+    data = getattr(_collected, "data", b"")
+    _collected.data = b""
+    if data:
+        output._header[_QE_DB_HEADER_KEY] = base64.b64encode(data).decode("utf-8")
+
+
+def pop_qelectron_db(output: Any) -> bytes:
+    """
+    Detach the QElectron database from a task output, if present
+
+    Arg(s):
+        output: TransportableObject returned by the task
+
+    Return(s):
+        bytes representing the `data.mdb` file
+    """
+    header = getattr(output, "_header", None)
+    if not isinstance(header, dict) or _QE_DB_HEADER_KEY not in header:
+        return b""
+    return base64.b64decode(header.pop(_QE_DB_HEADER_KEY))
 
 
 def extract_qelectron_db(s: str) -> Tuple[str, bytes]:
@@ -68,19 +122,23 @@ def extract_qelectron_db(s: str) -> Tuple[str, bytes]:
         bytes_data: bytes representing the `data.mdb` file
     """
     # do nothing if string is empty or no database bytes found in the `s`
-    data_pattern = f".*{_QE_DB_DATA_MARKER}(.*){_QE_DB_DATA_MARKER}.*"
-    if not s or not (_matches := re.findall(data_pattern, s)):
+    if not s or _QE_DB_DATA_MARKER not in s:
+        return s, b""
+
+    end = s.rfind(_QE_DB_DATA_MARKER)
+    start = s.rfind(_QE_DB_DATA_MARKER, 0, end)
+    if start < 0:
         app_log.debug("No Qelectron data detected")
         return s, b""
 
     # load qelectron data and convert back to bytes
     app_log.debug("Detected Qelectron output data")
-    bytes_data = base64.b64decode(_matches.pop())
+    bytes_data = base64.b64decode(s[start + len(_QE_DB_DATA_MARKER) : end])
 
     # remove decoded database bytes from `s`
-    s_without_db = remove_qelectron_db(s)
+    s_without_db = s[:start] + s[end + len(_QE_DB_DATA_MARKER) :]
 
-    return s_without_db, bytes_data
+    return s_without_db.strip(), bytes_data
 
 
 def remove_qelectron_db(output: str):
@@ -93,7 +151,15 @@ def remove_qelectron_db(output: str):
     Return:
         the output string without QElectron database removed
     """
-    output = re.sub(f"{_QE_DB_DATA_MARKER}.*{_QE_DB_DATA_MARKER}", "", output)
+    if _QE_DB_DATA_MARKER not in output:
+        return output.strip()
+
+    start = output.find(_QE_DB_DATA_MARKER)
+    end = output.rfind(_QE_DB_DATA_MARKER)
+    if start == end:
+        return output.strip()
+
+    output = output[:start] + output[end + len(_QE_DB_DATA_MARKER) :]
     return output.strip()
 
 
@@ -0,0 +1,183 @@
+# Copyright 2023 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Bounded runner for shell subprocesses such as ssh, scp and rsync."""
+
+import asyncio
+import os
+import threading
+import weakref
+from subprocess import PIPE, Popen
+from typing import Callable, Dict, Optional, Tuple
+
+# Maximum number of subprocesses running at once in this process
+DEFAULT_MAX_CONCURRENCY = 32
+
+# Maximum number of subprocesses connecting to the same remote host at once. This is kept
+# below the default `MaxStartups` of OpenSSH so that bursts are not refused by the target.
+DEFAULT_MAX_PER_HOST = 8
+
+# Number of bytes read from the pipes of a subprocess at a time
+READ_CHUNK_SIZE = 64 * 1024
+
+_GLOBAL_KEY = None
+
+
+def get_ssh_control_options(control_dir: str = "", persist: int = 60) -> str:
+    """
+    Return ssh options which multiplex connections to a host over a single master connection
+
+    Args:
+        control_dir: Directory where the control sockets are stored. Defaults to `~/.ssh`.
+        persist: Number of seconds the master connection stays open after the last session ends.
+
+    Returns:
+        String of ssh command line options.
+    """
+
+    control_dir = control_dir or os.path.join(os.path.expanduser("~"), ".ssh")
+    control_path = os.path.join(control_dir, "covalent-%r@%h:%p")
+    return f"-o ControlMaster=auto -o ControlPath={control_path} -o ControlPersist={persist}"
+
+
+async def _read_stream(
+    stream: asyncio.StreamReader, line_callback: Optional[Callable[[bytes], None]] = None
+) -> bytes:
+    """Read a stream as it is produced, passing each complete line to `line_callback`
+
+    The stream is read in chunks rather than with `readline` so that lines
+    longer than the buffer limit of the stream reader do not fail the read."""
+
+    chunks = []
+    pending = b""
+    while chunk := await stream.read(READ_CHUNK_SIZE):
+        chunks.append(chunk)
+        if line_callback:
+            *lines, pending = (pending + chunk).split(b"\n")
+            for line in lines:
+                line_callback(line + b"\n")
+    if line_callback and pending:
+        line_callback(pending)
+    return b"".join(chunks)
+
+
+class SubprocessRunner:
+    """
+    Run shell commands with a bound on the number of concurrent subprocesses,
+    both overall and per remote host.
+
+    Attributes:
+        max_concurrency: Maximum number of subprocesses running at once.
+        max_per_host: Maximum number of subprocesses running at once against a single host.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_per_host: int = DEFAULT_MAX_PER_HOST,
+    ) -> None:
+        self.max_concurrency = max_concurrency
+        self.max_per_host = max_per_host
+
+        self._lock = threading.Lock()
+        self._sync_limits: Dict[Optional[str], threading.BoundedSemaphore] = {}
+        self._async_limits = weakref.WeakKeyDictionary()
+
+    def _get_sync_limit(self, key: Optional[str]) -> threading.BoundedSemaphore:
+        with self._lock:
+            if key not in self._sync_limits:
+                size = self.max_concurrency if key is _GLOBAL_KEY else self.max_per_host
+                self._sync_limits[key] = threading.BoundedSemaphore(size)
+            return self._sync_limits[key]
+
+    def _get_async_limit(self, key: Optional[str]) -> asyncio.Semaphore:
+        # asyncio primitives are bound to an event loop, hence one set of limits per loop
+        limits = self._async_limits.setdefault(asyncio.get_running_loop(), {})
+        if key not in limits:
+            size = self.max_concurrency if key is _GLOBAL_KEY else self.max_per_host
+            limits[key] = asyncio.Semaphore(size)
+        return limits[key]
+
+    async def run(
+        self,
+        cmd: str,
+        host: str = "",
+        stdout_callback: Optional[Callable[[bytes], None]] = None,
+    ) -> Tuple[asyncio.subprocess.Process, bytes, bytes]:
+        """
+        Run a shell command asynchronously once a slot is available
+
+        Args:
+            cmd: Shell command to run.
+            host: Remote host the command connects to, if any.
+            stdout_callback: Called with each line of stdout as soon as it is produced.
+
+        Returns:
+            Tuple of the finished process, its stdout and its stderr.
+        """
+
+        # Wait for a slot on the host first so that commands queued for a busy host
+        # do not hold on to slots which commands for other hosts could use
+        if host:
+            await self._get_async_limit(host).acquire()
+        try:
+            async with self._get_async_limit(_GLOBAL_KEY):
+                proc = await asyncio.create_subprocess_shell(cmd, stdout=PIPE, stderr=PIPE)
+                stdout, stderr = await asyncio.gather(
+                    _read_stream(proc.stdout, stdout_callback), _read_stream(proc.stderr)
+                )
+                await proc.wait()
+        finally:
+            if host:
+                self._get_async_limit(host).release()
+
+        return proc, stdout, stderr
+
+    def run_sync(self, cmd: str, host: str = "") -> Tuple[int, bytes, bytes]:
+        """
+        Run a shell command, blocking until a slot is available and the command finishes
+
+        Args:
+            cmd: Shell command to run.
+            host: Remote host the command connects to, if any.
+
+        Returns:
+            Tuple of the return code, stdout and stderr of the command.
+        """
+
+        if host:
+            self._get_sync_limit(host).acquire()
+        try:
+            with self._get_sync_limit(_GLOBAL_KEY):
+                p = Popen(cmd, shell=True, stdout=PIPE, stderr=PIPE)
+                stdout, stderr = p.communicate()
+        finally:
+            if host:
+                self._get_sync_limit(host).release()
+
+        return p.returncode, stdout, stderr
+
+
+_subprocess_runner = None
+
+
+def get_subprocess_runner() -> SubprocessRunner:
+    """Return the subprocess runner shared by the whole process"""
+
+    global _subprocess_runner
+    if _subprocess_runner is None:
+        _subprocess_runner = SubprocessRunner()
+    return _subprocess_runner
@@ -106,7 +106,8 @@ class QNodeQE(qml.QNode):
         waiting for the circuit to finish executing.
 
         Returns:
-            future_result: An object that can be queried for the execution result.
+            future_result: An object that can be queried for the execution result,
+                either with its blocking `result` method or by awaiting it.
         """
 
         # pylint: disable=protected-access
@@ -19,20 +19,26 @@ Defines executors and provides a "manager" to get all available executors
 """
 
 import contextlib
+import functools
 import glob
 import importlib
 import inspect
 import os
 import sys
 from pathlib import Path
-from typing import Any, Dict, List, Union
-
-import pkg_resources
+from typing import Any, Dict, List, Optional, Union
 
 from .._shared_files import logger
 from .._shared_files.config import get_config, update_config
-from ..quantum import QCluster, Simulator
 from .base import BaseExecutor, wrapper_fn
+from .utils.plugin_index import (
+    LazyPluginMap,
+    PluginSpec,
+    get_plugins_fingerprint,
+    iter_entry_points,
+    read_plugin_index,
+    write_plugin_index,
+)
 
 app_log = logger.app_log
 log_stack_info = logger.log_stack_info
@@ -46,16 +52,21 @@ class _ExecutorManager:
     Executor manager to return a valid executor which can be
     used as an argument to electron and lattice decorators.
 
-    Initializing generates a list of available executor plugins.
+    The list of available executor plugins is generated on first use, from
+    an index of the plugins when it is up to date. Plugin modules listed in the
+    index are only imported once their executor is requested.
     """
 
     def __init__(self) -> None:
         # Dictionary mapping executor name to executor class
-        self.executor_plugins_map: Dict[str, Any] = {}
+        self._executor_plugins_map = LazyPluginMap()
         self.executor_plugins_exports_map: Dict[str, Any] = {}
 
-        if os.environ.get("COVALENT_PLUGIN_LOAD", "true").lower() == "true":
-            self.generate_plugins_list()
+        # Plugins discovered while generating the plugin index
+        self._plugin_specs: Dict[str, PluginSpec] = {}
+
+        # Plugins are loaded when the executor map is first accessed.
+        self._plugins_pending = os.environ.get("COVALENT_PLUGIN_LOAD", "true").lower() == "true"
 
     def __new__(cls):
         # Singleton pattern for this class
@@ -63,10 +74,24 @@ class _ExecutorManager:
             cls.instance = super().__new__(cls)
         return cls.instance
 
-    def generate_plugins_list(self) -> None:
+    @property
+    def executor_plugins_map(self) -> LazyPluginMap:
+        """Dictionary mapping executor name to executor class"""
+
+        if getattr(self, "_plugins_pending", False):
+            self._plugins_pending = False
+            self.generate_plugins_list()
+        return self._executor_plugins_map
+
+    @executor_plugins_map.setter
+    def executor_plugins_map(self, value: Dict[str, Any]) -> None:
+        self._plugins_pending = False
+        self._executor_plugins_map = LazyPluginMap(value)
+
+    def generate_plugins_list(self, use_index: bool = True) -> None:
         """
         Generate a list of available executor plugins.
-        This is called automatically when the class is initialized.
+        This is called automatically when the executor map is first accessed.
 
         The list of executors is generated by loading the already
         installed plugins and the plugins in the executor directory.
@@ -77,8 +102,12 @@ class _ExecutorManager:
         The module should have an attribute named executor_plugin_name
         which is set to the class name defining the plugin.
 
+        The discovered plugins are saved to an index in the cache directory,
+        which is used instead of importing every plugin module until a
+        distribution is installed or removed or a plugin module changes.
+
         Args:
-            None
+            use_index: Whether to use the plugin index if it is up to date.
 
         Returns:
             None
@@ -86,7 +115,6 @@ class _ExecutorManager:
 
         # Load plugins that are part of the covalent path:
         pkg_plugins_path = os.path.join(os.path.dirname(__file__), "executor_plugins")
-        self._load_executors(pkg_plugins_path)
 
         # Look for executor plugins in a user-defined path:
         user_plugins_path = ":".join(
@@ -98,11 +126,39 @@ class _ExecutorManager:
                 ],
             )
         )
+
+        index_path = self._get_plugin_index_path()
+        fingerprint = get_plugins_fingerprint(
+            [pkg_plugins_path] + sorted(set(filter(None, user_plugins_path.split(":"))))
+        )
+
+        plugin_specs = read_plugin_index(index_path, fingerprint) if use_index else None
+        if plugin_specs is not None:
+            for plugin_spec in plugin_specs:
+                self.executor_plugins_map[plugin_spec.name] = plugin_spec
+                self._update_plugin_defaults(plugin_spec.name, plugin_spec.defaults)
+            return
+
+        self._plugin_specs = {}
+        self._load_executors(pkg_plugins_path)
         self._load_executors(user_plugins_path)
 
         # Look for pip-installed plugins:
         self._load_installed_plugins()
 
+        write_plugin_index(index_path, fingerprint, self._plugin_specs.values())
+
+    def _get_plugin_index_path(self) -> str:
+        """Return the path to the executor plugin index"""
+
+        return os.path.join(get_config("dispatcher.cache_dir"), "executor_plugins.json")
+
+    def _update_plugin_defaults(self, short_name: str, defaults: Optional[Dict]) -> None:
+        """Add the default parameters of a plugin to the config, keeping values set by the user"""
+
+        if defaults is not None:
+            update_config({"executors": {short_name: defaults}}, override_existing=False)
+
     def get_executor(self, name: Union[str, BaseExecutor]) -> BaseExecutor:
         """
         Get an executor by name.
@@ -149,13 +205,17 @@ class _ExecutorManager:
 
         return bool(len(plugin_class))
 
-    def _populate_executor_map_from_module(self, the_module: Any) -> None:
+    def _populate_executor_map_from_module(
+        self, the_module: Any, module_file: Optional[str] = None
+    ) -> None:
         """
         Populate the executor map from a module.
         Also checks whether `EXECUTOR_PLUGIN_NAME` is defined in the module.
 
         Args:
             the_module: The module to populate the executor map from.
+            module_file: Path the module was loaded from, for plugins which are
+                not importable by module name.
 
         Returns:
             None
@@ -185,11 +245,16 @@ class _ExecutorManager:
             short_name = the_module.__name__.split("/")[-1].split(".")[-1]
             self.executor_plugins_map[short_name] = plugin_class
 
-            if hasattr(the_module, "_EXECUTOR_PLUGIN_DEFAULTS"):
-                default_params = {
-                    "executors": {short_name: getattr(the_module, "_EXECUTOR_PLUGIN_DEFAULTS")},
-                }
-                update_config(default_params, override_existing=False)
+            defaults = getattr(the_module, "_EXECUTOR_PLUGIN_DEFAULTS", None)
+            self._update_plugin_defaults(short_name, defaults)
+
+            self._plugin_specs[short_name] = PluginSpec(
+                name=short_name,
+                class_name=executor_name,
+                module=the_module.__name__,
+                path=module_file,
+                defaults=defaults,
+            )
 
         else:
             # The requested plugin (the_module.module_name) was not found in the module.
@@ -215,8 +280,7 @@ class _ExecutorManager:
             None
         """
 
-        entry_points = pkg_resources.iter_entry_points("covalent.executor.executor_plugins")
-        for entry in entry_points:
+        for entry in iter_entry_points("covalent.executor.executor_plugins"):
             the_module = entry.load()
             self._populate_executor_map_from_module(the_module)
 
@@ -249,7 +313,7 @@ class _ExecutorManager:
                     the_module = importlib.util.module_from_spec(module_spec)
                     module_spec.loader.exec_module(the_module)
 
-                    self._populate_executor_map_from_module(the_module)
+                    self._populate_executor_map_from_module(the_module, module_file)
 
     def list_executors(self, regenerate: bool = False, print_names: bool = True) -> List[str]:
         """
@@ -264,7 +328,7 @@ class _ExecutorManager:
         """
 
         if regenerate:
-            self.generate_plugins_list()
+            self.generate_plugins_list(use_index=False)
 
         executor_list = []
         for n, name in enumerate(self.executor_plugins_map, start=1):
@@ -284,6 +348,8 @@ class _QExecutorManager:
     """
 
     def __init__(self):
+        from ..quantum import QCluster, Simulator
+
         # Dictionary mapping executor name to executor class
         self.executor_plugins_map: Dict[str, Any] = {
             "QCluster": QCluster,
@@ -370,11 +436,32 @@ class _QExecutorManager:
 
 
 _executor_manager = _ExecutorManager()
-_qexecutor_manager = _QExecutorManager()
 
-for name in _executor_manager.executor_plugins_map:
-    plugin_class = _executor_manager.executor_plugins_map[name]
-    globals()[plugin_class.__name__] = plugin_class
 
-for qexecutor_cls in _qexecutor_manager.executor_plugins_map.values():
-    globals()[qexecutor_cls.__name__] = qexecutor_cls
+@functools.lru_cache
+def _get_qexecutor_manager() -> _QExecutorManager:
+    return _QExecutorManager()
+
+
+def __getattr__(name: str) -> Any:
+    # Executor classes are exported lazily, so that plugins (and, for quantum
+    # executors, PennyLane) are only imported once an executor is requested.
+    if name == "_qexecutor_manager":
+        return _get_qexecutor_manager()
+    if name.startswith("_"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    short_name = _executor_manager.executor_plugins_map.find(name)
+    if short_name is not None:
+        plugin_class = _executor_manager.executor_plugins_map[short_name]
+    else:
+        plugin_classes = {
+            qexecutor_cls.__name__: qexecutor_cls
+            for qexecutor_cls in _get_qexecutor_manager().executor_plugins_map.values()
+        }
+        if name not in plugin_classes:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        plugin_class = plugin_classes[name]
+
+    globals()[name] = plugin_class
+    return plugin_class
@@ -45,7 +45,7 @@ import aiofiles
 from .._shared_files import TaskRuntimeError, logger
 from .._shared_files.context_managers import active_dispatch_info_manager
 from .._shared_files.exceptions import TaskCancelledError
-from .._shared_files.qelectron_utils import remove_qelectron_db
+from .._shared_files.qelectron_utils import attach_qelectron_db, remove_qelectron_db
 from .._shared_files.util_classes import RESULT_STATUS, DispatchInfo
 from .._workflow.depscall import RESERVED_RETVAL_KEY__FILES
 from .._workflow.transport import TransportableObject
@@ -111,7 +111,9 @@ def wrapper_fn(
         ca_kwargs = serialized_kwargs.get_deserialized()
         ca_fn(*ca_args, **ca_kwargs)
 
-    return TransportableObject(output)
+    output = TransportableObject(output)
+    attach_qelectron_db(output)
+    return output
 
 
 class _AbstractBaseExecutor(ABC):
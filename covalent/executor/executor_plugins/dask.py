@@ -21,8 +21,10 @@ and waits for execution to finish then returns the result.
 This is a plugin executor module; it is loaded if found and properly structured.
 """
 
+import operator
 import os
-from typing import Callable, Dict, List, Literal, Optional
+import weakref
+from typing import Any, Callable, Dict, List, Literal, Optional
 
 from dask.distributed import CancelledError, Client, Future
 
@@ -53,8 +55,42 @@ _EXECUTOR_PLUGIN_DEFAULTS = {
         "workdir",
     ),
     "create_unique_workdir": False,
+    "keep_outputs_on_cluster": False,
 }
 
+# Map of scheduler address -> {id(output): (weakref to output, future)}.
+# Outputs of tasks run with `keep_outputs_on_cluster` stay resident on the
+# Dask workers for as long as the dispatcher holds the corresponding
+# TransportableObject so that downstream tasks on the same cluster can
+# consume them without re-uploading the serialized value.
+_cluster_futures: Dict[str, Dict[int, tuple]] = {}
+
+
+def _register_cluster_future(scheduler_address: str, output: Any, future: Future) -> None:
+    """Track a worker-resident future for `output` until `output` is garbage collected."""
+
+    try:
+        ref = weakref.ref(output)
+    except TypeError:
+        # Builtins such as None or ints cannot be tracked and are cheap to resend anyway
+        return
+
+    futures = _cluster_futures.setdefault(scheduler_address, {})
+    key = id(output)
+    futures[key] = (ref, future)
+    weakref.finalize(output, futures.pop, key, None)
+
+
+def _resolve_cluster_future(scheduler_address: str, value: Any) -> Any:
+    """Return the worker-resident future for `value` if there is one, else `value` itself."""
+
+    entry = _cluster_futures.get(scheduler_address, {}).get(id(value))
+    if entry is None:
+        return value
+
+    ref, future = entry
+    return future if ref() is value else value
+
 
 class DaskExecutor(AsyncBaseExecutor):
     """
@@ -71,6 +107,7 @@ class DaskExecutor(AsyncBaseExecutor):
         current_env_on_conda_fail: bool = False,
         workdir: str = "",
         create_unique_workdir: Optional[bool] = None,
+        keep_outputs_on_cluster: Optional[bool] = None,
     ) -> None:
         if not cache_dir:
             cache_dir = _EXECUTOR_PLUGIN_DEFAULTS["cache_dir"]
@@ -91,6 +128,14 @@ class DaskExecutor(AsyncBaseExecutor):
                 debug_msg = f"Couldn't find `executors.dask.create_unique_workdir` in config, using default value {create_unique_workdir}."
                 app_log.debug(debug_msg)
 
+        if keep_outputs_on_cluster is None:
+            try:
+                keep_outputs_on_cluster = get_config("executors.dask.keep_outputs_on_cluster")
+            except KeyError:
+                keep_outputs_on_cluster = _EXECUTOR_PLUGIN_DEFAULTS["keep_outputs_on_cluster"]
+                debug_msg = f"Couldn't find `executors.dask.keep_outputs_on_cluster` in config, using default value {keep_outputs_on_cluster}."
+                app_log.debug(debug_msg)
+
         super().__init__(
             log_stdout,
             log_stderr,
@@ -102,6 +147,7 @@ class DaskExecutor(AsyncBaseExecutor):
         self.workdir = workdir
         self.create_unique_workdir = create_unique_workdir
         self.scheduler_address = scheduler_address
+        self.keep_outputs_on_cluster = keep_outputs_on_cluster
 
     async def run(self, function: Callable, args: List, kwargs: Dict, task_metadata: Dict):
         """Submit the function and inputs to the dask cluster"""
@@ -133,6 +179,14 @@ class DaskExecutor(AsyncBaseExecutor):
         else:
             current_workdir = self.workdir
 
+        if self.keep_outputs_on_cluster:
+            # Substitute inputs already resident on this cluster with their futures;
+            # Dask resolves them on the worker instead of shipping the values again.
+            args = [_resolve_cluster_future(self.scheduler_address, arg) for arg in args]
+            kwargs = {
+                k: _resolve_cluster_future(self.scheduler_address, v) for k, v in kwargs.items()
+            }
+
         future = dask_client.submit(dask_wrapper, function, args, kwargs, current_workdir)
         await self.set_job_handle(future.key)
         app_log.debug(f"Submitted task {node_id} to dask with key {future.key}")
@@ -149,6 +203,13 @@ class DaskExecutor(AsyncBaseExecutor):
             print(tb, end="", file=self.task_stderr)
             raise TaskRuntimeError(tb)
 
+        if self.keep_outputs_on_cluster:
+            output_future = dask_client.submit(operator.getitem, future, 0)
+            _register_cluster_future(self.scheduler_address, result, output_future)
+            app_log.debug(
+                f"Keeping output of task {node_id} on cluster with key {output_future.key}"
+            )
+
         # FIX: need to get stdout and stderr from dask worker and print them
         return result
 
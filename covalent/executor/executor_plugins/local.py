@@ -55,6 +55,10 @@ _EXECUTOR_PLUGIN_DEFAULTS = {
 }
 
 
+# Names of the node log files which the dispatcher serves to the UI
+NODE_STDOUT_FILENAME = "stdout.log"
+NODE_STDERR_FILENAME = "stderr.log"
+
 proc_pool = ProcessPoolExecutor()
 
 
@@ -117,8 +121,21 @@ class LocalExecutor(BaseExecutor):
         else:
             current_workdir = self.workdir
 
+        # The task runs on the dispatcher's host, so its output is streamed
+        # to the node's log files while it runs
+        results_dir = os.environ.get("COVALENT_DATA_DIR") or get_config("dispatcher.results_dir")
+        node_dir = os.path.join(results_dir, dispatch_id, f"node_{node_id}")
+
         # Run the target function in a separate process
-        fut = proc_pool.submit(io_wrapper, function, args, kwargs, current_workdir)
+        fut = proc_pool.submit(
+            io_wrapper,
+            function,
+            args,
+            kwargs,
+            current_workdir,
+            os.path.join(node_dir, NODE_STDOUT_FILENAME),
+            os.path.join(node_dir, NODE_STDERR_FILENAME),
+        )
 
         output, worker_stdout, worker_stderr, tb = fut.result()
 
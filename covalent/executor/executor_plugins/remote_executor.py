@@ -24,10 +24,14 @@ via SSH or Slurm or by interfacing with compute services in various cloud enviro
 """
 
 import asyncio
+import heapq
+import itertools
+import time
 from abc import abstractmethod
-from typing import Any, Dict, Tuple
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
 
 from covalent._shared_files import logger
+from covalent._shared_files.subprocess_runner import get_subprocess_runner
 from covalent.executor.base import AsyncBaseExecutor
 
 # The plugin class name must be given by the executor_plugin_name attribute:
@@ -38,10 +42,188 @@ log_stack_info = logger.log_stack_info
 
 _EXECUTOR_PLUGIN_DEFAULTS = {
     "poll_freq": 15,
+    "min_poll_freq": 1,
+    "poll_backoff": 2,
     "remote_cache": ".cache/covalent",
     "credentials_file": "",
 }
 
+# Attributes which, where an executor defines them, identify the backend it talks to
+_BACKEND_ATTRIBUTES = (
+    "credentials_file",
+    "profile",
+    "region",
+    "endpoint",
+    "endpoint_url",
+    "hostname",
+    "address",
+    "port",
+    "username",
+)
+
+
+class StatusPoller:
+    """
+    Shared poller which tracks the status of many remote jobs at once.
+
+    Instead of one sleeping coroutine per task, every job handle is
+    registered with a single poller per backend. Whenever handles are due,
+    their statuses are fetched with one batched backend call. Each handle is
+    polled quickly at first and then progressively less often, up to
+    `max_interval`, so that short jobs finish with low latency while long
+    jobs do not hammer the backend. Completions can also be pushed to the
+    poller directly via `notify`.
+
+    A failed status query does not fail the jobs it covered: they are polled
+    again with backoff, and a job only fails after `max_errors` consecutive
+    failed queries, or when `get_statuses` returns an exception as its status.
+
+    Attributes:
+        get_statuses: Coroutine function mapping a list of job handles to a dict of their statuses.
+        is_terminal: Callable returning True if a status means the job has finished.
+        min_interval: Number of seconds to wait before the first poll of a job.
+        max_interval: Maximum number of seconds to wait between two polls of a job.
+        backoff: Factor by which the polling interval of a job grows after each poll.
+        max_errors: Number of consecutive failed status queries after which a job fails.
+    """
+
+    def __init__(
+        self,
+        get_statuses: Callable[[List[Hashable]], Awaitable[Dict[Hashable, Any]]],
+        is_terminal: Callable[[Any], bool],
+        min_interval: float = 1,
+        max_interval: float = 15,
+        backoff: float = 2,
+        max_errors: int = 5,
+    ) -> None:
+        self.get_statuses = get_statuses
+        self.is_terminal = is_terminal
+        self.min_interval = min_interval
+        self.max_interval = max(max_interval, min_interval)
+        self.backoff = backoff
+        self.max_errors = max_errors
+
+        self._futures: Dict[Hashable, asyncio.Future] = {}
+        self._intervals: Dict[Hashable, float] = {}
+        self._errors: Dict[Hashable, int] = {}
+        self._schedule: List[Tuple[float, int, Hashable]] = []
+        self._counter = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self.loop = asyncio.get_running_loop()
+
+    def __len__(self) -> int:
+        return len(self._futures)
+
+    def _schedule_poll(self, job_handle: Hashable, delay: float) -> None:
+        heapq.heappush(self._schedule, (time.monotonic() + delay, next(self._counter), job_handle))
+
+    def watch(self, job_handle: Hashable) -> asyncio.Future:
+        """
+        Start tracking a job
+
+        Arg(s)
+            job_handle: Handle identifying the job on the backend
+
+        Return(s)
+            Future resolving to the terminal status of the job
+        """
+        if job_handle in self._futures:
+            return self._futures[job_handle]
+
+        future = self.loop.create_future()
+        self._futures[job_handle] = future
+        self._intervals[job_handle] = self.min_interval
+        self._schedule_poll(job_handle, self.min_interval)
+
+        if self._task is None or self._task.done():
+            self._task = self.loop.create_task(self._run())
+        self._wakeup.set()
+
+        return future
+
+    def notify(self, job_handle: Hashable, status: Any, error: Optional[Exception] = None) -> None:
+        """
+        Resolve a job from a pushed completion event instead of waiting for the next poll
+
+        Arg(s)
+            job_handle: Handle identifying the job on the backend
+            status: Terminal status of the job
+            error: Exception to raise in the waiting task instead of returning the status
+        """
+        future = self._futures.pop(job_handle, None)
+        self._intervals.pop(job_handle, None)
+        self._errors.pop(job_handle, None)
+        if future is None or future.done():
+            return
+
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(status)
+
+    def _pop_due(self) -> List[Hashable]:
+        # Jobs due shortly are polled early so that they share the batched query
+        now = time.monotonic() + self.min_interval / 2
+        due = []
+        while self._schedule and self._schedule[0][0] <= now:
+            _, _, job_handle = heapq.heappop(self._schedule)
+            if job_handle in self._futures:
+                due.append(job_handle)
+        return due
+
+    def _reschedule(self, job_handle: Hashable) -> None:
+        if job_handle in self._intervals:
+            interval = min(self._intervals[job_handle] * self.backoff, self.max_interval)
+            self._intervals[job_handle] = interval
+            self._schedule_poll(job_handle, interval)
+
+    async def poll(self, job_handles: List[Hashable]) -> None:
+        """
+        Query the status of the given jobs with a single backend call and resolve finished ones
+        """
+        try:
+            statuses = await self.get_statuses(job_handles)
+        except Exception as ex:
+            app_log.warning(f"Failed to poll status of {len(job_handles)} jobs: {ex}")
+            for job_handle in job_handles:
+                errors = self._errors.get(job_handle, 0) + 1
+                if errors >= self.max_errors:
+                    self.notify(job_handle, None, ex)
+                else:
+                    self._errors[job_handle] = errors
+                    self._reschedule(job_handle)
+            return
+
+        for job_handle in job_handles:
+            status = statuses.get(job_handle)
+            if isinstance(status, Exception):
+                self.notify(job_handle, None, status)
+                continue
+
+            self._errors.pop(job_handle, None)
+            if status is not None and self.is_terminal(status):
+                self.notify(job_handle, status)
+            else:
+                self._reschedule(job_handle)
+
+    async def _run(self) -> None:
+        while self._futures:
+            self._wakeup.clear()
+            if due := self._pop_due():
+                await self.poll(due)
+                continue
+
+            timeout = self._schedule[0][0] - time.monotonic() if self._schedule else None
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+
+# Map of poller key -> StatusPoller shared by all executor instances talking to the same backend
+_status_pollers: Dict[Hashable, StatusPoller] = {}
+
 
 class RemoteExecutor(AsyncBaseExecutor):
     """
@@ -51,6 +233,8 @@ class RemoteExecutor(AsyncBaseExecutor):
         poll_freq: Number of seconds to wait between polling for task status after a task has been submitted.
         remote_cache: Location where pickled inputs/outputs are stored.
         credentials_file: Location where credentials can be found.
+        min_poll_freq: Number of seconds to wait before the first status poll of a task when using the shared poller.
+        poll_backoff: Factor by which the polling interval grows, up to `poll_freq`, when using the shared poller.
     """
 
     def __init__(
@@ -58,6 +242,8 @@ class RemoteExecutor(AsyncBaseExecutor):
         poll_freq: int = 15,
         remote_cache: str = "",
         credentials_file: str = "",
+        min_poll_freq: float = 1,
+        poll_backoff: float = 2,
         **kwargs,
     ) -> None:
         super().__init__(**kwargs)
@@ -65,6 +251,8 @@ class RemoteExecutor(AsyncBaseExecutor):
         self.poll_freq = poll_freq
         self.remote_cache = remote_cache
         self.credentials_file = credentials_file
+        self.min_poll_freq = min_poll_freq
+        self.poll_backoff = poll_backoff
 
     @abstractmethod
     async def _validate_credentials(self) -> bool:
@@ -111,6 +299,74 @@ class RemoteExecutor(AsyncBaseExecutor):
         """
         pass
 
+    async def get_statuses(self, job_handles: List[Hashable]) -> Dict[Hashable, Any]:
+        """
+        Return the statuses of many jobs with a single query to the remote backend.
+
+        Subclasses override this, together with `is_terminal_status`, to use the
+        shared poller via `wait_for_completion` instead of a per-task `_poll_task` loop.
+
+        Args:
+            job_handles: Handles of the jobs whose status is requested.
+        Return:
+            Dictionary mapping job handles to their status. Missing handles are polled again later,
+            while a job whose status is an exception fails with it.
+        """
+        raise NotImplementedError
+
+    def is_terminal_status(self, status: Any) -> bool:
+        """
+        Return True if `status`, as returned by `get_statuses`, means the job has finished.
+        """
+        raise NotImplementedError
+
+    def _status_poller_key(self) -> Hashable:
+        """
+        Key identifying the backend this executor talks to; executors sharing a key share a poller.
+
+        Subclasses whose backend is identified by other attributes than `_BACKEND_ATTRIBUTES`
+        override this.
+        """
+        backend = tuple(
+            (name, str(getattr(self, name))) for name in _BACKEND_ATTRIBUTES if hasattr(self, name)
+        )
+        intervals = (self.min_poll_freq, self.poll_freq, self.poll_backoff)
+        return (type(self).__name__, backend, intervals)
+
+    def get_status_poller(self) -> StatusPoller:
+        """
+        Return the shared status poller for this executor's backend, creating it if needed.
+        """
+        key = self._status_poller_key()
+        poller = _status_pollers.get(key)
+        if poller is None or poller.loop is not asyncio.get_running_loop():
+            poller = StatusPoller(
+                self.get_statuses,
+                self.is_terminal_status,
+                min_interval=self.min_poll_freq,
+                max_interval=self.poll_freq,
+                backoff=self.poll_backoff,
+            )
+            _status_pollers[key] = poller
+        return poller
+
+    async def wait_for_completion(self, job_handle: Hashable) -> Any:
+        """
+        Wait until the job identified by `job_handle` reaches a terminal status.
+
+        Args:
+            job_handle: Handle identifying the job on the remote backend.
+        Return:
+            The terminal status of the job.
+        """
+        return await self.get_status_poller().watch(job_handle)
+
+    def notify_completion(self, job_handle: Hashable, status: Any) -> None:
+        """
+        Push the terminal status of a job, e.g. from a backend callback, to the waiting task.
+        """
+        self.get_status_poller().notify(job_handle, status)
+
     @abstractmethod
     async def query_result(self) -> Any:
         """
@@ -125,17 +381,21 @@ class RemoteExecutor(AsyncBaseExecutor):
         pass
 
     @staticmethod
-    async def run_async_subprocess(cmd) -> Tuple:
+    async def run_async_subprocess(
+        cmd, host: str = "", stdout_callback: Optional[Callable[[bytes], None]] = None
+    ) -> Tuple:
         """
         Invokes an async subprocess to run a command.
+
+        Subprocesses are run through the runner shared by the whole process, which bounds the
+        number of concurrent subprocesses overall and per remote `host`. Lines of stdout are
+        passed to `stdout_callback` as soon as they are produced.
         """
 
-        proc = await asyncio.create_subprocess_shell(
-            cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        proc, stdout, stderr = await get_subprocess_runner().run(
+            cmd, host=host, stdout_callback=stdout_callback
         )
 
-        stdout, stderr = await proc.communicate()
-
         if stdout:
             app_log.debug(stdout)
 
@@ -15,6 +15,7 @@
 # limitations under the License.
 
 import asyncio
+import threading
 import time
 from abc import ABC, abstractmethod
 from concurrent.futures import ThreadPoolExecutor
@@ -34,10 +35,14 @@ __all__ = [
     "BaseProcessPoolQExecutor",
     "AsyncBaseQExecutor",
     "BaseThreadPoolQExecutor",
+    "BatchedBaseQExecutor",
 ]
 
 SHOTS_DEFAULT = -1
 
+# PennyLane devices constructed so far, per thread
+_thread_devices = threading.local()
+
 
 def orjson_dumps(v, *, default):
     return orjson.dumps(v, default=default).decode()  # pylint: disable=no-member
@@ -53,6 +58,78 @@ def get_thread_pool(max_workers=None):
     return ThreadPoolExecutor(max_workers=max_workers)
 
 
+def get_device(device_name: str, wires: int, shots) -> qml.Device:
+    """
+    Returns a PennyLane device with the given settings, constructing it only the first
+    time it is requested. Devices hold execution state, so every thread (and process)
+    gets its own instances.
+    """
+    devices = _thread_devices.__dict__.setdefault("devices", {})
+    key = (device_name, wires, repr(shots))
+    if key not in devices:
+        devices[key] = qml.device(device_name, wires=wires, shots=shots)
+    return devices[key]
+
+
+def get_structure_key(qscript) -> Optional[tuple]:
+    """
+    Returns a key that is equal for circuits which differ only in their gate
+    parameters, or `None` if the circuit cannot be batched with others.
+    """
+    if qscript.batch_size is not None or not qscript.get_parameters(trainable_only=False):
+        return None
+
+    try:
+        operations = tuple(
+            (
+                op.name,
+                tuple(op.wires.tolist()),
+                repr(op.hyperparameters),
+                tuple(qml.math.shape(datum) for datum in op.data),
+            )
+            for op in qscript.operations
+        )
+
+        # Measurements are not broadcast, so their observables must match exactly.
+        measurements = tuple(
+            (
+                repr(m),
+                m.return_type,
+                None
+                if m.obs is None
+                else tuple(qml.math.to_numpy(datum).tobytes() for datum in m.obs.data),
+            )
+            for m in qscript.measurements
+        )
+    except Exception:  # pylint: disable=broad-except
+        return None
+
+    return operations, measurements
+
+
+def broadcast_circuits(qscripts_list):
+    """
+    Combine structurally identical circuits into a single circuit whose gate
+    parameters are broadcast over the circuits, in order.
+    """
+    params = zip(*(qscript.get_parameters(trainable_only=False) for qscript in qscripts_list))
+
+    broadcast_qscript = qscripts_list[0].copy(copy_operations=True)
+    broadcast_qscript.set_parameters(
+        [qml.math.stack(datum) for datum in params], trainable_only=False
+    )
+    return broadcast_qscript
+
+
+def split_broadcast_result(result, batch_size: int) -> list:
+    """
+    Split the result of a broadcast circuit into the results of each circuit.
+    """
+    if isinstance(result, tuple):
+        return list(zip(*(split_broadcast_result(r, batch_size) for r in result)))
+    return [result[i, ...] for i in range(batch_size)]
+
+
 @lru_cache
 def get_asyncio_event_loop():
     """
@@ -82,6 +159,10 @@ class BaseQExecutor(ABC, BaseModel):
     shots_converter: Optional[type] = None
     persist_data: bool = True
 
+    # Whether the QServer may return cached results for circuits this executor
+    # has already run. `None` defers to `use_result_cache`'s default.
+    cache_results: Optional[bool] = None
+
     # Executors need to contain certain information about original QNode, in order
     # to produce correct results. These attributes below contain that information.
     # They are set inside the `QServer` and will be `None` client-side.
@@ -109,6 +190,14 @@ class BaseQExecutor(ABC, BaseModel):
         # User has specified `shots` as an int.
         return self.shots
 
+    @property
+    def use_result_cache(self) -> bool:
+        """
+        Whether results of identical circuits may be served from the QServer's cache.
+        Disabled unless requested, since results are generally not deterministic.
+        """
+        return bool(self.cache_results)
+
     class Config:
         extra = Extra.allow
 
@@ -127,6 +216,24 @@ class BaseQExecutor(ABC, BaseModel):
     def batch_get_results(self, futures_list):
         raise NotImplementedError
 
+    def get_device_args(self) -> tuple:
+        """
+        Device name, wires and shots used to construct this executor's devices.
+        """
+        return (
+            self.device,
+            self.qelectron_info.device_wires,
+            self.qelectron_info.device_shots,
+        )
+
+    def run_circuit_on_cached_device(
+        self, qscript, device_args: tuple, result_obj: "QCResult"
+    ) -> "QCResult":
+        """
+        Run `qscript` on the calling thread's device for `device_args`.
+        """
+        return self.run_circuit(qscript, get_device(*device_args), result_obj)
+
     def run_circuit(self, qscript, device, result_obj: "QCResult") -> "QCResult":
         start_time = time.perf_counter()
         results = qml.execute([qscript], device, gradient_fn="best")
@@ -209,18 +316,24 @@ class QCResult(BaseModel):
 class SyncBaseQExecutor(BaseQExecutor):
     device: Optional[str] = "default.qubit"
 
-    def run_all_circuits(self, qscripts_list) -> List[QCResult]:
-        result_objs: List[QCResult] = []
+    def execute_circuits(self, qscripts_list, device) -> list:
+        """
+        Execute all circuits in one call, which uses the device's `batch_execute`.
+        """
+        return qml.execute(list(qscripts_list), device, gradient_fn="best")
 
-        for qscript in qscripts_list:
-            dev = qml.device(
-                self.device,
-                wires=self.qelectron_info.device_wires,
-                shots=self.qelectron_info.device_shots,
-            )
+    def run_all_circuits(self, qscripts_list, device_args=None) -> List[QCResult]:
+        dev = get_device(*(device_args or self.get_device_args()))
 
+        start_time = time.perf_counter()
+        results = self.execute_circuits(qscripts_list, dev)
+        end_time = time.perf_counter()
+
+        result_objs: List[QCResult] = []
+        for result in results:
             result_obj = QCResult.with_metadata(device_name=dev.short_name, executor=self)
-            result_obj = self.run_circuit(qscript, dev, result_obj)
+            result_obj.results = [result]
+            result_obj.execution_time = (end_time - start_time) / len(results)
             result_objs.append(result_obj)
 
         return result_objs
@@ -229,12 +342,59 @@ class SyncBaseQExecutor(BaseQExecutor):
         # Offload execution of all circuits to the same thread
         # so that the qserver isn't blocked by their completion.
         pool = get_thread_pool()
-        fut = pool.submit(self.run_all_circuits, qscripts_list)
+        fut = pool.submit(self.run_all_circuits, qscripts_list, self.get_device_args())
         dummy_futures = [fut] * len(qscripts_list)
         return dummy_futures
 
     def batch_get_results(self, futures_list):
-        return futures_list[0].result()
+        return next(iter(futures_list)).result()
+
+
+class BatchedBaseQExecutor(SyncBaseQExecutor):
+    """
+    Executor that runs circuits which differ only in their gate parameters, e.g. the
+    shifted circuits of a parameter-shift gradient, as a single broadcast circuit.
+    """
+
+    def execute_circuits(self, qscripts_list, device) -> list:
+        if device.shot_vector is not None:
+            # Broadcast results are not split by shot vectors.
+            return super().execute_circuits(qscripts_list, device)
+
+        qscripts_list = list(qscripts_list)
+
+        # Group circuits by structure, keeping circuits that can't be grouped separate.
+        groups: Dict[Any, List[int]] = {}
+        for i, qscript in enumerate(qscripts_list):
+            key = get_structure_key(qscript)
+            groups.setdefault(i if key is None else key, []).append(i)
+
+        indices = list(groups.values())
+        batch = [
+            broadcast_circuits([qscripts_list[i] for i in group])
+            if len(group) > 1
+            else qscripts_list[group[0]]
+            for group in indices
+        ]
+
+        try:
+            batch_results = qml.execute(batch, device, gradient_fn="best")
+        except Exception:  # pylint: disable=broad-except
+            # Fall back to running circuits separately, e.g. if
+            # an operation does not support parameter broadcasting.
+            return super().execute_circuits(qscripts_list, device)
+
+        results = [None] * len(qscripts_list)
+        for group, result in zip(indices, batch_results):
+            if len(group) > 1:
+                group_results = split_broadcast_result(result, len(group))
+            else:
+                group_results = [result]
+
+            for i, group_result in zip(group, group_results):
+                results[i] = group_result
+
+        return results
 
 
 class AsyncBaseQExecutor(BaseQExecutor):
@@ -247,13 +407,8 @@ class AsyncBaseQExecutor(BaseQExecutor):
     def batch_submit(self, qscripts_list):
         futures = []
         loop = get_asyncio_event_loop()
+        dev = get_device(*self.get_device_args())
         for qscript in qscripts_list:
-            dev = qml.device(
-                self.device,
-                wires=self.qelectron_info.device_wires,
-                shots=self.qelectron_info.device_shots,
-            )
-
             result_obj = QCResult.with_metadata(
                 device_name=dev.short_name,
                 executor=self,
@@ -290,19 +445,19 @@ class BaseProcessPoolQExecutor(BaseQExecutor):
     def batch_submit(self, qscripts_list):
         pool = get_process_pool(self.num_processes)
 
+        # Devices are constructed, and reused, in the worker processes.
+        device_args = self.get_device_args()
+        device_name = get_device(*device_args).short_name
+
         futures = []
         for qscript in qscripts_list:
-            dev = qml.device(
-                self.device,
-                wires=self.qelectron_info.device_wires,
-                shots=self.qelectron_info.device_shots,
-            )
-
             result_obj = QCResult.with_metadata(
-                device_name=dev.short_name,
+                device_name=device_name,
                 executor=self,
             )
-            fut = pool.apply_async(self.run_circuit, args=(qscript, dev, result_obj))
+            fut = pool.apply_async(
+                self.run_circuit_on_cached_device, args=(qscript, device_args, result_obj)
+            )
             futures.append(fut)
 
         return futures
@@ -318,19 +473,17 @@ class BaseThreadPoolQExecutor(BaseQExecutor):
     def batch_submit(self, qscripts_list):
         pool = get_thread_pool(self.num_threads)
 
+        # Devices are constructed, and reused, in the worker threads.
+        device_args = self.get_device_args()
+        device_name = get_device(*device_args).short_name
+
         futures = []
         for qscript in qscripts_list:
-            dev = qml.device(
-                self.device,
-                wires=self.qelectron_info.device_wires,
-                shots=self.qelectron_info.device_shots,
-            )
-
             result_obj = QCResult.with_metadata(
-                device_name=dev.short_name,
+                device_name=device_name,
                 executor=self,
             )
-            fut = pool.submit(self.run_circuit, qscript, dev, result_obj)
+            fut = pool.submit(self.run_circuit_on_cached_device, qscript, device_args, result_obj)
             futures.append(fut)
 
         return futures
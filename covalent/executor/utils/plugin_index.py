@@ -0,0 +1,219 @@
+# Copyright 2023 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Persisted index of executor plugins which lets plugin modules be imported on first use."""
+
+import glob
+import hashlib
+import importlib
+import importlib.util
+import json
+import os
+import sys
+import threading
+from collections.abc import MutableMapping
+from importlib import metadata
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+from ..._shared_files import logger
+
+app_log = logger.app_log
+
+INDEX_VERSION = 1
+
+# Installing, upgrading or removing a distribution changes the mtime of these directories
+_SITE_DIRS = ("site-packages", "dist-packages")
+
+
+class PluginSpec(NamedTuple):
+    """
+    Location of an executor plugin class
+
+    Attributes:
+        name: Short name of the executor, e.g. "local".
+        class_name: Name of the executor class in its module.
+        module: Name of the module defining the executor class.
+        path: Path to the module file for plugins loaded from a directory,
+            None for plugins installed as a distribution.
+        defaults: Default config parameters of the executor, if any.
+    """
+
+    name: str
+    class_name: str
+    module: str
+    path: Optional[str] = None
+    defaults: Optional[Dict[str, Any]] = None
+
+    def load(self) -> type:
+        """Import the plugin module and return the executor class"""
+
+        if self.path:
+            module_spec = importlib.util.spec_from_file_location(self.module, self.path)
+            the_module = importlib.util.module_from_spec(module_spec)
+            module_spec.loader.exec_module(the_module)
+        else:
+            the_module = importlib.import_module(self.module)
+
+        return getattr(the_module, self.class_name)
+
+
+class LazyPluginMap(MutableMapping):
+    """
+    Mapping of executor names to executor classes.
+
+    Values may be `PluginSpec` objects, which are loaded and replaced by the
+    executor class the first time they are looked up.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        self._plugins = dict(*args, **kwargs)
+        self._lock = threading.Lock()
+
+    def __getitem__(self, name: str) -> type:
+        plugin = self._plugins[name]
+        if isinstance(plugin, PluginSpec):
+            with self._lock:
+                plugin = self._plugins[name]
+                if isinstance(plugin, PluginSpec):
+                    app_log.debug(f"Loading executor plugin {name} from {plugin.module}")
+                    plugin = self._plugins[name] = plugin.load()
+        return plugin
+
+    def __setitem__(self, name: str, plugin: Any) -> None:
+        self._plugins[name] = plugin
+
+    def __delitem__(self, name: str) -> None:
+        del self._plugins[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._plugins)
+
+    def __len__(self) -> int:
+        return len(self._plugins)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._plugins!r})"
+
+    def find(self, class_name: str) -> Optional[str]:
+        """Return the name of the executor whose class is `class_name`, without loading any plugin"""
+
+        for name, plugin in self._plugins.items():
+            if isinstance(plugin, PluginSpec):
+                if plugin.class_name == class_name:
+                    return name
+            elif getattr(plugin, "__name__", None) == class_name:
+                return name
+        return None
+
+
+def iter_entry_points(group: str) -> Iterable[metadata.EntryPoint]:
+    """Return the entry points of installed distributions in `group`"""
+
+    entry_points = metadata.entry_points()
+    if hasattr(entry_points, "select"):
+        return entry_points.select(group=group)
+    # Python < 3.10 returns a dictionary of groups
+    return entry_points.get(group, [])
+
+
+def get_plugins_fingerprint(plugin_dirs: List[str]) -> str:
+    """
+    Return a hash of everything the list of executor plugins depends on.
+
+    These are the interpreter, the modification times of the directories
+    distributions are installed to, and the plugin modules in `plugin_dirs`.
+
+    Args:
+        plugin_dirs: Directories searched for executor plugin modules.
+
+    Returns:
+        Hex digest which changes whenever the list of plugins may have changed.
+    """
+
+    stamps = [f"{INDEX_VERSION}", sys.executable]
+
+    site_dirs = [path for path in sys.path if os.path.basename(path) in _SITE_DIRS]
+    for path in site_dirs + plugin_dirs:
+        try:
+            stamps.append(f"{path}:{os.stat(path).st_mtime_ns}")
+        except OSError:
+            continue
+
+    for plugin_dir in plugin_dirs:
+        for module_file in sorted(glob.glob(os.path.join(plugin_dir, "*.py"))):
+            stamps.append(f"{module_file}:{os.stat(module_file).st_mtime_ns}")
+
+    return hashlib.sha256("\n".join(stamps).encode()).hexdigest()
+
+
+def read_plugin_index(index_path: str, fingerprint: str) -> Optional[List[PluginSpec]]:
+    """
+    Read the plugin index written by `write_plugin_index`
+
+    Args:
+        index_path: Path to the index file.
+        fingerprint: Current fingerprint of the plugins.
+
+    Returns:
+        The indexed plugins, or None if there is no index or it is out of date.
+    """
+
+    try:
+        with open(index_path, "r") as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if index.get("fingerprint") != fingerprint:
+        return None
+
+    try:
+        return [PluginSpec(**plugin) for plugin in index["plugins"]]
+    except (KeyError, TypeError):
+        return None
+
+
+def write_plugin_index(index_path: str, fingerprint: str, plugins: Iterable[PluginSpec]) -> None:
+    """
+    Persist the plugin index, replacing any existing index atomically.
+
+    The index is not written if the default parameters of a plugin cannot be
+    serialized, in which case plugins are discovered again by the next process.
+
+    Args:
+        index_path: Path to the index file.
+        fingerprint: Fingerprint of the plugins the index was built from.
+        plugins: The discovered plugins.
+    """
+
+    index = {"fingerprint": fingerprint, "plugins": [plugin._asdict() for plugin in plugins]}
+
+    try:
+        contents = json.dumps(index)
+    except (TypeError, ValueError) as e:
+        app_log.debug(f"Not writing executor plugin index: {e}")
+        return
+
+    tmp_path = f"{index_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(index_path), exist_ok=True)
+        with open(tmp_path, "w") as f:
+            f.write(contents)
+        os.replace(tmp_path, index_path)
+    except OSError as e:
+        app_log.debug(f"Could not write executor plugin index {index_path}: {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
@@ -20,11 +20,19 @@ Helper functions for the local executor
 
 import io
 import os
+import tempfile
 import traceback
 from contextlib import redirect_stderr, redirect_stdout
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Output of a task is kept in memory up to this many bytes per stream and
+# spooled to a temporary file on the worker beyond that. At most this many
+# trailing bytes of each stream are returned to the executor.
+STREAM_SPOOL_SIZE = 1024 * 1024
+
+TRUNCATION_MARKER = "[... {} bytes of output truncated ...]\n"
 
 
 class Signals(Enum):
@@ -37,15 +45,78 @@ class Signals(Enum):
     EXIT = 2
 
 
+class SpooledStream(io.TextIOBase):
+    """
+    Text stream which keeps its contents in memory until `spool_size` bytes
+    have been written and in a temporary file afterwards.
+
+    When `log_path` is given, every write is also appended to that file as it
+    happens so that the output can be followed while the task is running.
+    """
+
+    def __init__(
+        self, spool_size: int = STREAM_SPOOL_SIZE, log_path: Optional[str] = None
+    ) -> None:
+        super().__init__()
+        self._buffer = tempfile.SpooledTemporaryFile(max_size=spool_size, mode="w+b")
+        self._log = None
+        if log_path:
+            Path(log_path).parent.mkdir(parents=True, exist_ok=True)
+            self._log = open(log_path, "wb")
+        self.bytes_written = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, s: str) -> int:
+        data = s.encode("utf-8", errors="replace")
+        self._buffer.write(data)
+        if self._log is not None:
+            self._log.write(data)
+            self._log.flush()
+        self.bytes_written += len(data)
+        return len(s)
+
+    def getvalue(self, max_bytes: Optional[int] = None) -> str:
+        """Return what was written to the stream
+
+        If `max_bytes` is given, only the last `max_bytes` bytes are read back
+        and prefixed with a marker stating how many bytes were left out."""
+        skipped = 0
+        if max_bytes is not None:
+            skipped = max(self.bytes_written - max_bytes, 0)
+        self._buffer.seek(skipped)
+        data = self._buffer.read().decode("utf-8", errors="replace")
+        self._buffer.seek(0, os.SEEK_END)
+        if skipped:
+            data = TRUNCATION_MARKER.format(skipped) + data
+        return data
+
+    def close(self) -> None:
+        self._buffer.close()
+        if self._log is not None:
+            self._log.close()
+        super().close()
+
+
 def io_wrapper(
     fn: Callable,
     args: List,
     kwargs: Dict,
     workdir: str = ".",
+    stdout_path: Optional[str] = None,
+    stderr_path: Optional[str] = None,
 ) -> Tuple[Any, str, str, str]:
     """Wrapper function to execute the given function in a separate
-    process and capture stdout and stderr"""
-    with redirect_stdout(io.StringIO()) as stdout, redirect_stderr(io.StringIO()) as stderr:
+    process and capture stdout and stderr
+
+    Output is spooled to disk on the worker so that chatty tasks do not
+    exhaust its memory while they run, and only the last `STREAM_SPOOL_SIZE`
+    bytes of each stream are returned. If `stdout_path` and `stderr_path` are
+    given, the full output is appended to these files as it is produced."""
+    stdout_stream = SpooledStream(log_path=stdout_path)
+    stderr_stream = SpooledStream(log_path=stderr_path)
+    with redirect_stdout(stdout_stream) as stdout, redirect_stderr(stderr_stream) as stderr:
         try:
             Path(workdir).mkdir(parents=True, exist_ok=True)
             current_dir = os.getcwd()
@@ -57,4 +128,14 @@ def io_wrapper(
             tb = "".join(traceback.TracebackException.from_exception(ex).format())
         finally:
             os.chdir(current_dir)
-    return output, stdout.getvalue(), stderr.getvalue(), tb
+
+    try:
+        return (
+            output,
+            stdout.getvalue(STREAM_SPOOL_SIZE),
+            stderr.getvalue(STREAM_SPOOL_SIZE),
+            tb,
+        )
+    finally:
+        stdout.close()
+        stderr.close()
@@ -14,6 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 from abc import ABC, abstractmethod, abstractproperty
 
 
@@ -26,6 +27,12 @@ class BaseQClient(ABC):
     def get_results(self, batch_id):
         raise NotImplementedError
 
+    async def get_results_async(self, batch_id):
+        # Clients without a native async implementation
+        # wait for the results in a separate thread.
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.get_results, batch_id)
+
     @abstractproperty
     def selector(self):
         raise NotImplementedError
@@ -64,5 +64,8 @@ class MiddleWare:
     def get_results(self, batch_id):
         return self.qclient.get_results(batch_id)
 
+    async def get_results_async(self, batch_id):
+        return await self.qclient.get_results_async(batch_id)
+
 
 middleware = MiddleWare()
@@ -52,6 +52,10 @@ class LocalQClient(BaseQClient):
         ser_results = self.qserver.get_results(batch_id)
         return self.deserialize(ser_results)
 
+    async def get_results_async(self, batch_id):
+        ser_results = await self.qserver.get_results_async(batch_id)
+        return self.deserialize(ser_results)
+
     def serialize(self, obj):
         return cloudpickle_serialize(obj)
 
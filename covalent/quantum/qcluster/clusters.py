@@ -32,10 +32,12 @@ class QCluster(AsyncBaseQCluster):
 
     Args:
         executors: A sequence of quantum executors.
-        selector: A callable that selects an executor, or one of the strings "cyclic"
-            or "random". The "cyclic" selector (default) cycles through `executors`
+        selector: A callable that selects an executor, or one of the strings "cyclic",
+            "random" or "balanced". The "cyclic" selector (default) cycles through `executors`
             and returns the next executor for each circuit. The "random" selector
-            chooses an executor from `executors` at random for each circuit. Any
+            chooses an executor from `executors` at random for each circuit. The
+            "balanced" selector splits circuits across `executors` according to their
+            current load and recent execution times. Any
             user-defined selector must be callable with two positional arguments,
             a circuit and a list of executors. A selector must also return exactly
             one executor.
@@ -17,8 +17,10 @@
 # pylint: disable=too-few-public-methods
 
 import random
+from typing import List, Optional, Sequence
 
 from .base import BaseQSelector
+from .load_tracker import executor_load
 
 
 class RandomSelector(BaseQSelector):
@@ -47,7 +49,72 @@ class CyclicSelector(BaseQSelector):
         return executor
 
 
+class BalancedSelector(BaseQSelector):
+    """
+    A selector that spreads circuits across executors to minimize the time until
+    all of them finish, based on the circuits already in flight on each executor
+    and the recent execution times of its circuits.
+
+    Batches are split across executors in proportion to their throughput.
+    Optionally, `costs` (one relative cost per circuit for each executor) are
+    traded off against estimated completion times with weight `cost_weight`.
+    """
+
+    name: str = "balanced"
+
+    percentile: float = 50
+    costs: Optional[Sequence[float]] = None
+    cost_weight: float = 0.0
+
+    # Execution time assumed for executors that have not run any circuits yet.
+    default_latency: float = 1.0
+
+    def selector_function(self, qscript, executors):
+        return self.select_batch([qscript], executors)[0]
+
+    @staticmethod
+    def _concurrency(executor) -> int:
+        if getattr(executor, "parallel", None) in ("thread", "process"):
+            return max(getattr(executor, "workers", 1), 1)
+        return max(getattr(executor, "num_threads", getattr(executor, "num_processes", 1)), 1)
+
+    def select_batch(self, qscripts, executors) -> List:
+        """
+        Select an executor for each of `qscripts` at once.
+        """
+        if self.costs is not None and len(self.costs) != len(executors):
+            raise ValueError(
+                f"Expected one cost per executor, got {len(self.costs)} costs "
+                f"for {len(executors)} executors"
+            )
+
+        latencies = [executor_load.latency(ex, self.percentile) for ex in executors]
+        known = [t for t in latencies if t is not None]
+        fallback = sum(known) / len(known) if known else self.default_latency
+
+        service_times = [
+            (fallback if t is None else t) / self._concurrency(ex)
+            for ex, t in zip(executors, latencies)
+        ]
+        loads = [executor_load.in_flight(ex) for ex in executors]
+        costs = [0.0] * len(executors) if self.costs is None else self.costs
+
+        selected = []
+        for _ in qscripts:
+            # Greedily assign to the executor that would finish this circuit first.
+            scores = [
+                (load + 1) * service_time + self.cost_weight * cost
+                for load, service_time, cost in zip(loads, service_times, costs)
+            ]
+            i = scores.index(min(scores))
+            loads[i] += 1
+            selected.append(executors[i])
+
+        return selected
+
+
 selector_map = {
+    "balanced": BalancedSelector,
     "cyclic": CyclicSelector,
     "random": RandomSelector,
 }
@@ -0,0 +1,104 @@
+# Copyright 2023 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Live load information about quantum executors, used by load-aware selectors.
+"""
+
+import threading
+from collections import Counter, deque
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+
+from ...executor.qbase import BaseQExecutor
+
+# Number of recent circuit execution times kept per executor
+LATENCY_WINDOW = 100
+
+# Server-set attributes that do not identify an executor
+_EXCLUDED_FIELDS = ("qelectron_info", "qnode_specs")
+
+
+def get_executor_key(executor: BaseQExecutor) -> str:
+    """
+    Return a key that identifies executors with the same settings.
+    """
+    fields = executor.dict()
+    settings = [(name, fields[name]) for name in sorted(fields) if name not in _EXCLUDED_FIELDS]
+    return repr((executor.__class__.__name__, settings))
+
+
+class ExecutorLoadTracker:
+    """
+    Tracks the circuits in flight on each executor and their recent execution times.
+
+    Attributes:
+        window: Number of recent execution times kept per executor.
+    """
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self.window = window
+
+        self._in_flight = Counter()
+        self._latencies: Dict[str, deque] = {}
+        self._lock = threading.Lock()
+
+    def add_in_flight(self, executor: BaseQExecutor, num_circuits: int) -> None:
+        """Record `num_circuits` circuits submitted to `executor`."""
+        key = get_executor_key(executor)
+        with self._lock:
+            self._in_flight[key] += num_circuits
+
+    def remove_in_flight(self, executor: BaseQExecutor, num_circuits: int) -> None:
+        """Record `num_circuits` circuits whose results were retrieved from `executor`."""
+        key = get_executor_key(executor)
+        with self._lock:
+            self._in_flight[key] = max(self._in_flight[key] - num_circuits, 0)
+
+    def record_latencies(self, executor: BaseQExecutor, latencies: Iterable[float]) -> None:
+        """Record execution times, in seconds, of circuits run by `executor`."""
+        key = get_executor_key(executor)
+        with self._lock:
+            history = self._latencies.setdefault(key, deque(maxlen=self.window))
+            history.extend(t for t in latencies if t is not None)
+
+    def in_flight(self, executor: BaseQExecutor) -> int:
+        """Number of circuits submitted to `executor` whose results were not retrieved yet."""
+        with self._lock:
+            return self._in_flight[get_executor_key(executor)]
+
+    def latency(self, executor: BaseQExecutor, percentile: float = 50) -> Optional[float]:
+        """
+        Percentile of the recent execution times of circuits on `executor`, in seconds,
+        or None if it has not run any circuits yet.
+        """
+        with self._lock:
+            history = list(self._latencies.get(get_executor_key(executor), ()))
+        return float(np.percentile(history, percentile)) if history else None
+
+    def stats(self, executor: BaseQExecutor) -> Dict[str, Optional[float]]:
+        """Summary of the load on `executor`."""
+        return {
+            "in_flight": self.in_flight(executor),
+            "p50": self.latency(executor, 50),
+            "p90": self.latency(executor, 90),
+            "p99": self.latency(executor, 99),
+        }
+
+
+executor_load = ExecutorLoadTracker()
@@ -14,6 +14,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import threading
+from functools import lru_cache
 from typing import Union
 
 from pydantic import validator
@@ -22,9 +24,13 @@ from ...executor.qbase import (
     BaseProcessPoolQExecutor,
     BaseQExecutor,
     BaseThreadPoolQExecutor,
+    BatchedBaseQExecutor,
     SyncBaseQExecutor,
 )
 
+# Guards the settings copied into shared backends until their circuits are submitted
+_backend_lock = threading.Lock()
+
 SIMULATOR_DEVICES = [
     "default.qubit",
     "default.qubit.autograd",
@@ -36,6 +42,20 @@ SIMULATOR_DEVICES = [
 ]
 
 
+@lru_cache
+def get_simulator_backend(parallel: Union[bool, str], workers: int, device: str) -> BaseQExecutor:
+    """
+    Returns the backend executor for the given settings, reused across calls.
+    """
+    if parallel == "process":
+        return BaseProcessPoolQExecutor(num_processes=workers, device=device)
+    if parallel == "thread":
+        return BaseThreadPoolQExecutor(num_threads=workers, device=device)
+    if parallel == "batched":
+        return BatchedBaseQExecutor(device=device)
+    return SyncBaseQExecutor(device=device)
+
+
 class Simulator(BaseQExecutor):
     """
     A quantum executor that uses the specified Pennylane device to execute circuits.
@@ -47,14 +67,19 @@ class Simulator(BaseQExecutor):
             devices (e.g. "default.qubit" and "lightning.qubit") are recommended.
             Defaults to "default.qubit" or "default.gaussian" depending on the
             decorated QNode's device.
-        parallel: The type of parallelism to use. Valid values are "thread" and
-            "process". Passing any other value will result in synchronous execution.
-            Defaults to "thread".
+        parallel: The type of parallelism to use. Valid values are "thread",
+            "process" and "batched". The "batched" mode runs circuits that differ
+            only in their gate parameters, such as those of parameter-shift
+            gradients, as a single broadcast circuit. Passing any other value will
+            result in synchronous execution. Defaults to "thread".
         workers: The number of threads or processes to use. Defaults to 10.
         shots: The number of shots to use for the execution device. Overrides the
             :code:`shots` value from the original device if set to :code:`None` or
             a positive :code:`int`. The shots setting from the original device is
             is used by default.
+        cache_results: Whether to reuse results of identical circuits run before.
+            Defaults to :code:`True` for analytic (:code:`shots=None`) simulations,
+            which are deterministic, and :code:`False` otherwise.
     """
 
     device: str = "default.qubit"
@@ -71,6 +96,12 @@ class Simulator(BaseQExecutor):
             raise ValueError(f"Simulator device must be {valid_devices}.")
         return device
 
+    @property
+    def use_result_cache(self) -> bool:
+        if self.cache_results is None:
+            return self.override_shots is None
+        return self.cache_results
+
     def batch_submit(self, qscripts_list):
         # Defer to original QNode's device type in special cases.
         if self.qelectron_info.device_name in ["default.gaussian"]:
@@ -79,19 +110,15 @@ class Simulator(BaseQExecutor):
             device = self.device
 
         # Select backend batching the chosen method of parallelism.
-        if self.parallel == "process":
-            self._backend = BaseProcessPoolQExecutor(num_processes=self.workers, device=device)
-        elif self.parallel == "thread":
-            self._backend = BaseThreadPoolQExecutor(num_threads=self.workers, device=device)
-        else:
-            self._backend = SyncBaseQExecutor(device=device)
+        self._backend = get_simulator_backend(self.parallel, self.workers, device)
 
         # Pass on server-set settings from original device.
         updates = {"device_name": device, "device_shots": self.override_shots}
-        self._backend.qelectron_info = self.qelectron_info.copy(update=updates)
-        self._backend.qnode_specs = self.qnode_specs.copy()
+        with _backend_lock:
+            self._backend.qelectron_info = self.qelectron_info.copy(update=updates)
+            self._backend.qnode_specs = self.qnode_specs.copy()
 
-        return self._backend.batch_submit(qscripts_list)
+            return self._backend.batch_submit(qscripts_list)
 
     def batch_get_results(self, futures_list):
         return self._backend.batch_get_results(futures_list)
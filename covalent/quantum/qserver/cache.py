@@ -0,0 +1,180 @@
+# Copyright 2023 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Cache for results of previously executed quantum circuits.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+import numpy as np
+import pennylane as qml
+from pennylane.tape import QuantumScript
+
+from ...executor.qbase import BaseQExecutor, QCResult
+
+# Bump whenever the contents of the hash change, to invalidate persisted entries
+_HASH_VERSION = "1"
+
+# Maximum number of results kept in memory
+DEFAULT_CACHE_SIZE = 1024
+
+
+class UnhashableCircuitError(Exception):
+    """Raised when a circuit cannot be hashed reliably."""
+
+
+def _update_with_data(hasher, data) -> None:
+    for datum in qml.math.unwrap(data):
+        array = np.asarray(datum)
+        if array.dtype == object:
+            raise UnhashableCircuitError(f"Cannot hash parameter {datum!r}")
+
+        hasher.update(f"{array.dtype}{array.shape}".encode())
+        hasher.update(array.tobytes())
+
+
+def _update_with_operator(hasher, op) -> None:
+    hyperparameters = repr(op.hyperparameters)
+    if " at 0x" in hyperparameters:
+        # Default reprs contain addresses which may be reused by different objects
+        raise UnhashableCircuitError(f"Cannot hash hyperparameters of {op.name}")
+
+    hasher.update(f"{op.name}|{op.wires.tolist()}|{hyperparameters}".encode())
+    _update_with_data(hasher, op.data)
+
+
+def get_circuit_hash(qscript: QuantumScript, executor: BaseQExecutor) -> Optional[str]:
+    """
+    Compute a canonical hash of a circuit together with the settings of the
+    executor that affect its results.
+
+    Args:
+        qscript: The circuit to hash.
+        executor: The executor that runs the circuit. Its `qelectron_info` must be set.
+
+    Returns:
+        Hex digest of the hash, or None if the circuit cannot be hashed reliably.
+    """
+    qelectron_info = executor.qelectron_info
+    hasher = hashlib.sha256(
+        "|".join(
+            [
+                _HASH_VERSION,
+                executor.__class__.__name__,
+                str(getattr(executor, "device", qelectron_info.device_name)),
+                str(qelectron_info.device_wires),
+                str(executor.override_shots),
+            ]
+        ).encode()
+    )
+
+    try:
+        for op in qscript.operations:
+            _update_with_operator(hasher, op)
+
+        for measurement in qscript.measurements:
+            hasher.update(f"{measurement!r}|{measurement.return_type}".encode())
+            if measurement.obs is not None:
+                _update_with_data(hasher, measurement.obs.data)
+
+    except Exception:  # pylint: disable=broad-except
+        return None
+
+    return hasher.hexdigest()
+
+
+class CachedResults:
+    """
+    Stands in for an executor in the `FuturesTable` to return results that
+    were served from the cache.
+    """
+
+    def __init__(self, persist_data: bool = True):
+        self.persist_data = persist_data
+
+    def batch_get_results(self, futures_list) -> List[QCResult]:
+        return list(futures_list)
+
+
+class ResultCache:
+    """
+    LRU cache of circuit results, with an optional persistent tier
+    in the QElectron database.
+    """
+
+    def __init__(self, database=None, max_size: int = DEFAULT_CACHE_SIZE):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+        self._database = database
+        self._results: Dict[str, QCResult] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Number of cache hits and misses so far."""
+        return {"hits": self.hits, "misses": self.misses}
+
+    def _put(self, key: str, result_obj: QCResult) -> None:
+        with self._lock:
+            self._results[key] = result_obj
+            self._results.move_to_end(key)
+            while len(self._results) > self.max_size:
+                self._results.popitem(last=False)
+
+    def get(self, key: str) -> Optional[QCResult]:
+        """
+        Return the cached result for `key`, if any.
+        """
+        with self._lock:
+            result_obj = self._results.get(key)
+            if result_obj is not None:
+                self._results.move_to_end(key)
+
+        if result_obj is None and self._database is not None:
+            result_obj = self._database.get_cached_result(key)
+            if result_obj is not None:
+                self._put(key, result_obj)
+
+        if result_obj is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+
+        return result_obj
+
+    def set(self, key: str, result_obj: QCResult) -> None:
+        """
+        Store the result for `key`.
+        """
+        self.set_many({key: result_obj})
+
+    def set_many(self, result_objs: Dict[str, QCResult]) -> None:
+        """
+        Store results by key, persisting them in a single transaction.
+        """
+        result_objs = {key: obj.copy(deep=True) for key, obj in result_objs.items()}
+        for key, result_obj in result_objs.items():
+            self._put(key, result_obj)
+
+        if self._database is not None and result_objs:
+            self._database.set_cached_results(result_objs)
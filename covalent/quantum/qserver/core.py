@@ -18,10 +18,11 @@
 Quantum Server Implementation: Handles the async execution of quantum circuits.
 """
 
+import asyncio
 import datetime
 import uuid
 from asyncio import Task
-from typing import Callable, List, Tuple
+from typing import Any, Callable, Dict, List, Tuple
 
 from pennylane.tape import QuantumScript
 
@@ -31,8 +32,11 @@ from ..._shared_files.utils import (
     cloudpickle_serialize,
     select_first_executor,
 )
+from ...executor.qbase import QCResult
 from ...executor.utils import get_context
 from ..qcluster.base import AsyncBaseQCluster, BaseQExecutor
+from ..qcluster.load_tracker import executor_load
+from .cache import CachedResults, ResultCache, get_circuit_hash
 from .database import Database
 from .utils import CircuitInfo, get_cached_executor, get_circuit_id
 
@@ -56,6 +60,11 @@ class FuturesTable:
         """
         batch_id = str(uuid.uuid4())
         self._ef_pairs[batch_id] = (executor_future_pairs, submission_order)
+
+        for executor, futures_dict in executor_future_pairs:
+            if isinstance(executor, BaseQExecutor):
+                executor_load.add_in_flight(executor, len(futures_dict))
+
         return batch_id
 
     def pop_executor_future_pairs(
@@ -64,6 +73,8 @@ class FuturesTable:
     ) -> Tuple[List[Tuple[BaseQExecutor, Task]], List[int]]:
         """
         Retrieve a list of futures from the table using a UUID.
+
+        The circuits stay in flight until their results are retrieved.
         """
         return self._ef_pairs.pop(batch_id)
 
@@ -80,6 +91,10 @@ class QServer:
         # self._selector = selector or SimpleSelector(selector_function=select_first_executor)
         self._selector = selector or select_first_executor
         self._database = Database()
+        self._result_cache = ResultCache(self._database)
+
+        # Cache keys of circuits that were submitted for execution, by batch ID.
+        self._pending_cache_keys = {}
 
     @property
     def selector(self):
@@ -97,6 +112,11 @@ class QServer:
         """Return the database for reading."""
         return self.serialize(self._database)
 
+    @property
+    def cache_stats(self):
+        """Number of circuits served from and missed in the result cache."""
+        return self._result_cache.stats
+
     def select_executors(
         self,
         qscripts: List[QuantumScript],
@@ -109,28 +129,42 @@ class QServer:
         """
 
         linked_executors = []
-        for qscript in qscripts:
+        qcluster_indices = {}
+        for i, qscript in enumerate(qscripts):
             selected_executor = self.selector(qscript, executors)
 
             # Use cached executor.
             selected_executor = get_cached_executor(**selected_executor.dict())
 
             if isinstance(selected_executor, AsyncBaseQCluster):
-                # Apply QCluster's selector as well.
-                qcluster = selected_executor
-                selected_executor = qcluster.get_selector()(qscript, qcluster.executors)
+                # Collect the qscripts for each QCluster to apply its selector afterwards.
+                qcluster_indices.setdefault(id(selected_executor), (selected_executor, []))
+                qcluster_indices[id(selected_executor)][1].append(i)
 
+            linked_executors.append(selected_executor)
+
+        for qcluster, indices in qcluster_indices.values():
+            # Apply QCluster's selector as well, to the whole sub-batch at once
+            # if the selector supports it.
+            selector = qcluster.get_selector()
+            if hasattr(selector, "select_batch"):
+                selected_executors = selector.select_batch(
+                    [qscripts[i] for i in indices], qcluster.executors
+                )
+            else:
+                selected_executors = [selector(qscripts[i], qcluster.executors) for i in indices]
+
+            for i, selected_executor in zip(indices, selected_executors):
                 # Use cached executor.
-                selected_executor = get_cached_executor(**selected_executor.dict())
+                linked_executors[i] = get_cached_executor(**selected_executor.dict())
 
+        for selected_executor in linked_executors:
             # This is the only place where the qnode_specs are set.
             selected_executor.qnode_specs = qnode_specs.copy()
 
-            # An example `linked_executors` will look like:
-            # [exec_4, exec_4, exec_2, exec_3]
-            # Their indices corresponding to the indices of `qscripts`.
-            linked_executors.append(selected_executor)
-
+        # An example `linked_executors` will look like:
+        # [exec_4, exec_4, exec_2, exec_3]
+        # Their indices corresponding to the indices of `qscripts`.
         return linked_executors
 
     def submit_to_executors(
@@ -162,7 +196,7 @@ class QServer:
             submission_order.append(i)
 
             for j in range(i + 1, len(qscripts)):
-                if linked_executors[i] == linked_executors[j]:
+                if qscripts[j] is not None and linked_executors[i] == linked_executors[j]:
                     qscript_sub_batch[1][j] = qscripts[j]
                     qscripts[j] = None
                     submission_order.append(j)
@@ -196,6 +230,36 @@ class QServer:
 
         return executor_future_pairs, submission_order
 
+    def get_cached_results(
+        self,
+        qscripts: List[QuantumScript],
+        linked_executors: List[BaseQExecutor],
+        qelectron_info: QElectronInfo,
+    ) -> Tuple[Dict[int, str], Dict[int, QCResult]]:
+        """
+        Look up results of qscripts whose executors allow caching.
+
+        Returns:
+            The cache keys of cacheable qscripts and the cached results found,
+            both by qscript index.
+        """
+
+        cache_keys = {}
+        cached_results = {}
+        for i, (qscript, executor) in enumerate(zip(qscripts, linked_executors)):
+            executor.qelectron_info = qelectron_info.copy()
+            if not executor.use_result_cache:
+                continue
+
+            if (key := get_circuit_hash(qscript, executor)) is None:
+                continue
+
+            cache_keys[i] = key
+            if (result_obj := self._result_cache.get(key)) is not None:
+                cached_results[i] = result_obj
+
+        return cache_keys, cached_results
+
     def submit(
         self,
         qscripts: List[QuantumScript],
@@ -229,15 +293,31 @@ class QServer:
         # Generate a list of executors for each qscript.
         linked_executors = self.select_executors(qscripts, executors, qnode_specs)
 
+        # Find qscripts that were already run with the same settings.
+        cache_keys, cached_results = self.get_cached_results(
+            qscripts, linked_executors, qelectron_info
+        )
+
         # Assign qscript sub-batches to unique executors.
         executor_future_pairs, submission_order = self.submit_to_executors(
-            qscripts, linked_executors, qelectron_info
+            [None if i in cached_results else qscript for i, qscript in enumerate(qscripts)],
+            linked_executors,
+            qelectron_info,
         )
 
+        # Cached results are retrieved last, like those of one more executor.
+        if cached_results:
+            persist_data = all(linked_executors[i].persist_data for i in cached_results)
+            executor_future_pairs.append([CachedResults(persist_data), cached_results])
+            submission_order.extend(cached_results)
+
         # Get batch ID for N qscripts being async-executed on M <= N executors.
         batch_id = self.futures_table.add_executor_future_pairs(
             executor_future_pairs, submission_order
         )
+        self._pending_cache_keys[batch_id] = {
+            i: key for i, key in cache_keys.items() if i not in cached_results
+        }
 
         # Storing the qscripts, executors, and metadata in the database
         batch_time = str(datetime.datetime.now())
@@ -257,6 +337,7 @@ class QServer:
                 save_time=batch_time,
                 circuit_id=circuit_id,
                 qscript=qscript.graph.serialize() if linked_executors[i].persist_data else None,
+                cache_hit=(i in cached_results) if i in cache_keys else None,
             ).dict()
 
             key_value_pairs[1].append(circuit_info)
@@ -301,7 +382,6 @@ class QServer:
         return batch_id
 
     def get_results(self, batch_id):
-        # pylint: disable=too-many-locals
         """
         Retrieve the results of previously submitted QuantumScripts from the server.
 
@@ -312,19 +392,111 @@ class QServer:
             List: An ordered list of results for the submitted QuantumScripts.
         """
 
+        executor_future_pairs, submission_order = self.futures_table.pop_executor_future_pairs(
+            batch_id
+        )
+        cache_keys = self._pending_cache_keys.pop(batch_id, {})
+
+        sub_batch_results = [
+            self._get_sub_batch_results(executor, futures_sub_batch, cache_keys)
+            for executor, futures_sub_batch in executor_future_pairs
+        ]
+
+        return self._combine_results(
+            batch_id, executor_future_pairs, submission_order, sub_batch_results
+        )
+
+    async def get_results_async(self, batch_id):
+        """
+        Retrieve the results of previously submitted QuantumScripts from the server
+        without blocking the running event loop. Results are collected from all
+        executors concurrently, as each executor finishes.
+
+        Args:
+            batch_id: The UUID corresponding to the batch of submitted QuantumScripts.
+
+        Returns:
+            List: An ordered list of results for the submitted QuantumScripts.
+        """
+
+        executor_future_pairs, submission_order = self.futures_table.pop_executor_future_pairs(
+            batch_id
+        )
+        cache_keys = self._pending_cache_keys.pop(batch_id, {})
+
+        # Executors' `batch_get_results` methods block, so wait on them in threads.
+        loop = asyncio.get_running_loop()
+        sub_batch_results = await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    None,
+                    self._get_sub_batch_results,
+                    executor,
+                    futures_sub_batch,
+                    cache_keys,
+                )
+                for executor, futures_sub_batch in executor_future_pairs
+            )
+        )
+
+        return self._combine_results(
+            batch_id, executor_future_pairs, submission_order, sub_batch_results
+        )
+
+    def _get_sub_batch_results(
+        self,
+        executor: BaseQExecutor,
+        futures_sub_batch: Dict[int, Any],
+        cache_keys: Dict[int, str],
+    ) -> List[QCResult]:
+        """
+        Wait for the results of one executor's sub-batch of qscripts, then record
+        that they are no longer in flight, record their latencies and cache them.
+        """
+        try:
+            result_objs = executor.batch_get_results(futures_sub_batch.values())
+        finally:
+            if isinstance(executor, BaseQExecutor):
+                executor_load.remove_in_flight(executor, len(futures_sub_batch))
+
+        if isinstance(executor, BaseQExecutor):
+            executor_load.record_latencies(
+                executor, [result_obj.execution_time for result_obj in result_objs]
+            )
+
+        self._result_cache.set_many(
+            {
+                cache_keys[circuit_number]: result_obj
+                for circuit_number, result_obj in zip(futures_sub_batch.keys(), result_objs)
+                if circuit_number in cache_keys
+            }
+        )
+
+        return result_objs
+
+    def _combine_results(
+        self,
+        batch_id: str,
+        executor_future_pairs: List[Tuple[BaseQExecutor, Dict[int, Any]]],
+        submission_order: List[int],
+        sub_batch_results: List[List[QCResult]],
+    ):
+        # pylint: disable=too-many-locals
+        """
+        Store the results of every sub-batch in the database and
+        order them according to the submitted qscripts.
+        """
+
         # Get current electron's context
         context = get_context()
 
         results_dict = {}
         key_value_pairs = [[], []]
-        executor_future_pairs, submission_order = self.futures_table.pop_executor_future_pairs(
-            batch_id
-        )
 
         # ids of (e)xecutor_(f)uture_(p)airs, hence `idx_efp`
         qscript_submission_index = 0
         for idx_efp, (executor, futures_sub_batch) in enumerate(executor_future_pairs):
-            result_objs = executor.batch_get_results(futures_sub_batch.values())
+            result_objs = sub_batch_results[idx_efp]
 
             # Adding results according to the order of the qscripts
             # ids of (f)utures_(s)ub_(b)atch, hence `idx_fsb`
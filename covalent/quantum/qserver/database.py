@@ -14,12 +14,169 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import lmdb
 
 from ..._shared_files.config import get_config
-from .serialize import JsonLmdb, Strategy
+from .serialize import JsonLmdb, ResizeLock, Strategy
 from .utils import CircuitInfo
 
+# Directory inside the database directory that holds cached circuit results
+RESULT_CACHE_DIRNAME = "circuit-cache"
+
+# Initial size of the memory map of each database, which grows when full.
+# Override with the `dispatcher.qelectron_db_map_size` config setting.
+DEFAULT_MAP_SIZE = 2**24
+
+# Maximum number of databases kept open at once in this process
+MAX_OPEN_ENVIRONMENTS = 32
+
+# Maximum number of circuit results kept in the result cache, beyond which the
+# least recently used are evicted.
+# Override with the `dispatcher.qelectron_result_cache_size` config setting.
+DEFAULT_RESULT_CACHE_SIZE = 10000
+
+# Keys of index entries, which are maintained alongside the circuits in each database
+INDEX_PREFIX = "__index__/"
+SUMMARY_KEY = INDEX_PREFIX + "summary"
+JOBS_PREFIX = INDEX_PREFIX + "jobs/"
+
+# Keys of the recency index of the result cache
+CACHE_COUNT_KEY = INDEX_PREFIX + "count"
+CACHE_USED_PREFIX = INDEX_PREFIX + "used/"
+CACHE_LRU_PREFIX = INDEX_PREFIX + "lru/"
+
+
+def _get_job_key(circuit_id: str, record: dict) -> str:
+    # Job keys sort by the time circuits were submitted.
+    return f"{JOBS_PREFIX}{record.get('save_time') or ''}/{circuit_id}"
+
+
+def get_job_metadata(circuit_id: str, record: dict) -> dict:
+    """
+    Lightweight metadata of a stored circuit, for listing jobs.
+    """
+    result_metadata = record.get("result_metadata") or {}
+    completed = bool(record.get("result")) and bool(result_metadata)
+    return {
+        "job_id": circuit_id,
+        "start_time": record.get("save_time"),
+        "executor": result_metadata.get("executor_name"),
+        "status": "COMPLETED" if completed else "RUNNING",
+        "execution_time": record.get("execution_time"),
+    }
+
+
+def _touch_cached_result(txn, key: str, stamp: str) -> Optional[str]:
+    # Record that the cached result `key` was used at `stamp` and return when it was used before.
+    used_key = CACHE_USED_PREFIX + key
+    previous = txn.get(used_key)
+    if previous is not None:
+        txn.delete(f"{CACHE_LRU_PREFIX}{previous}/{key}")
+    txn.put(used_key, stamp)
+    txn.put(f"{CACHE_LRU_PREFIX}{stamp}/{key}", key)
+    return previous
+
+
+def _get_inode(path: str) -> Optional[int]:
+    try:
+        return os.stat(os.path.join(path, "data.mdb")).st_ino
+    except FileNotFoundError:
+        return None
+
+
+class _Environment:
+    """
+    An open LMDB environment and the number of its current users.
+    """
+
+    def __init__(self, env: lmdb.Environment, inode: Optional[int]):
+        self.env = env
+        self.inode = inode
+        self.refs = 0
+        self.evicted = False
+        self.resize_lock = ResizeLock()
+
+
+class _EnvironmentCache:
+    """
+    Process-wide cache of open LMDB environments. Opening an environment is
+    expensive, and LMDB does not support opening one more than once per process.
+    """
+
+    def __init__(self, max_size: int = MAX_OPEN_ENVIRONMENTS):
+        self.max_size = max_size
+        self._envs: Dict[str, _Environment] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, path: str, map_size: int) -> _Environment:
+        # Pin the environment so that it is not closed while in use.
+        inode = _get_inode(path)
+        with self._lock:
+            if path in self._envs:
+                entry = self._envs[path]
+                if entry.inode == inode:
+                    self._envs.move_to_end(path)
+                    entry.refs += 1
+                    return entry
+
+                # The database was deleted or replaced since it was opened.
+                self._evict(path)
+
+            env = lmdb.open(path, map_size=map_size, max_dbs=1, create=True, mode=0o755)
+            entry = _Environment(env, _get_inode(path))
+            entry.refs += 1
+            self._envs[path] = entry
+
+            # Environments in use are only closed once released.
+            unused = [p for p, e in self._envs.items() if e.refs == 0]
+            for unused_path in unused[: max(len(self._envs) - self.max_size, 0)]:
+                self._evict(unused_path)
+
+            return entry
+
+    def _release(self, entry: _Environment) -> None:
+        with self._lock:
+            entry.refs -= 1
+            if entry.evicted and entry.refs == 0:
+                entry.env.close()
+
+    def _evict(self, path: str) -> None:
+        entry = self._envs.pop(path)
+        entry.evicted = True
+        if entry.refs == 0:
+            entry.env.close()
+
+    @contextmanager
+    def open(self, path: str, map_size: int) -> Iterator[_Environment]:
+        """
+        Yield the open environment for `path`, which is kept open until the
+        context exits.
+        """
+        entry = self._get(path, map_size)
+        try:
+            yield entry
+        finally:
+            self._release(entry)
+
+    def close_all(self) -> None:
+        """
+        Close all open environments, or mark them to be closed once released.
+        """
+        with self._lock:
+            while self._envs:
+                self._evict(next(iter(self._envs)))
+
+
+_environments = _EnvironmentCache()
+
 
 def set_serialization_strategy(strategy_name):
     """
@@ -40,12 +197,29 @@ class Database:
         # allows runtime strategy selection with `set_serialization_strategy()`
         return Database.serialization_strategy
 
-    def __init__(self, db_dir=None):
+    def __init__(
+        self,
+        db_dir=None,
+        map_size: Optional[int] = None,
+        result_cache_size: Optional[int] = None,
+    ):
         if db_dir:
             self.db_dir = Path(db_dir)
         else:
             self.db_dir = Path(get_config("dispatcher")["qelectron_db_path"])
 
+        if map_size is None:
+            map_size = int(get_config("dispatcher").get("qelectron_db_map_size", DEFAULT_MAP_SIZE))
+        self.map_size = map_size
+
+        if result_cache_size is None:
+            result_cache_size = int(
+                get_config("dispatcher").get(
+                    "qelectron_result_cache_size", DEFAULT_RESULT_CACHE_SIZE
+                )
+            )
+        self.result_cache_size = result_cache_size
+
     def _get_db_path(self, dispatch_id, node_id, *, mkdir=False):
         dispatch_id = "default-dispatch" if dispatch_id is None else dispatch_id
         node_id = "default-node" if node_id is None else node_id
@@ -55,40 +229,171 @@ class Database:
 
         return db_path.resolve().absolute()
 
+    @contextmanager
+    def _open_path(self, db_path: Path, strategy_name) -> Iterator[JsonLmdb]:
+        with _environments.open(str(db_path), self.map_size) as entry:
+            yield JsonLmdb(
+                strategy_name, env=entry.env, autogrow=True, resize_lock=entry.resize_lock
+            )
+
     def _open(self, dispatch_id, node_id, mkdir=False):
         db_path = self._get_db_path(dispatch_id, node_id, mkdir=mkdir)
 
         if not db_path.exists():
             raise FileNotFoundError(f"Missing database directory {db_path}.")
 
-        return JsonLmdb.open_with_strategy(
-            file=str(db_path), flag="c", strategy_name=self.strategy_name
-        )
+        return self._open_path(db_path, self.strategy_name)
+
+    def _open_result_cache(self):
+        cache_path = self.db_dir.joinpath(RESULT_CACHE_DIRNAME)
+        cache_path.mkdir(parents=True, exist_ok=True)
+
+        return self._open_path(cache_path.resolve().absolute(), Strategy.PICKLE)
+
+    def get_cached_result(self, key):
+        """
+        Return the cached result for `key`, if any, and mark it as recently used.
+        """
+        stamp = f"{time.time_ns():020d}"
+
+        def _touch(txn):
+            # The result may have been evicted since it was read.
+            if txn.get(CACHE_USED_PREFIX + key) is not None:
+                _touch_cached_result(txn, key, stamp)
+
+        with self._open_result_cache() as db:
+            value = db.get(key, None)
+            if value is not None:
+                db.write(_touch)
+            return value
+
+    def set_cached_result(self, key, value):
+        self.set_cached_results({key: value})
+
+    def set_cached_results(self, results: Dict[str, Any]):
+        """
+        Store results by key in a single transaction, evicting the least
+        recently used results beyond `result_cache_size`.
+        """
+        stamp = f"{time.time_ns():020d}"
+
+        def _write(txn):
+            count = txn.get(CACHE_COUNT_KEY) or 0
+            for key, value in results.items():
+                if _touch_cached_result(txn, key, stamp) is None:
+                    count += 1
+                txn.put(key, value)
+
+            if count > self.result_cache_size:
+                for lru_key in txn.keys(CACHE_LRU_PREFIX, limit=count - self.result_cache_size):
+                    evicted = txn.get(lru_key)
+                    txn.delete(lru_key)
+                    txn.delete(CACHE_USED_PREFIX + evicted)
+                    txn.delete(evicted)
+                    count -= 1
+
+            txn.put(CACHE_COUNT_KEY, count)
+
+        with self._open_result_cache() as db:
+            db.write(_write)
 
     def set(self, keys, values, *, dispatch_id, node_id):
-        with self._open(dispatch_id, node_id, mkdir=True) as db:
-            for i, circuit_id in enumerate(keys):
-                stored_val: dict = db.get(circuit_id, None)
-                if stored_val is None:
-                    continue
+        """
+        Update the stored values for the given circuits, in a single transaction
+        which also updates the database's summary and jobs index.
+        """
 
-                stored_val.update(values[i])
-                values[i] = stored_val
+        def _write(txn):
+            summary = txn.get(SUMMARY_KEY) or {"num_circuits": 0, "total_execution_time": 0.0}
 
-            db.update(dict(zip(keys, values)))
+            for circuit_id, value in zip(keys, values):
+                stored = txn.get(circuit_id)
+                record = value if stored is None else {**stored, **value}
+                txn.put(circuit_id, record)
+
+                if stored is None:
+                    summary["num_circuits"] += 1
+                else:
+                    summary["total_execution_time"] -= stored.get("execution_time") or 0
+                    txn.delete(_get_job_key(circuit_id, stored))
+                summary["total_execution_time"] += record.get("execution_time") or 0
+
+                txn.put(_get_job_key(circuit_id, record), get_job_metadata(circuit_id, record))
+
+            txn.put(SUMMARY_KEY, summary)
+
+        with self._open(dispatch_id, node_id, mkdir=True) as db:
+            db.write(_write)
 
     def get_circuit_ids(self, *, dispatch_id, node_id):
         with self._open(dispatch_id, node_id) as db:
-            return list(db.keys())
+            return [key for key in db.keys() if not key.startswith(INDEX_PREFIX)]
 
-    def get_circuit_info(self, circuit_id, *, dispatch_id, node_id):
+    def get_summary(self, *, dispatch_id, node_id) -> Optional[dict]:
+        """
+        Return the number of stored circuits and their total execution time,
+        or `None` for databases written without an index.
+        """
+        return self.get(SUMMARY_KEY, dispatch_id=dispatch_id, node_id=node_id)
+
+    def get_jobs(
+        self,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+        descending: bool = True,
+        *,
+        dispatch_id,
+        node_id,
+    ) -> Tuple[List[dict], Optional[str]]:
+        """
+        Return a page of lightweight job metadata, ordered by start time.
+
+        Args:
+            cursor: The cursor returned with the previous page, if any.
+            limit: Maximum number of jobs in the page. All remaining jobs by default.
+            descending: Whether to return the latest jobs first.
+
+        Returns:
+            The jobs in the page and the cursor of the next page, which is `None`
+            if there are no more jobs.
+        """
         with self._open(dispatch_id, node_id) as db:
-            return CircuitInfo(**db.get(circuit_id, None))
+            # Read one extra job to find out whether there is a next page.
+            items = db.scan(
+                JOBS_PREFIX,
+                start_after=None if cursor is None else JOBS_PREFIX + cursor,
+                reverse=descending,
+                limit=None if limit is None else limit + 1,
+            )
 
-    def get_db(self, *, dispatch_id, node_id):
-        db_copy = {}
+        next_cursor = None
+        if limit is not None and len(items) > limit:
+            items = items[:limit]
+            next_cursor = items[-1][0][len(JOBS_PREFIX) :] if items else cursor
+
+        return [job for _, job in items], next_cursor
+
+    def get(self, circuit_id, default=None, *, dispatch_id, node_id):
+        """
+        Return the stored value for one circuit.
+        """
+        with self._open(dispatch_id, node_id) as db:
+            return db.get(circuit_id, default)
+
+    def iter_items(
+        self, keys: Optional[Sequence[str]] = None, *, dispatch_id, node_id
+    ) -> Iterator[Tuple[str, dict]]:
+        """
+        Iterate over stored circuits, or only those in `keys`, deserializing
+        each value only when it is reached.
+        """
         with self._open(dispatch_id, node_id) as db:
-            for key, value in db.items():
-                db_copy[key] = value
+            for key, value in db.iter_items(keys):
+                if not key.startswith(INDEX_PREFIX):
+                    yield key, value
+
+    def get_circuit_info(self, circuit_id, *, dispatch_id, node_id):
+        return CircuitInfo(**self.get(circuit_id, dispatch_id=dispatch_id, node_id=node_id))
 
-        return db_copy
+    def get_db(self, *, dispatch_id, node_id):
+        return dict(self.iter_items(dispatch_id=dispatch_id, node_id=node_id))
@@ -18,11 +18,13 @@
 Implement several different serialization methods for QNode output data written
 to the database.
 """
+import threading
 import warnings
 import zlib
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from enum import Enum
-from typing import Sequence, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
 import cloudpickle as pickle
 import lmdb
@@ -128,14 +130,111 @@ class Strategy(Enum):
     FALLBACK = _FallbackStrategy
 
 
+class _Transaction:
+    """
+    serializing wrapper around an LMDB write transaction
+    """
+
+    def __init__(self, db: "JsonLmdb", txn: lmdb.Transaction):
+        self._db = db
+        self._txn = txn
+
+    def get(self, key, default=None):
+        value = self._txn.get(self._db._pre_key(key))
+        return default if value is None else self._db._post_value(value)
+
+    def put(self, key, value) -> None:
+        self._txn.put(self._db._pre_key(key), self._db._pre_value(value))
+
+    def delete(self, key) -> None:
+        self._txn.delete(self._db._pre_key(key))
+
+    def keys(self, prefix: str, limit: Optional[int] = None) -> List[str]:
+        """
+        Return up to `limit` keys starting with `prefix`, in key order.
+        """
+        pre_prefix = self._db._pre_key(prefix)
+        cursor = self._txn.cursor()
+        keys = []
+        found = cursor.set_range(pre_prefix)
+        while found and (limit is None or len(keys) < limit):
+            key = cursor.key()
+            if not key.startswith(pre_prefix):
+                break
+            keys.append(self._db._post_key(key))
+            found = cursor.next()
+        return keys
+
+
+class ResizeLock:
+    """
+    Lets transactions on an environment run concurrently, but makes growing its
+    memory map wait until no other thread is in a transaction, because growing
+    it invalidates them. Transactions wait while the map is grown.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._txns: Dict[int, int] = {}
+        self._resizing = False
+        self._waiting = 0
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        Hold off growing the memory map while in a transaction.
+        """
+        thread_id = threading.get_ident()
+        with self._cond:
+            # Threads already in a transaction must not wait, or they would deadlock.
+            while thread_id not in self._txns and (self._resizing or self._waiting):
+                self._cond.wait()
+            self._txns[thread_id] = self._txns.get(thread_id, 0) + 1
+
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._txns[thread_id] -= 1
+                if not self._txns[thread_id]:
+                    del self._txns[thread_id]
+                self._cond.notify_all()
+
+    @contextmanager
+    def resize(self) -> Iterator[None]:
+        """
+        Wait for other threads to leave their transactions, then grow the memory map.
+        """
+        thread_id = threading.get_ident()
+        with self._cond:
+            self._waiting += 1
+            while self._resizing or any(t != thread_id for t in self._txns):
+                self._cond.wait()
+            self._waiting -= 1
+            self._resizing = True
+
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._resizing = False
+                self._cond.notify_all()
+
+
 class JsonLmdb(Lmdb):
     """
     custom `Lmdb` implementation with pre- and post-value strategy option
     """
 
-    def __init__(self, strategy_type: Union[Strategy, Sequence[Strategy]], **kw):
+    def __init__(
+        self,
+        strategy_type: Union[Strategy, Sequence[Strategy]],
+        resize_lock: Optional[ResizeLock] = None,
+        **kw,
+    ):
         self._strategy_map = {}
         self.strategy = self.init_strategy(strategy_type)
+        self.resize_lock = resize_lock or ResizeLock()
         super().__init__(**kw)
 
     def _pre_key(self, key):
@@ -179,6 +278,121 @@ class JsonLmdb(Lmdb):
             raise ValueError(f"unknown database strategy '{strategy_type}'")
         return strategy_cls()
 
+    @contextmanager
+    def _read_txn(self) -> Iterator[lmdb.Transaction]:
+        with self.resize_lock.transaction(), self.env.begin() as txn:
+            yield txn
+
+    def __getitem__(self, key):
+        with self._read_txn() as txn:
+            value = txn.get(self._pre_key(key))
+        if value is None:
+            raise KeyError(key)
+        return self._post_value(value)
+
+    def __contains__(self, key) -> bool:
+        with self._read_txn() as txn:
+            return txn.get(self._pre_key(key)) is not None
+
+    def __setitem__(self, key, value) -> None:
+        self.write(lambda txn: txn.put(key, value))
+
+    def __delitem__(self, key) -> None:
+        self.write(lambda txn: txn.delete(key))
+
+    def __len__(self) -> int:
+        with self._read_txn() as txn:
+            return txn.stat()["entries"]
+
+    def keys(self) -> Iterator[str]:
+        with self._read_txn() as txn:
+            for key in txn.cursor().iternext(keys=True, values=False):
+                yield self._post_key(key)
+
+    def values(self) -> Iterator[Any]:
+        for _, value in self.iter_items():
+            yield value
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        return self.iter_items()
+
+    def write(self, fn: Callable[["_Transaction"], None]) -> None:
+        """
+        Call `fn` with a write transaction, committing everything it writes at once.
+        `fn` is called again if the database had to grow.
+        """
+        for _ in range(12):
+            map_size = self.map_size
+            try:
+                with self.resize_lock.transaction(), self.env.begin(write=True) as txn:
+                    fn(_Transaction(self, txn))
+                    return
+            except lmdb.MapFullError:
+                if not self.autogrow:
+                    raise
+                with self.resize_lock.resize():
+                    # Another thread may have grown the map in the meantime.
+                    if self.map_size == map_size:
+                        self.map_size = map_size * 2
+
+        raise lmdb.MapFullError(f"Failed to grow LMDB {self.env.path()}")
+
+    def scan(
+        self,
+        prefix: str,
+        start_after: Optional[str] = None,
+        reverse: bool = False,
+        limit: Optional[int] = None,
+    ) -> List[Tuple[str, Any]]:
+        """
+        Read up to `limit` items whose keys start with `prefix`, in key order
+        (or reverse key order), starting after the key `start_after`.
+        """
+        items = []
+        with self._read_txn() as txn:
+            cursor = txn.cursor()
+            pre_prefix = self._pre_key(prefix)
+
+            if not reverse:
+                found = cursor.set_range(self._pre_key(start_after or prefix))
+                if (
+                    found
+                    and start_after is not None
+                    and cursor.key() == self._pre_key(start_after)
+                ):
+                    found = cursor.next()
+            elif start_after is not None:
+                found = cursor.set_range(self._pre_key(start_after)) and cursor.prev()
+            else:
+                # Position on the last key with the prefix.
+                end = pre_prefix[:-1] + bytes([pre_prefix[-1] + 1])
+                found = cursor.prev() if cursor.set_range(end) else cursor.last()
+
+            while found and (limit is None or len(items) < limit):
+                key = cursor.key()
+                if not key.startswith(pre_prefix):
+                    break
+                items.append((self._post_key(key), self._post_value(cursor.value())))
+                found = cursor.prev() if reverse else cursor.next()
+
+        return items
+
+    def iter_items(self, keys: Optional[Sequence[str]] = None) -> Iterator[Tuple[str, Any]]:
+        """
+        Iterate over all items or only those with the given keys, reading and
+        deserializing each value only when it is reached. Missing keys are skipped.
+        """
+        with self._read_txn() as txn:
+            if keys is None:
+                for key, value in txn.cursor().iternext():
+                    yield self._post_key(key), self._post_value(value)
+                return
+
+            for key in keys:
+                value = txn.get(self._pre_key(key))
+                if value is not None:
+                    yield key, self._post_value(value)
+
     @classmethod
     def open_with_strategy(
         cls,
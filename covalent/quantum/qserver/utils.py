@@ -43,6 +43,7 @@ class CircuitInfo(BaseModel):
     execution_time: Optional[float] = None
     result: Optional[List[Any]] = None
     result_metadata: Optional[List[Dict[str, Any]]] = None
+    cache_hit: Optional[bool] = None
 
 
 @lru_cache
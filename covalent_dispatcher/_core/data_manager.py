@@ -27,10 +27,15 @@ from typing import Callable, Dict, Optional
 from covalent._results_manager import Result
 from covalent._shared_files import logger
 from covalent._shared_files.defaults import sublattice_prefix
-from covalent._shared_files.qelectron_utils import extract_qelectron_db, write_qelectron_db
+from covalent._shared_files.qelectron_utils import (
+    extract_qelectron_db,
+    pop_qelectron_db,
+    write_qelectron_db,
+)
 from covalent._shared_files.util_classes import RESULT_STATUS
 from covalent._workflow.lattice import Lattice
 from covalent._workflow.transport_graph_ops import TransportGraphOps
+from covalent_ui import result_webhook
 
 from .._db import load, update, upsert
 from .._db.write_result_to_db import resolve_electron_id
@@ -80,7 +85,11 @@ def generate_node_result(
     Return(s)
         Dictionary of the inputs
     """
-    clean_stdout, bytes_data = extract_qelectron_db(stdout)
+    bytes_data = pop_qelectron_db(output)
+    clean_stdout = stdout
+    if not bytes_data:
+        # Workers of older Covalent versions print the database to stdout instead
+        clean_stdout, bytes_data = extract_qelectron_db(stdout)
     qelectron_data_exists = bool(bytes_data)
 
     if qelectron_data_exists:
@@ -166,6 +175,14 @@ async def update_node_result(result_object, node_result) -> None:
             node_id = node_result["node_id"]
             await status_queue.put((node_id, node_status, detail))
 
+            result_webhook.get_publisher().publish_node(
+                dispatch_id,
+                node_id,
+                node_status,
+                start_time=node_result.get("start_time"),
+                end_time=node_result.get("end_time"),
+            )
+
 
 # Domain: result
 def initialize_result_object(
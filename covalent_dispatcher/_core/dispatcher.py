@@ -25,6 +25,7 @@ from typing import Dict, List, Tuple
 
 from covalent._results_manager import Result
 from covalent._shared_files import logger
+from covalent._shared_files.config import get_config
 from covalent._shared_files.defaults import parameter_prefix
 from covalent._shared_files.util_classes import RESULT_STATUS
 from covalent_ui import result_webhook
@@ -36,6 +37,9 @@ from .data_modules.job_manager import set_cancel_requested
 app_log = logger.app_log
 log_stack_info = logger.log_stack_info
 
+# (dispatch_id, node_id) of tasks for the local Dask cluster which have not started running yet
+_ready_tasks = set()
+
 
 """
 Dispatcher module is responsible for planning and dispatching workflows. The dispatcher
@@ -156,6 +160,27 @@ async def _get_initial_tasks_and_deps(result_object: Result) -> Tuple[int, int,
     return num_tasks, ready_nodes, pending_parents
 
 
+# Domain: dispatcher
+def get_ready_task_count() -> int:
+    """Return the number of tasks for the local Dask cluster that are ready but not yet running"""
+    return len(_ready_tasks)
+
+
+# Domain: dispatcher
+def _runs_on_local_dask(executor: str, executor_data: Dict) -> bool:
+    """Return whether a task runs on the Dask cluster started with Covalent"""
+
+    if executor != "dask":
+        return False
+    scheduler_address = executor_data.get("attributes", {}).get("scheduler_address")
+    if not scheduler_address:
+        return True
+    try:
+        return scheduler_address == get_config("dask.scheduler_address")
+    except KeyError:
+        return False
+
+
 # Domain: dispatcher
 async def _submit_task(result_object, node_id):
     # Get name of the node for the current task
@@ -212,6 +237,8 @@ async def _submit_task(result_object, node_id):
             abstract_inputs=abs_task_input,
         )
         app_log.debug(f"Creating task {node_id}.")
+        if _runs_on_local_dask(executor, executor_data):
+            _ready_tasks.add((result_object.dispatch_id, node_id))
         asyncio.create_task(coro)
 
 
@@ -254,6 +281,8 @@ async def _run_planned_workflow(result_object: Result, status_queue: asyncio.Que
             f"Status queue msg for node id {node_id}: {node_status} with detail {detail}."
         )
 
+        _ready_tasks.discard((result_object.dispatch_id, node_id))
+
         if node_status == RESULT_STATUS.RUNNING:
             continue
 
@@ -357,6 +386,9 @@ async def run_workflow(result_object: Result) -> Result:
         result_object._end_time = datetime.now(timezone.utc)
 
     finally:
+        _ready_tasks.difference_update(
+            [task for task in _ready_tasks if task[0] == result_object.dispatch_id]
+        )
         await datasvc.persist_result(result_object.dispatch_id)
         datasvc.finalize_dispatch(result_object.dispatch_id)
 
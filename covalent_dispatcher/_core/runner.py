@@ -260,7 +260,7 @@ async def _run_task(
 
                 with set_context(node_id, dispatch_id):
                     res = user_fn(*args, **kwargs)
-                    mod_qe_utils.print_qelectron_db()
+                    mod_qe_utils.collect_qelectron_db()
 
                 return res
             except ModuleNotFoundError:
@@ -24,20 +24,122 @@ from alembic.config import Config
 from alembic.environment import EnvironmentContext
 from alembic.migration import MigrationContext
 from alembic.script import ScriptDirectory
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool
 from sqlalchemy_utils import create_database, database_exists
 
 from covalent._shared_files.config import get_config
 
 from . import models
 
+# Milliseconds a SQLite connection waits for a lock held by another connection
+SQLITE_BUSY_TIMEOUT_MS = 30000
+
+# Connections kept open by the pool of a client-server database
+DEFAULT_POOL_SIZE = 10
+
+# Connections opened beyond the pool size under load
+DEFAULT_MAX_OVERFLOW = 20
+
+# Seconds after which a pooled connection is replaced
+POOL_RECYCLE_SECONDS = 1800
+
+
+def _is_sqlite_memory(database: Optional[str]) -> bool:
+    return database in (None, "", ":memory:")
+
+
+def _sqlite_pragmas(read_only: bool, in_memory: bool):
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+        # Readers do not block the writer, nor the writer the readers, in write-ahead logging mode
+        if not in_memory:
+            cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        if read_only:
+            cursor.execute("PRAGMA query_only=ON")
+        cursor.close()
+
+    return set_pragmas
+
+
+def create_db_engine(db_URL: str, read_only: bool = False, **kwargs) -> Engine:
+    """
+    Create an engine tuned for the concurrent access of the dispatcher and the UI.
+
+    SQLite connections use write-ahead logging, `synchronous=NORMAL` and a busy
+    timeout, and file databases are served from a pool of connections. Other
+    databases get a pool sized by the `COVALENT_DATABASE_POOL_SIZE` and
+    `COVALENT_DATABASE_MAX_OVERFLOW` environment variables whose connections
+    are checked before use and recycled periodically.
+
+    Args:
+        db_URL: URL of the database.
+        read_only: Whether the connections of the engine refuse writes.
+        kwargs: Arguments of `sqlalchemy.create_engine`, which take precedence.
+
+    Returns:
+        The engine.
+    """
+
+    url = make_url(db_URL)
+    backend = url.get_backend_name()
+
+    if backend == "sqlite":
+        in_memory = _is_sqlite_memory(url.database)
+        if not in_memory and "poolclass" not in kwargs:
+            # Connections are returned to the pool by the thread which used them last
+            kwargs = {
+                "poolclass": QueuePool,
+                "pool_size": DEFAULT_POOL_SIZE,
+                "max_overflow": DEFAULT_MAX_OVERFLOW,
+                **kwargs,
+                "connect_args": {"check_same_thread": False, **kwargs.get("connect_args", {})},
+            }
+        engine = create_engine(url, **kwargs)
+        event.listen(engine, "connect", _sqlite_pragmas(read_only, in_memory))
+        return engine
+
+    if "poolclass" not in kwargs:
+        kwargs = {
+            "pool_size": int(environ.get("COVALENT_DATABASE_POOL_SIZE", DEFAULT_POOL_SIZE)),
+            "max_overflow": int(
+                environ.get("COVALENT_DATABASE_MAX_OVERFLOW", DEFAULT_MAX_OVERFLOW)
+            ),
+            "pool_pre_ping": True,
+            "pool_recycle": POOL_RECYCLE_SECONDS,
+            **kwargs,
+        }
+    if read_only and backend == "postgresql":
+        kwargs = {
+            **kwargs,
+            "connect_args": {
+                "options": "-c default_transaction_read_only=on",
+                **kwargs.get("connect_args", {}),
+            },
+        }
+    return create_engine(url, **kwargs)
+
 
 class DataStore:
+    """
+    Database of the workflows.
+
+    Writes go through `engine`. Reads which do not need to see the writes of
+    the current transaction, such as those of the UI, can go through
+    `read_engine` instead: an engine on a replica when `read_db_URL` is given,
+    read-only connections to the same file for a SQLite database, and
+    otherwise `engine` itself.
+    """
+
     def __init__(
         self,
         db_URL: Optional[str] = None,
         initialize_db: bool = False,
+        read_db_URL: Optional[str] = None,
         **kwargs,
     ):
         if db_URL:
@@ -45,7 +147,7 @@ class DataStore:
         else:
             self.db_URL = "sqlite+pysqlite:///" + get_config("dispatcher.db_path")
 
-        self.engine = create_engine(self.db_URL, **kwargs)
+        self.engine = create_db_engine(self.db_URL, **kwargs)
         if not database_exists(self.engine.url):
             try:
                 create_database(self.engine.url)
@@ -57,9 +159,23 @@ class DataStore:
         if initialize_db:
             models.Base.metadata.create_all(self.engine)
 
+        url = self.engine.url
+        if read_db_URL:
+            self.read_engine = create_db_engine(read_db_URL, read_only=True, **kwargs)
+        elif url.get_backend_name() == "sqlite" and not _is_sqlite_memory(url.database):
+            self.read_engine = create_db_engine(self.db_URL, read_only=True, **kwargs)
+        else:
+            # Every connection to an in-memory database opens a different database
+            self.read_engine = self.engine
+        self.ReadSession = sessionmaker(self.read_engine)
+
     @staticmethod
     def factory():
-        return DataStore(db_URL=environ.get("COVALENT_DATABASE_URL"), echo=False)
+        return DataStore(
+            db_URL=environ.get("COVALENT_DATABASE_URL"),
+            read_db_URL=environ.get("COVALENT_DATABASE_READ_URL"),
+            echo=False,
+        )
 
     def get_alembic_config(self, logging_enabled: bool = True):
         alembic_ini_path = Path(path.join(__file__, "./../../../covalent_migrations/alembic.ini"))
@@ -99,6 +215,11 @@ class DataStore:
         with self.Session.begin() as session:
             yield session
 
+    @contextmanager
+    def read_session(self) -> Generator[Session, None, None]:
+        with self.ReadSession() as session:
+            yield session
+
 
 class DataStoreSession:
     def __init__(self, session: Session, metadata={}):
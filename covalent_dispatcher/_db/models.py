@@ -18,16 +18,18 @@
 Models for the workflows db. Based on schema v9
 """
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, Text, func
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, Text, event, func
 from sqlalchemy.orm import declarative_base
 
+from .summary import create_dispatch_summary
+
 Base = declarative_base()
 
 
 class Lattice(Base):
     __tablename__ = "lattices"
     id = Column(Integer, primary_key=True)
-    dispatch_id = Column(String(64), nullable=False)
+    dispatch_id = Column(String(64), nullable=False, index=True)
 
     # id of node if the lattice is actually a sublattice
     electron_id = Column(Integer)
@@ -108,24 +110,39 @@ class Lattice(Base):
     results_dir = Column(Text)
 
     # Dispatch id of the root lattice in a hierarchy of sublattices
-    root_dispatch_id = Column(String(64), nullable=True)
+    root_dispatch_id = Column(String(64), nullable=True, index=True)
 
     # Name of the column which signifies soft deletion of a lattice
     is_active = Column(Boolean, nullable=False, default=True)
 
     # Timestamps
     created_at = Column(DateTime, nullable=False, server_default=func.now())
-    updated_at = Column(DateTime, nullable=False, onupdate=func.now(), server_default=func.now())
-    started_at = Column(DateTime)
+    updated_at = Column(
+        DateTime, nullable=False, onupdate=func.now(), server_default=func.now(), index=True
+    )
+    started_at = Column(DateTime, index=True)
     completed_at = Column(DateTime)
 
 
+class DispatchStatusCount(Base):
+    __tablename__ = "dispatch_status_counts"
+
+    # Workflow status
+    status = Column(String(24), primary_key=True)
+
+    # Number of active top-level lattices with this status
+    count = Column(Integer, nullable=False, default=0)
+
+    # Total run time of these lattices in milliseconds
+    run_time = Column(Integer, nullable=False, default=0)
+
+
 class Electron(Base):
     __tablename__ = "electrons"
     id = Column(Integer, primary_key=True)
 
     # id of the lattice containing this electron
-    parent_lattice_id = Column(Integer, ForeignKey("lattices.id"), nullable=False)
+    parent_lattice_id = Column(Integer, ForeignKey("lattices.id"), nullable=False, index=True)
 
     # id of the node in the context of a transport graph
     transport_graph_node_id = Column(Integer, nullable=False)
@@ -184,6 +201,9 @@ class Electron(Base):
     # Name of the file containing errors generated by the task runner or executor
     error_filename = Column(Text)
 
+    # ID of the task group the node is executed in, which defaults to its node id
+    task_group_id = Column(Integer)
+
     # Name of the column which signifies soft deletion of the electrons corresponding to a lattice
     is_active = Column(Boolean, nullable=False, default=True)
 
@@ -202,7 +222,9 @@ class ElectronDependency(Base):
     id = Column(Integer, primary_key=True)
 
     # Unique ID of electron
-    electron_id = Column(Integer, ForeignKey("electrons.id", name="electron_link"), nullable=False)
+    electron_id = Column(
+        Integer, ForeignKey("electrons.id", name="electron_link"), nullable=False, index=True
+    )
 
     # Unique ID of the electron's parent
     parent_electron_id = Column(
@@ -237,3 +259,8 @@ class Job(Base):
 
     # JSON-serialized identifier for job
     job_handle = Column(Text, nullable=False, default="null")
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _create_dispatch_summary(target, connection, **kw):
+    create_dispatch_summary(connection)
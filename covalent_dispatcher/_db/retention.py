@@ -0,0 +1,362 @@
+# Copyright 2023 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Retention of dispatches: garbage collection of old and deleted dispatches.
+
+A retention job permanently deletes the records of the dispatches selected by
+a retention policy together with their sublattices, electrons, dependencies
+and jobs, in batches of `DELETE_BATCH_SIZE` dispatches so that other writers
+of the database are only held up for the duration of a batch. The artifact
+directories of each batch are renamed out of the way once the batch is
+committed and removed by a pool of background threads.
+"""
+
+import os
+import shutil
+import threading
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import delete, or_, select
+
+from covalent._shared_files import logger
+from covalent._shared_files.config import get_config
+
+from . import models
+from .datastore import DataStore, workflow_db
+
+app_log = logger.app_log
+
+# Maximum number of dispatches deleted in a single transaction
+DELETE_BATCH_SIZE = 500
+
+# Number of threads removing artifact directories
+REMOVAL_WORKERS = 4
+
+# Statuses of the dispatches which are no longer running
+TERMINAL_STATUSES = ["COMPLETED", "FAILED", "CANCELLED", "POSTPROCESSING_FAILED"]
+
+# Suffix of the artifact directories waiting to be removed
+_REMOVAL_SUFFIX = ".deleting"
+
+
+@dataclass
+class RetentionPolicy:
+    """
+    Selection of the dispatches to delete.
+
+    Dispatches deleted from the UI are collected once they are no longer
+    running. Other top-level dispatches are collected when their status is in
+    `statuses` and they either completed more than `max_age` ago, or are among
+    the oldest dispatches whose removal brings the artifacts of all dispatches
+    under `max_size` bytes.
+
+    Attributes:
+        max_age: Age after which a finished dispatch is deleted.
+        statuses: Statuses of the dispatches which may be deleted.
+        max_size: Maximum total size in bytes of the artifacts of all dispatches.
+    """
+
+    max_age: Optional[timedelta] = None
+    statuses: List[str] = field(default_factory=lambda: list(TERMINAL_STATUSES))
+    max_size: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        running = set(self.statuses) - set(TERMINAL_STATUSES)
+        if running:
+            statuses = ", ".join(sorted(running))
+            raise ValueError(f"Dispatches with status {statuses} cannot be deleted")
+        if self.max_size is not None and self.max_size < 0:
+            raise ValueError("The maximum size of the artifacts cannot be negative")
+
+
+def _directory_size(path: str) -> int:
+    size = 0
+    for dirpath, _, filenames in os.walk(path):
+        for filename in filenames:
+            try:
+                size += os.lstat(os.path.join(dirpath, filename)).st_size
+            except OSError:
+                continue
+    return size
+
+
+def _chunks(items: list, size: int):
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+class RetentionJob:
+    """
+    Background job deleting the dispatches selected by a retention policy.
+
+    Attributes:
+        job_id: Unique id of the job.
+        policy: Retention policy of the job.
+        state: One of "pending", "running", "completed" or "failed".
+        total_dispatches: Number of dispatches selected for deletion.
+        deleted_dispatches: Number of dispatches deleted from the database.
+        removed_directories: Number of artifact directories removed.
+        error: Error which stopped the job, if any.
+    """
+
+    def __init__(self, policy: RetentionPolicy, data_store: DataStore = workflow_db) -> None:
+        self.job_id = str(uuid.uuid4())
+        self.policy = policy
+        self.data_store = data_store
+        self.state = "pending"
+        self.total_dispatches = 0
+        self.deleted_dispatches = 0
+        self.removed_directories = 0
+        self.error: Optional[str] = None
+        self.started_at: Optional[datetime] = None
+        self.completed_at: Optional[datetime] = None
+        self._lock = threading.Lock()
+
+    def progress(self) -> Dict:
+        """Return the state and counters of the job"""
+
+        with self._lock:
+            return {
+                "job_id": self.job_id,
+                "state": self.state,
+                "total_dispatches": self.total_dispatches,
+                "deleted_dispatches": self.deleted_dispatches,
+                "removed_directories": self.removed_directories,
+                "error": self.error,
+                "started_at": self.started_at,
+                "completed_at": self.completed_at,
+            }
+
+    def select_dispatches(self) -> List[str]:
+        """
+        Select the top-level dispatches to delete, oldest first.
+
+        Returns:
+            Dispatch ids of the selected dispatches.
+        """
+
+        policy = self.policy
+        with self.data_store.session() as session:
+            rows = session.execute(
+                select(
+                    models.Lattice.dispatch_id,
+                    models.Lattice.storage_path,
+                    models.Lattice.status,
+                    models.Lattice.is_active,
+                    models.Lattice.completed_at,
+                )
+                .where(models.Lattice.electron_id.is_(None))
+                .order_by(models.Lattice.completed_at.asc(), models.Lattice.id.asc())
+            ).all()
+
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        selected = []
+        kept = []
+        for row in rows:
+            if row.status not in TERMINAL_STATUSES:
+                # Dispatches deleted from the UI may still be running
+                kept.append((row, False))
+            elif not row.is_active:
+                selected.append(row)
+            elif row.status not in policy.statuses or row.completed_at is None:
+                kept.append((row, False))
+            elif policy.max_age is not None and now - row.completed_at > policy.max_age:
+                selected.append(row)
+            else:
+                kept.append((row, True))
+
+        if policy.max_size is not None:
+            sizes = [(row, eligible, self._artifacts_size(row)) for row, eligible in kept]
+            total_size = sum(size for _, _, size in sizes)
+            for row, eligible, size in sizes:
+                if total_size <= policy.max_size:
+                    break
+                if eligible:
+                    selected.append(row)
+                    total_size -= size
+
+        return [row.dispatch_id for row in selected]
+
+    @staticmethod
+    def _artifacts_size(row) -> int:
+        if row.storage_path and os.path.isdir(row.storage_path):
+            return _directory_size(row.storage_path)
+        return 0
+
+    def delete_batch(self, dispatch_ids: List[str]) -> List[Tuple[str, Optional[str]]]:
+        """
+        Delete the records of a batch of dispatches and of their sublattices.
+
+        Returns:
+            `(dispatch_id, storage_path)` tuples of the deleted dispatches and sublattices.
+        """
+
+        with self.data_store.session() as session:
+            lattices = session.execute(
+                select(
+                    models.Lattice.id, models.Lattice.dispatch_id, models.Lattice.storage_path
+                ).where(
+                    or_(
+                        models.Lattice.dispatch_id.in_(dispatch_ids),
+                        models.Lattice.root_dispatch_id.in_(dispatch_ids),
+                    )
+                )
+            ).all()
+            # Dispatches may have any number of sublattices
+            lattice_id_chunks = list(
+                _chunks([lattice.id for lattice in lattices], DELETE_BATCH_SIZE)
+            )
+
+            for lattice_ids in lattice_id_chunks:
+                electron_ids = select(models.Electron.id).where(
+                    models.Electron.parent_lattice_id.in_(lattice_ids)
+                )
+                job_ids = session.scalars(
+                    select(models.Electron.job_id).where(
+                        models.Electron.parent_lattice_id.in_(lattice_ids)
+                    )
+                ).all()
+
+                # Dependencies only link electrons of the same lattice
+                session.execute(
+                    delete(models.ElectronDependency).where(
+                        models.ElectronDependency.electron_id.in_(electron_ids)
+                    ),
+                    execution_options={"synchronize_session": False},
+                )
+                session.execute(
+                    delete(models.Electron).where(
+                        models.Electron.parent_lattice_id.in_(lattice_ids)
+                    ),
+                    execution_options={"synchronize_session": False},
+                )
+                for chunk in _chunks(job_ids, DELETE_BATCH_SIZE):
+                    session.execute(
+                        delete(models.Job).where(models.Job.id.in_(chunk)),
+                        execution_options={"synchronize_session": False},
+                    )
+
+            for lattice_ids in lattice_id_chunks:
+                session.execute(
+                    delete(models.Lattice).where(models.Lattice.id.in_(lattice_ids)),
+                    execution_options={"synchronize_session": False},
+                )
+
+        return [(lattice.dispatch_id, lattice.storage_path) for lattice in lattices]
+
+    def _remove_directory(self, path: str) -> None:
+        shutil.rmtree(path, ignore_errors=True)
+        with self._lock:
+            self.removed_directories += 1
+
+    def _schedule_removal(self, dispatch_id: str, path: Optional[str]) -> Iterator[Future]:
+        # Only remove directories named after their dispatch, never a shared results directory
+        qelectron_path = os.path.join(get_config("dispatcher.qelectron_db_path"), dispatch_id)
+        for directory in [path, qelectron_path]:
+            if not directory or not os.path.isdir(directory):
+                continue
+            if os.path.basename(os.path.normpath(directory)) != dispatch_id:
+                continue
+            removed_path = f"{os.path.normpath(directory)}.{self.job_id}{_REMOVAL_SUFFIX}"
+            try:
+                os.rename(directory, removed_path)
+            except OSError as ex:
+                app_log.warning(f"Unable to remove artifacts of dispatch {dispatch_id}: {ex}")
+                continue
+            yield _removal_pool.submit(self._remove_directory, removed_path)
+
+    def run(self) -> None:
+        """Delete the selected dispatches and wait for their artifacts to be removed"""
+
+        with self._lock:
+            self.state = "running"
+            self.started_at = datetime.now(timezone.utc)
+
+        removals = []
+        try:
+            dispatches = self.select_dispatches()
+            with self._lock:
+                self.total_dispatches = len(dispatches)
+
+            for batch in _chunks(dispatches, DELETE_BATCH_SIZE):
+                deleted = self.delete_batch(batch)
+                with self._lock:
+                    self.deleted_dispatches += len(batch)
+                for dispatch_id, storage_path in deleted:
+                    removals.extend(self._schedule_removal(dispatch_id, storage_path))
+
+            for removal in removals:
+                removal.result()
+            state, error = "completed", None
+        except Exception as ex:
+            app_log.exception(f"Retention job {self.job_id} failed: {ex}")
+            state, error = "failed", str(ex)
+
+        with self._lock:
+            self.state = state
+            self.error = error
+            self.completed_at = datetime.now(timezone.utc)
+
+
+_removal_pool = ThreadPoolExecutor(
+    max_workers=REMOVAL_WORKERS, thread_name_prefix="covalent-retention-removal"
+)
+
+_jobs: Dict[str, RetentionJob] = {}
+_jobs_lock = threading.Lock()
+
+
+class RetentionJobRunningError(Exception):
+    """Raised when a retention job is started while another one is running"""
+
+
+def start_retention_job(
+    policy: RetentionPolicy, data_store: DataStore = workflow_db
+) -> RetentionJob:
+    """
+    Start a retention job in a background thread.
+
+    Args:
+        policy: Selection of the dispatches to delete.
+        data_store: Database to delete the dispatches from.
+
+    Returns:
+        The started job.
+
+    Raises:
+        RetentionJobRunningError: Another retention job is running.
+    """
+
+    with _jobs_lock:
+        if any(job.state in ("pending", "running") for job in _jobs.values()):
+            raise RetentionJobRunningError("A retention job is already running")
+        job = RetentionJob(policy, data_store)
+        _jobs[job.job_id] = job
+
+    threading.Thread(target=job.run, name=f"covalent-retention-{job.job_id}", daemon=True).start()
+    return job
+
+
+def get_retention_job(job_id: str) -> Optional[RetentionJob]:
+    """Return the retention job with id `job_id`, or None if there is none"""
+
+    with _jobs_lock:
+        return _jobs.get(job_id)
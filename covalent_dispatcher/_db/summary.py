@@ -0,0 +1,181 @@
+# Copyright 2023 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Summary structures of the dispatch list, kept up to date by the database.
+
+The `dispatch_status_counts` table holds the number and total run time of the
+active top-level dispatches by status, and the `lattices_search` table is a
+trigram index of dispatch names and ids. Both are maintained by triggers on the
+`lattices` table, so they are current whichever process writes the lattices.
+They are only created on SQLite; the UI falls back to querying the `lattices`
+table when they are missing.
+"""
+
+from typing import List
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import OperationalError
+
+from covalent._shared_files import logger
+
+app_log = logger.app_log
+
+STATUS_COUNTS_TABLE = "dispatch_status_counts"
+SEARCH_TABLE = "lattices_search"
+
+# Whether a lattice row counts as an active top-level dispatch
+_COUNTED = "{row}.electron_id IS NULL AND {row}.is_active"
+
+# Run time of a lattice row in milliseconds, matching `extract("epoch", ...)` on SQLite
+_RUN_TIME = (
+    "CASE WHEN {row}.started_at IS NOT NULL AND {row}.completed_at IS NOT NULL "
+    "THEN (CAST(STRFTIME('%s', {row}.completed_at) AS INTEGER) "
+    "- CAST(STRFTIME('%s', {row}.started_at) AS INTEGER)) * 1000 ELSE 0 END"
+)
+
+_ADD_COUNT = f"""
+    INSERT OR IGNORE INTO {STATUS_COUNTS_TABLE} (status, count, run_time)
+    VALUES (NEW.status, 0, 0);
+    UPDATE {STATUS_COUNTS_TABLE}
+    SET count = count + 1, run_time = run_time + {_RUN_TIME.format(row="NEW")}
+    WHERE status = NEW.status;
+"""
+
+_REMOVE_COUNT = f"""
+    UPDATE {STATUS_COUNTS_TABLE}
+    SET count = count - 1, run_time = run_time - {_RUN_TIME.format(row="OLD")}
+    WHERE status = OLD.status;
+"""
+
+_COUNTED_COLUMNS = "status, is_active, electron_id, started_at, completed_at"
+
+STATUS_COUNTS_DDL = [
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {STATUS_COUNTS_TABLE}_insert AFTER INSERT ON lattices
+    WHEN {_COUNTED.format(row="NEW")}
+    BEGIN {_ADD_COUNT} END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {STATUS_COUNTS_TABLE}_update_old
+    AFTER UPDATE OF {_COUNTED_COLUMNS} ON lattices
+    WHEN {_COUNTED.format(row="OLD")}
+    BEGIN {_REMOVE_COUNT} END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {STATUS_COUNTS_TABLE}_update_new
+    AFTER UPDATE OF {_COUNTED_COLUMNS} ON lattices
+    WHEN {_COUNTED.format(row="NEW")}
+    BEGIN {_ADD_COUNT} END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {STATUS_COUNTS_TABLE}_delete AFTER DELETE ON lattices
+    WHEN {_COUNTED.format(row="OLD")}
+    BEGIN {_REMOVE_COUNT} END
+    """,
+]
+
+# Recount the dispatches already in the database
+STATUS_COUNTS_BACKFILL = f"""
+    INSERT INTO {STATUS_COUNTS_TABLE} (status, count, run_time)
+    SELECT status, COUNT(*), SUM({_RUN_TIME.format(row="lattices")})
+    FROM lattices WHERE {_COUNTED.format(row="lattices")}
+    GROUP BY status
+"""
+
+_SEARCH_INSERT = (
+    f"INSERT INTO {SEARCH_TABLE} (rowid, name, dispatch_id) "
+    "VALUES (NEW.id, NEW.name, NEW.dispatch_id);"
+)
+_SEARCH_DELETE = (
+    f"INSERT INTO {SEARCH_TABLE} ({SEARCH_TABLE}, rowid, name, dispatch_id) "
+    "VALUES ('delete', OLD.id, OLD.name, OLD.dispatch_id);"
+)
+
+SEARCH_DDL = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE}
+    USING fts5(name, dispatch_id, content='lattices', content_rowid='id', tokenize='trigram')
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {SEARCH_TABLE}_insert AFTER INSERT ON lattices
+    BEGIN {_SEARCH_INSERT} END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {SEARCH_TABLE}_update
+    AFTER UPDATE OF name, dispatch_id ON lattices
+    BEGIN {_SEARCH_DELETE} {_SEARCH_INSERT} END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {SEARCH_TABLE}_delete AFTER DELETE ON lattices
+    BEGIN {_SEARCH_DELETE} END
+    """,
+]
+
+SEARCH_BACKFILL = f"INSERT INTO {SEARCH_TABLE} ({SEARCH_TABLE}) VALUES ('rebuild')"
+
+
+def _execute(connection: Connection, statements: List[str]) -> None:
+    for statement in statements:
+        connection.execute(text(statement))
+
+
+def create_dispatch_summary(connection: Connection) -> None:
+    """
+    Create the triggers maintaining the status counts and the search index, and
+    fill them from the lattices already in the database.
+
+    The `dispatch_status_counts` table must already exist. Does nothing on
+    databases other than SQLite. The search index is skipped when SQLite was
+    built without the FTS5 trigram tokenizer.
+
+    Args:
+        connection: Connection to the workflow database.
+    """
+
+    if connection.dialect.name != "sqlite":
+        return
+
+    _execute(connection, STATUS_COUNTS_DDL)
+    connection.execute(text(f"DELETE FROM {STATUS_COUNTS_TABLE}"))
+    connection.execute(text(STATUS_COUNTS_BACKFILL))
+
+    try:
+        _execute(connection, SEARCH_DDL[:1])
+    except OperationalError as ex:
+        app_log.debug(f"Dispatch search index is not supported by this database: {ex}")
+        return
+    _execute(connection, SEARCH_DDL[1:])
+    connection.execute(text(SEARCH_BACKFILL))
+
+
+def drop_dispatch_summary(connection: Connection) -> None:
+    """
+    Drop the triggers and the search index created by `create_dispatch_summary`.
+
+    Args:
+        connection: Connection to the workflow database.
+    """
+
+    if connection.dialect.name != "sqlite":
+        return
+
+    for suffix in ["insert", "update_old", "update_new", "delete"]:
+        connection.execute(text(f"DROP TRIGGER IF EXISTS {STATUS_COUNTS_TABLE}_{suffix}"))
+    for suffix in ["insert", "update", "delete"]:
+        connection.execute(text(f"DROP TRIGGER IF EXISTS {SEARCH_TABLE}_{suffix}"))
+    connection.execute(text(f"DROP TABLE IF EXISTS {SEARCH_TABLE}"))
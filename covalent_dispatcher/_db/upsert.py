@@ -230,6 +230,11 @@ def _electron_data(session: Session, result: Result, cancel_requested: bool = Fa
         except KeyError:
             node_qelectron_data_exists = False
 
+        try:
+            task_group_id = tg.get_node_value(node_id, "task_group_id")
+        except KeyError:
+            task_group_id = node_id
+
         executor = tg.get_node_value(node_id, "metadata")["executor"]
         started_at = tg.get_node_value(node_key=node_id, value_key="start_time")
         completed_at = tg.get_node_value(node_key=node_id, value_key="end_time")
@@ -292,6 +297,7 @@ def _electron_data(session: Session, result: Result, cancel_requested: bool = Fa
                 "call_before_filename": ELECTRON_CALL_BEFORE_FILENAME,
                 "call_after_filename": ELECTRON_CALL_AFTER_FILENAME,
                 "qelectron_data_exists": node_qelectron_data_exists,
+                "task_group_id": task_group_id,
                 "cancel_requested": cancel_requested,
                 "created_at": datetime.now(timezone.utc),
                 "updated_at": datetime.now(timezone.utc),
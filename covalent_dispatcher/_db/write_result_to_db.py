@@ -203,6 +203,7 @@ def transaction_insert_electrons_data(
     updated_at: dt,
     started_at: dt,
     completed_at: dt,
+    task_group_id: int = None,
 ) -> id:
     """
     This function writes the transport graph node data to the Electrons table in the DB
@@ -244,6 +245,7 @@ def transaction_insert_electrons_data(
         call_before_filename=call_before_filename,
         call_after_filename=call_after_filename,
         qelectron_data_exists=qelectron_data_exists,
+        task_group_id=task_group_id,
         is_active=True,
         job_id=job_row.id,
         created_at=created_at,
@@ -17,13 +17,17 @@
 from __future__ import annotations
 
 import asyncio
+import math
 import os
+import time
 from logging import Logger
 from multiprocessing import Process, current_process
 from threading import Thread
+from typing import Callable, List, Optional, Tuple
 
 import dask.config
 from dask.distributed import LocalCluster
+from distributed.comm import unparse_address
 from distributed.core import Server, rpc
 
 from covalent._shared_files import logger
@@ -35,6 +39,179 @@ app_log = logger.app_log
 # Configure dask to not allow daemon workers
 dask.config.set({"distributed.worker.daemon": False})
 
+# Worker task states that count towards the load of a worker
+_BUSY_TASK_STATES = ("executing", "ready", "constrained", "long-running")
+
+
+class DaskAutoscaler:
+    """
+    Adaptively resize a LocalCluster based on the number of tasks the
+    dispatcher has ready but not yet running, the load on the workers and
+    their memory usage.
+
+    The cluster is kept between `min_workers` and `max_workers`. After every
+    scaling action no further action is taken for `cooldown` seconds so that
+    the cluster does not thrash on bursty workloads. Scaling down retires the
+    workers chosen by the scheduler, preferring idle ones, as
+    `distributed.deploy.Adaptive` does, rather than the most recently added.
+    """
+
+    def __init__(
+        self,
+        cluster: LocalCluster,
+        min_workers: int = 1,
+        max_workers: int = 1,
+        threads_per_worker: int = 1,
+        interval: float = 5,
+        cooldown: float = 30,
+        memory_threshold: float = 0.8,
+        logger: Optional[Logger] = None,
+    ):
+        self.cluster = cluster
+        self.min_workers = min_workers
+        self.max_workers = max(max_workers, min_workers)
+        self.threads_per_worker = threads_per_worker or 1
+        self.interval = interval
+        self.cooldown = cooldown
+        self.memory_threshold = memory_threshold
+        self.logger = logger or app_log
+
+        # Number of tasks reported by the dispatcher as ready but not running
+        self.queue_depth = 0
+        self._last_scaled = None
+
+    def set_queue_depth(self, depth: int) -> None:
+        self.queue_depth = max(int(depth), 0)
+
+    def desired_workers(self, current: int, busy_tasks: int, memory_fractions: List[float]) -> int:
+        """
+        Compute the number of workers the cluster should have
+
+        Arg(s)
+            current: Number of workers currently in the cluster
+            busy_tasks: Number of tasks currently executing or queued on the workers
+            memory_fractions: Fraction of the memory limit in use by each worker
+
+        Return(s)
+            Number of workers to scale the cluster to
+        """
+        demand = self.queue_depth + busy_tasks
+        desired = math.ceil(demand / self.threads_per_worker)
+
+        # Add headroom instead of shrinking when the workers are under memory pressure
+        if memory_fractions and max(memory_fractions) >= self.memory_threshold:
+            desired = max(desired, current + 1)
+
+        return min(max(desired, self.min_workers), self.max_workers)
+
+    async def _get_cluster_load(self) -> Tuple[int, List[float]]:
+        """
+        Retrieve the number of busy tasks and memory usage of each worker from the scheduler
+        """
+        async with rpc(self.cluster.scheduler_address) as r:
+            cinfo = await r.identity()
+
+        busy_tasks = 0
+        memory_fractions = []
+        for worker_info in cinfo["workers"].values():
+            metrics = worker_info.get("metrics", {})
+            task_counts = metrics.get("task_counts", {})
+            busy_tasks += sum(task_counts.get(state, 0) for state in _BUSY_TASK_STATES)
+
+            if worker_info.get("memory_limit"):
+                memory_fractions.append(metrics.get("memory", 0) / worker_info["memory_limit"])
+
+        return busy_tasks, memory_fractions
+
+    async def _retire_workers(self, count: int) -> List:
+        """
+        Gracefully retire workers chosen by the scheduler and drop them from the cluster
+
+        Arg(s)
+            count: Number of workers to retire
+
+        Return(s)
+            Names of the retired workers
+        """
+        async with rpc(self.cluster.scheduler_address) as r:
+            names = await r.workers_to_close(n=count, attribute="name")
+            if names:
+                await r.retire_workers(names=names, remove=True, close_workers=True)
+
+        # Drop the specs of the retired workers so that the cluster does not restart them
+        for name in names:
+            self.cluster.worker_spec.pop(name, None)
+        self.cluster.scale(len(self.cluster.worker_spec))
+        return names
+
+    async def step(self) -> Optional[int]:
+        """
+        Run one autoscaling iteration
+
+        Return(s)
+            The new cluster size if the cluster was scaled, None otherwise
+        """
+        now = time.monotonic()
+        if self._last_scaled is not None and now - self._last_scaled < self.cooldown:
+            return None
+
+        current = len(self.cluster.workers)
+        busy_tasks, memory_fractions = await self._get_cluster_load()
+        desired = self.desired_workers(current, busy_tasks, memory_fractions)
+
+        if desired == current:
+            return None
+
+        self.logger.debug(
+            f"Autoscaling dask cluster from {current} to {desired} workers "
+            f"(queue depth: {self.queue_depth}, busy tasks: {busy_tasks})"
+        )
+        if desired > current:
+            self.cluster.scale(desired)
+        else:
+            retired = await self._retire_workers(current - desired)
+            if not retired:
+                return None
+            desired = current - len(retired)
+        self._last_scaled = now
+        return desired
+
+    async def start(self):
+        while True:
+            try:
+                await self.step()
+            except Exception as e:
+                self.logger.exception(e)
+            await asyncio.sleep(self.interval)
+
+
+class QueueDepthReporter:
+    """
+    Periodically report the dispatcher's count of ready but not yet running
+    tasks to the admin server of the local Dask cluster so that its
+    autoscaler can react to bursts before they reach the scheduler.
+    """
+
+    def __init__(self, get_queue_depth: Callable[[], int], interval: float = None):
+        self.get_queue_depth = get_queue_depth
+        self.interval = interval or get_config("dask.autoscale_interval")
+
+    async def report(self) -> None:
+        admin_host = get_config("dask.admin_host")
+        admin_port = get_config("dask.admin_port")
+        admin_address = unparse_address("tcp", f"{admin_host}:{admin_port}")
+
+        async with rpc(admin_address, timeout=2) as r:
+            await r.cluster_queue_depth(depth=self.get_queue_depth())
+
+    async def start(self):
+        while True:
+            try:
+                await self.report()
+            except Exception as e:
+                app_log.debug(f"Unable to report queue depth to the dask cluster: {e}")
+            await asyncio.sleep(self.interval)
+
 
 class DaskAdminWorker(Thread):
     """
@@ -48,12 +225,20 @@ class DaskAdminWorker(Thread):
     the cluster that are not supported by the Dask scheduler directly
     """
 
-    def __init__(self, cluster: LocalCluster, admin_host: str, admin_port: int, logger=None):
+    def __init__(
+        self,
+        cluster: LocalCluster,
+        admin_host: str,
+        admin_port: int,
+        logger=None,
+        autoscaler: Optional[DaskAutoscaler] = None,
+    ):
         # Admin handler server connection args
         self.cluster = cluster
         self._admin_host = admin_host
         self._admin_port = admin_port
         self.logger = logger
+        self.autoscaler = autoscaler
 
         # Register handlers
         self.handlers = {
@@ -64,9 +249,17 @@ class DaskAdminWorker(Thread):
             "cluster_restart": self._cluster_restart,
             "cluster_scale": lambda size: self.cluster.scale(size),
             "cluster_logs": self._get_cluster_logs,
+            "cluster_queue_depth": self._set_queue_depth,
         }
         super().__init__()
 
+    async def _set_queue_depth(self, depth: int):
+        """
+        Record the number of tasks the dispatcher has ready but not yet running
+        """
+        if self.autoscaler:
+            self.autoscaler.set_queue_depth(depth)
+
     async def _cluster_scale(self, size: int):
         self.logger.warning(f"Call reached here, for size {size}")
         self.cluster.scale(size)
@@ -157,6 +350,8 @@ class DaskAdminWorker(Thread):
         s = Server(handlers=self.handlers)
         addr = f"tcp://{self._admin_host}:{self._admin_port}"
         loop.create_task(s.listen(addr))
+        if self.autoscaler:
+            loop.create_task(self.autoscaler.start())
         loop.run_forever()
 
 
@@ -199,6 +394,11 @@ class DaskCluster(Process):
         except KeyError:
             self.logger.warning("Threads per worker not provided, using default = 1")
 
+        try:
+            self.autoscale = get_config("dask.autoscale") == "true"
+        except KeyError:
+            self.autoscale = False
+
     def run(self):
         """
         Runs a local dask cluster along with its monitoring thread
@@ -232,7 +432,22 @@ class DaskCluster(Process):
                 }
             )
 
-            admin = DaskAdminWorker(self.cluster, self.admin_host, self.admin_port, self.logger)
+            autoscaler = None
+            if self.autoscale:
+                autoscaler = DaskAutoscaler(
+                    self.cluster,
+                    min_workers=get_config("dask.min_workers"),
+                    max_workers=get_config("dask.max_workers"),
+                    threads_per_worker=self.threads_per_worker,
+                    interval=get_config("dask.autoscale_interval"),
+                    cooldown=get_config("dask.autoscale_cooldown"),
+                    memory_threshold=get_config("dask.autoscale_memory_threshold"),
+                    logger=self.logger,
+                )
+
+            admin = DaskAdminWorker(
+                self.cluster, self.admin_host, self.admin_port, self.logger, autoscaler
+            )
             admin.start()
         except Exception as e:
             self.logger.exception(e)
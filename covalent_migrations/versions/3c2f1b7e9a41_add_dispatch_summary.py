@@ -0,0 +1,62 @@
+# Copyright 2023 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""add dispatch status counts and search index
+
+Revision ID: 3c2f1b7e9a41
+Revises: de0a6c0a3e3d
+Create Date: 2023-10-19 10:12:41.318904
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+from covalent_dispatcher._db.summary import create_dispatch_summary, drop_dispatch_summary
+
+# revision identifiers, used by Alembic.
+# pragma: allowlist nextline secret
+revision = "3c2f1b7e9a41"
+# pragma: allowlist nextline secret
+down_revision = "de0a6c0a3e3d"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "dispatch_status_counts",
+        sa.Column("status", sa.String(length=24), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.Column("run_time", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("status"),
+    )
+    with op.batch_alter_table("lattices", schema=None) as batch_op:
+        batch_op.create_index(batch_op.f("ix_lattices_started_at"), ["started_at"], unique=False)
+        batch_op.create_index(batch_op.f("ix_lattices_updated_at"), ["updated_at"], unique=False)
+
+    # Triggers on `lattices` are dropped when a batch migration recreates the
+    # table, so later migrations altering it must call this again.
+    create_dispatch_summary(op.get_bind())
+
+
+def downgrade() -> None:
+    drop_dispatch_summary(op.get_bind())
+
+    with op.batch_alter_table("lattices", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_lattices_updated_at"))
+        batch_op.drop_index(batch_op.f("ix_lattices_started_at"))
+
+    op.drop_table("dispatch_status_counts")
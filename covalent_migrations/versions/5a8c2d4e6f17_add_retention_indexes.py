@@ -0,0 +1,56 @@
+# Copyright 2023 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""add indexes used to delete dispatches
+
+Revision ID: 5a8c2d4e6f17
+Revises: 7d1e5a3b2c90
+Create Date: 2023-10-26 09:21:54.207318
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+# pragma: allowlist nextline secret
+revision = "5a8c2d4e6f17"
+# pragma: allowlist nextline secret
+down_revision = "7d1e5a3b2c90"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Plain indexes, so that SQLite does not recreate the tables and drop their triggers
+    op.create_index(op.f("ix_lattices_dispatch_id"), "lattices", ["dispatch_id"], unique=False)
+    op.create_index(
+        op.f("ix_lattices_root_dispatch_id"), "lattices", ["root_dispatch_id"], unique=False
+    )
+    op.create_index(
+        op.f("ix_electrons_parent_lattice_id"), "electrons", ["parent_lattice_id"], unique=False
+    )
+    op.create_index(
+        op.f("ix_electron_dependency_electron_id"),
+        "electron_dependency",
+        ["electron_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_electron_dependency_electron_id"), table_name="electron_dependency")
+    op.drop_index(op.f("ix_electrons_parent_lattice_id"), table_name="electrons")
+    op.drop_index(op.f("ix_lattices_root_dispatch_id"), table_name="lattices")
+    op.drop_index(op.f("ix_lattices_dispatch_id"), table_name="lattices")
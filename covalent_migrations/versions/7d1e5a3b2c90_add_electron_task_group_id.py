@@ -0,0 +1,43 @@
+# Copyright 2023 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""add task group id to electrons
+
+Revision ID: 7d1e5a3b2c90
+Revises: 3c2f1b7e9a41
+Create Date: 2023-10-24 14:37:09.512663
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+# pragma: allowlist nextline secret
+revision = "7d1e5a3b2c90"
+# pragma: allowlist nextline secret
+down_revision = "3c2f1b7e9a41"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("electrons", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("task_group_id", sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("electrons", schema=None) as batch_op:
+        batch_op.drop_column("task_group_id")
@@ -16,14 +16,8 @@
 
 """Fastapi init"""
 
-import fcntl
-import os
-import pty
-import select
-import signal
-import struct
-import subprocess
-import termios
+import inspect
+from typing import Dict, List
 
 import socketio
 from fastapi import FastAPI, HTTPException, Request
@@ -34,11 +28,18 @@ from fastapi.responses import JSONResponse
 
 from covalent._shared_files import logger
 from covalent._shared_files.config import get_config
+from covalent_ui.api.v1.data_layer.graph_dal import graph_cache
 from covalent_ui.api.v1.routes import routes
+from covalent_ui.api.v1.utils.file_handle import FileReadTimeoutError, FileTooLargeError
+from covalent_ui.event_bus import get_event_bus
 from covalent_ui.heartbeat import lifespan
+from covalent_ui.terminal import TerminalSession
 
-file_descriptor = None
-child_process_id = None
+# Map of socket id -> terminal session of the client
+terminal_sessions: Dict[str, TerminalSession] = {}
+
+# Seconds to wait for a client to acknowledge terminal output before sending more
+TERMINAL_ACK_TIMEOUT = 5
 
 # Config
 WEBHOOK_PATH = "/api/webhook"
@@ -66,65 +67,41 @@ app.add_middleware(
 )
 
 
-def set_winsize(fd, row, col, xpix=0, ypix=0):
-    winsize = struct.pack("HHHH", row, col, xpix, ypix)
-    fcntl.ioctl(fd, termios.TIOCSWINSZ, winsize)
-
-
-async def read_and_forward_pty_output():
-    max_read_bytes = 1024 * 10
-    while terminal_subprocess:
-        await sio.sleep(0.01)
-        if file_descriptor and terminal_subprocess:
-            timeout_sec = 0
-            (data_ready, _, _) = select.select([file_descriptor], [], [], timeout_sec)
-            if data_ready:
-                output = os.read(file_descriptor, max_read_bytes).decode()
-                await sio.emit("pty-output", {"output": output})
-
-
-async def disconnect_terminal():
-    global terminal_subprocess
-    terminal_subprocess = False
-    os.killpg(child_process_id, signal.SIGKILL)
-    await sio.sleep(0.01)
-
-
 @sio.on("pty-input")
 def pty_input(sid, data):
     """write to the child pty. The pty sees this as if you are typing in a real
     terminal.
     """
-    if file_descriptor:
-        os.write(file_descriptor, data["input"].encode())
+    if sid in terminal_sessions:
+        terminal_sessions[sid].write(data["input"])
 
 
 @sio.on("resize")
 def resize(sid, data):
-    if file_descriptor:
-        set_winsize(file_descriptor, data["rows"], data["cols"])
+    if sid in terminal_sessions:
+        terminal_sessions[sid].resize(data["rows"], data["cols"])
 
 
 @sio.on("start_terminal")
-async def on_start_start_terminal(*args):
-    global terminal_subprocess
-    terminal_subprocess = True
-    global child_process_id
-    (child_pid, fd) = pty.fork()
-    if child_pid == 0:
-        subprocess.run([os.environ.get("SHELL", "bash")])
-    else:
-        child_process_id = child_pid
-        global file_descriptor
-        file_descriptor = fd
-        set_winsize(file_descriptor, 50, 50)
-        await sio.start_background_task(read_and_forward_pty_output)
+async def on_start_start_terminal(sid, data=None):
+    """Start a shell for the client, replacing the one it may already have"""
+    if sid in terminal_sessions:
+        await terminal_sessions.pop(sid).close()
+
+    async def emit_output(output: str) -> None:
+        # Wait for the client to acknowledge the output, so that a slow client holds up the shell
+        await sio.call("pty-output", {"output": output}, to=sid, timeout=TERMINAL_ACK_TIMEOUT)
+
+    session = TerminalSession(emit_output)
+    data = data or {}
+    session.start(rows=data.get("rows") or 50, cols=data.get("cols") or 50)
+    terminal_sessions[sid] = session
 
 
 @sio.on("disconnect")
 async def disconnect(sid):
-    if file_descriptor is not None:
-        await disconnect_terminal()
+    if sid in terminal_sessions:
+        await terminal_sessions.pop(sid).close()
 
 
 @app.exception_handler(RequestValidationError)
@@ -143,9 +120,81 @@ async def http_exception_handler(request, exc: HTTPException):
     )
 
 
+@app.exception_handler(FileReadTimeoutError)
+async def file_read_timeout_handler(request: Request, exc: FileReadTimeoutError):
+    return JSONResponse(
+        status_code=504,
+        content=jsonable_encoder({"detail": [{"msg": str(exc)}]}),
+    )
+
+
+@app.exception_handler(FileTooLargeError)
+async def file_too_large_handler(request: Request, exc: FileTooLargeError):
+    return JSONResponse(
+        status_code=413,
+        content=jsonable_encoder({"detail": [{"msg": str(exc)}]}),
+    )
+
+
+@sio.on("subscribe")
+async def subscribe(sid, data):
+    """Receive the node updates of a dispatch"""
+    entered = sio.enter_room(sid, data["dispatch_id"])
+    if inspect.isawaitable(entered):
+        await entered
+
+
+@sio.on("unsubscribe")
+async def unsubscribe(sid, data):
+    """Stop receiving the node updates of a dispatch"""
+    left = sio.leave_room(sid, data["dispatch_id"])
+    if inspect.isawaitable(left):
+        await left
+
+
+async def emit_result_updates(updates: List[Dict]) -> None:
+    """Forward a batch of result updates to all clients and node updates to dispatch rooms"""
+    for update in updates:
+        graph_cache.invalidate(update["dispatch_id"])
+        if "result" in update:
+            await sio.emit("result-update", {"event": "result-update", "result": update["result"]})
+        if update["nodes"]:
+            await sio.emit(
+                "node-updates",
+                {"dispatch_id": update["dispatch_id"], "nodes": update["nodes"]},
+                room=update["dispatch_id"],
+            )
+
+
+async def forward_bus_events() -> None:
+    """Forward events published by the dispatcher running in this process to the clients"""
+    event_bus = get_event_bus()
+    queue = event_bus.subscribe()
+    try:
+        while True:
+            event, payload = await queue.get()
+            try:
+                if event == "result-updates":
+                    await emit_result_updates(payload["updates"])
+                elif event == "draw-request":
+                    await sio.emit("draw_request", payload)
+            except Exception as ex:
+                app_log.exception(f"Unable to forward {event} event: {ex}")
+    finally:
+        event_bus.unsubscribe(queue)
+
+
 @app.post(WEBHOOK_PATH)
 async def handle_result_update(result_update: dict):
-    await sio.emit("result-update", result_update)
+    if result_update.get("event") != "result-updates":
+        result = result_update.get("result")
+        if isinstance(result, dict) and "dispatch_id" in result:
+            graph_cache.invalidate(result["dispatch_id"])
+        await sio.emit("result-update", result_update)
+        return {"ok": True}
+
+    # Batch of updates sent by the update publisher of a dispatcher in another process
+    await emit_result_updates(result_update["updates"])
     return {"ok": True}
 
 
@@ -14,29 +14,31 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import codecs
-import pickle
 import uuid
 from datetime import timedelta
 from pathlib import Path
+from typing import List, Optional, Tuple
 
-from fastapi import HTTPException
-from fastapi.responses import JSONResponse
 from sqlalchemy import extract, select
+from sqlalchemy.orm import aliased
 from sqlalchemy.sql import func
 
-from covalent._results_manager.results_manager import get_result
 from covalent._shared_files import logger
 from covalent._shared_files.config import get_config
 from covalent._shared_files.qelectron_utils import QE_DB_DIRNAME
-from covalent.quantum.qserver.database import Database
-from covalent_dispatcher._core.execution import _get_task_inputs as get_task_inputs
-from covalent_dispatcher._service.app import get_result
+from covalent.quantum.qserver.database import Database, get_job_metadata
 from covalent_ui.api.v1.data_layer.lattice_dal import Lattices
 from covalent_ui.api.v1.database.schema.electron import Electron
+from covalent_ui.api.v1.database.schema.electron_dependency import ElectronDependency
 from covalent_ui.api.v1.database.schema.lattices import Lattice
 from covalent_ui.api.v1.models.electrons_model import JobDetailsResponse, JobsResponse
-from covalent_ui.api.v1.utils.file_handle import validate_data
+from covalent_ui.api.v1.utils.file_handle import (
+    FileHandler,
+    FileReadError,
+    preview_cache,
+    run_file_read,
+    validate_data,
+)
 from covalent_ui.api.v1.utils.models_helper import JobsSortBy, SortDirection
 
 app_log = logger.app_log
@@ -79,6 +81,7 @@ class Electrons:
         sort_direction: SortDirection,
         count,
         offset,
+        cursor=None,
     ) -> JobsResponse:
         try:
             jobs_response = JobsResponse()
@@ -90,11 +93,22 @@ class Electrons:
             if not validated:
                 return jobs_response
             try:
-                jobs = _qelectron_get_db(str(dispatch_id), electron_id)
-                if not jobs:
+                jobs, next_cursor = run_file_read(
+                    _qelectron_get_jobs,
+                    dispatch_id=str(dispatch_id),
+                    node_id=electron_id,
+                    sort_by=sort_by,
+                    sort_direction=sort_direction,
+                    count=count,
+                    offset=offset,
+                    cursor=cursor,
+                )
+                if not jobs and cursor is None and not offset:
                     jobs_response.data = []
                     jobs_response.msg = f"Job details for {dispatch_id} dispatch with {electron_id} node do not exist."
                     return jobs_response
+            except FileReadError:
+                raise
             except Exception as exc:
                 app_log.debug(f"Unable to process get jobs \n {exc}")
                 jobs_response.data = []
@@ -102,28 +116,12 @@ class Electrons:
                     f"Jobs for {dispatch_id} dispatch with {electron_id} node do not exist."
                 )
                 return jobs_response
-            jobs_list = list(
-                map(
-                    lambda circuit: {
-                        "job_id": circuit["circuit_id"],
-                        "start_time": circuit["save_time"],
-                        "executor": circuit["result_metadata"]["executor_name"],
-                        "status": "COMPLETED"
-                        if len(circuit["result"]) != 0 and len(circuit["result_metadata"]) != 0
-                        else "RUNNING",
-                    },
-                    jobs.values(),
-                )
-            )
-            jobs_list.sort(
-                reverse=sort_direction == SortDirection.DESCENDING, key=lambda d: d[sort_by.value]
-            )
-            result = (
-                jobs_list[offset : count + offset] if count is not None else jobs_list[offset:]
-            )
 
-            jobs_response.data = result
+            jobs_response.next_cursor = next_cursor
+            jobs_response.data = jobs
             return jobs_response
+        except FileReadError:
+            raise
         except Exception as exc:
             app_log.debug(f"Unable to process get jobs \n {exc}")
             jobs_response.msg = "Something went wrong. Please check the log."
@@ -141,8 +139,14 @@ class Electrons:
             if not validated:
                 return job_detail_response
             try:
-                jobs = _qelectron_get_db(dispatch_id=str(dispatch_id), node_id=electron_id)
-                selected_job = jobs[job_id]
+                selected_job = run_file_read(
+                    _qelectron_get_job,
+                    dispatch_id=str(dispatch_id),
+                    node_id=electron_id,
+                    job_id=job_id,
+                )
+            except FileReadError:
+                raise
             except Exception as exc:
                 app_log.debug(f"Unable to process get jobs \n {exc}")
                 job_detail_response.data = []
@@ -230,6 +234,8 @@ class Electrons:
             job_detail_response.data = job_overview
             job_detail_response.msg = ""
             return job_detail_response
+        except FileReadError:
+            raise
         except Exception as exc:
             app_log.debug(f"Unable to process get job details \n {exc}")
             job_detail_response.msg = "Something went wrong. Please check the log."
@@ -292,17 +298,12 @@ class Electrons:
     def get_total_quantum_calls(self, dispatch_id, node_id, is_qa_electron: bool):
         if not is_qa_electron:
             return None
-        qdb_path = _path_to_qelectron_db(dispatch_id=str(dispatch_id))
-        return len(
-            Database(qdb_path).get_circuit_ids(dispatch_id=str(dispatch_id), node_id=node_id)
-        )
+        return run_file_read(_qelectron_total_calls, str(dispatch_id), node_id)
 
     def get_avg_quantum_calls(self, dispatch_id, node_id, is_qa_electron: bool):
         if not is_qa_electron:
             return None
-        jobs = _qelectron_get_db(dispatch_id=str(dispatch_id), node_id=node_id)
-        time = [jobs[value]["execution_time"] for value in jobs]
-        return sum(time) / len(time)
+        return run_file_read(_qelectron_avg_calls, str(dispatch_id), node_id)
 
     def get_electron_inputs(self, dispatch_id: uuid.UUID, electron_id: int) -> str:
         """
@@ -311,18 +312,46 @@ class Electrons:
             dispatch_id: Dispatch id of lattice/sublattice
             electron_id: Transport graph node id of a electron
         Returns:
-            Returns the inputs data from Result object
+            Returns the inputs data rendered from the outputs of the parent electrons
         """
 
-        result = get_result(dispatch_id=str(dispatch_id), wait=False)
-        if isinstance(result, JSONResponse) and result.status_code == 404:
-            raise HTTPException(status_code=400, detail=result)
-        result_object = pickle.loads(codecs.decode(result["result"].encode(), "base64"))
-        electron_result = self.get_electrons_id(dispatch_id, electron_id)
-        inputs = get_task_inputs(
-            node_id=electron_id, node_name=electron_result.name, result_object=result_object
+        parent = aliased(Electron)
+        edges = (
+            self.db_con.query(
+                ElectronDependency.parameter_type,
+                ElectronDependency.arg_index,
+                ElectronDependency.edge_name,
+                parent.storage_path,
+                parent.results_filename,
+            )
+            .join(Electron, Electron.id == ElectronDependency.electron_id)
+            .join(Lattice, Lattice.id == Electron.parent_lattice_id)
+            .join(parent, parent.id == ElectronDependency.parent_electron_id)
+            .filter(
+                Lattice.dispatch_id == str(dispatch_id),
+                Electron.transport_graph_node_id == electron_id,
+                ElectronDependency.is_active.is_not(False),
+                ElectronDependency.parameter_type.in_(["arg", "kwarg"]),
+            )
+            .all()
         )
-        return validate_data(inputs)
+        args = sorted(
+            (edge for edge in edges if edge.parameter_type == "arg"), key=lambda e: e.arg_index
+        )
+        kwargs = [edge for edge in edges if edge.parameter_type == "kwarg"]
+
+        def _read_output(edge):
+            return FileHandler(edge.storage_path).read_object(edge.results_filename)
+
+        def _render():
+            inputs = {
+                "args": [_read_output(edge) for edge in args],
+                "kwargs": {edge.edge_name: _read_output(edge) for edge in kwargs},
+            }
+            return validate_data(inputs)
+
+        paths = [f"{edge.storage_path}/{edge.results_filename}" for edge in args + kwargs]
+        return preview_cache.get(f"inputs:{dispatch_id}:{electron_id}", paths, _render)
 
 
 def _path_to_qelectron_db(dispatch_id: str) -> Path:
@@ -342,3 +371,74 @@ def _qelectron_get_db(dispatch_id: str, node_id: int) -> dict:
     """Return the QElectron jobs dictionary for a given node."""
     qdb_path = _path_to_qelectron_db(dispatch_id)
     return Database(qdb_path).get_db(dispatch_id=dispatch_id, node_id=node_id)
+
+
+def _qelectron_total_calls(dispatch_id: str, node_id: int) -> int:
+    """Return the number of circuits executed by a given node."""
+    database = Database(_path_to_qelectron_db(dispatch_id))
+    summary = database.get_summary(dispatch_id=dispatch_id, node_id=node_id)
+    if summary is not None:
+        return summary["num_circuits"]
+    return len(database.get_circuit_ids(dispatch_id=dispatch_id, node_id=node_id))
+
+
+def _qelectron_avg_calls(dispatch_id: str, node_id: int) -> float:
+    """
+    Return the average execution time of the circuits executed by a given node,
+    or 0 if it has not executed any.
+    """
+    database = Database(_path_to_qelectron_db(dispatch_id))
+    summary = database.get_summary(dispatch_id=dispatch_id, node_id=node_id)
+    if summary is not None:
+        total_time, num_circuits = summary["total_execution_time"], summary["num_circuits"]
+    else:
+        jobs = _qelectron_get_db(dispatch_id=dispatch_id, node_id=node_id)
+        time = [jobs[value]["execution_time"] for value in jobs]
+        total_time, num_circuits = sum(time), len(time)
+
+    return total_time / num_circuits if num_circuits else 0
+
+
+def _qelectron_get_jobs(
+    dispatch_id: str,
+    node_id: int,
+    sort_by: JobsSortBy,
+    sort_direction: SortDirection,
+    count: Optional[int],
+    offset: int,
+    cursor: Optional[str] = None,
+) -> Tuple[List[dict], Optional[str]]:
+    """
+    Return a page of lightweight QElectron job records for a given node and the
+    cursor of the next page, if any. Cursors are only returned for jobs sorted by
+    start time; other orders are paginated with `offset` alone.
+    """
+    database = Database(_path_to_qelectron_db(dispatch_id))
+    descending = sort_direction == SortDirection.DESCENDING
+
+    if database.get_summary(dispatch_id=dispatch_id, node_id=node_id) is None:
+        # Databases written before jobs were indexed.
+        jobs = [
+            get_job_metadata(circuit_id, record)
+            for circuit_id, record in _qelectron_get_db(dispatch_id, node_id).items()
+        ]
+    elif sort_by == JobsSortBy.START_TIME:
+        limit = None if count is None else offset + count
+        jobs, next_cursor = database.get_jobs(
+            cursor, limit, descending, dispatch_id=dispatch_id, node_id=node_id
+        )
+        return jobs[offset:], next_cursor
+    else:
+        jobs, _ = database.get_jobs(dispatch_id=dispatch_id, node_id=node_id)
+
+    jobs.sort(reverse=descending, key=lambda d: d[sort_by.value])
+    return (jobs[offset : count + offset] if count is not None else jobs[offset:]), None
+
+
+def _qelectron_get_job(dispatch_id: str, node_id: int, job_id: str) -> dict:
+    """Return the full QElectron job record for a given node and job."""
+    qdb_path = _path_to_qelectron_db(dispatch_id)
+    job = Database(qdb_path).get(job_id, dispatch_id=dispatch_id, node_id=node_id)
+    if job is None:
+        raise KeyError(job_id)
+    return job
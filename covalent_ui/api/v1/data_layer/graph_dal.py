@@ -15,14 +15,93 @@
 # limitations under the License.
 
 """Graph Data Layer"""
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Union
 from uuid import UUID
 
-from sqlalchemy import text
-from sqlalchemy.orm import Session
+from sqlalchemy import func, text
+from sqlalchemy.orm import Session, aliased
 
 from covalent_ui.api.v1.database.schema.electron import Electron
 from covalent_ui.api.v1.database.schema.electron_dependency import ElectronDependency
 from covalent_ui.api.v1.database.schema.lattices import Lattice
+from covalent_ui.api.v1.utils.models_helper import GraphGroupBy
+
+# Maximum number of graph summaries and groups kept in memory
+GRAPH_CACHE_SIZE = 128
+
+# Expressions of the group of a node in `get_nodes`
+_GROUP_SQL = {
+    GraphGroupBy.NAME: "electrons.name",
+    GraphGroupBy.TASK_GROUP: (
+        "coalesce(electrons.task_group_id, electrons.transport_graph_node_id)"
+    ),
+}
+
+
+def _group_column(electron, group_by: GraphGroupBy):
+    if group_by == GraphGroupBy.TASK_GROUP:
+        return func.coalesce(electron.task_group_id, electron.transport_graph_node_id)
+    return electron.name
+
+
+def _earliest(*timestamps):
+    return min((timestamp for timestamp in timestamps if timestamp is not None), default=None)
+
+
+def _latest(*timestamps):
+    return max((timestamp for timestamp in timestamps if timestamp is not None), default=None)
+
+
+class GraphCache:
+    """LRU cache of the graph views of dispatches.
+
+    Views are keyed by dispatch id and level of detail, and all the views of a
+    dispatch are dropped when the status of the dispatch or its nodes changes.
+    A view being built while its dispatch is invalidated is not cached."""
+
+    def __init__(self, maxsize: int = GRAPH_CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self._views = OrderedDict()
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, dispatch_id: str, level: Hashable, build: Callable[[], Any]) -> Any:
+        """Return the view `level` of a dispatch, calling `build` on a miss.
+        Views which are None are not cached."""
+        key = (dispatch_id, level)
+        with self._lock:
+            if key in self._views:
+                self._views.move_to_end(key)
+                return self._views[key]
+            generation = self._generations.get(dispatch_id, 0)
+
+        view = build()
+        if view is None:
+            return view
+
+        with self._lock:
+            if self._generations.get(dispatch_id, 0) == generation:
+                self._views[key] = view
+                while len(self._views) > self.maxsize:
+                    self._views.popitem(last=False)
+        return view
+
+    def invalidate(self, dispatch_id: str) -> None:
+        """Drop the views of a dispatch"""
+        with self._lock:
+            self._generations[dispatch_id] = self._generations.get(dispatch_id, 0) + 1
+            for key in [key for key in self._views if key[0] == dispatch_id]:
+                del self._views[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._views.clear()
+            self._generations.clear()
+
+
+graph_cache = GraphCache()
 
 
 class Graph:
@@ -31,16 +110,28 @@ class Graph:
     def __init__(self, db_con: Session) -> None:
         self.db_con = db_con
 
-    def get_nodes(self, parent_lattice_id: int):
+    def get_nodes(
+        self,
+        parent_lattice_id: int,
+        group_by: Optional[GraphGroupBy] = None,
+        group: Union[str, int, None] = None,
+    ):
         """
         Get nodes from parent_lattice_id
         Args:
             parent_lattice_id: Refers to the parent_lattice_id in electron table
+            group_by: When given, only the nodes of `group` are returned
+            group: Name or task group id of the nodes to return
         Return:
             graph data with list of nodes
         """
+        params = {"a": parent_lattice_id}
+        group_filter = ""
+        if group_by is not None:
+            group_filter = f"and {_GROUP_SQL[group_by]} = :group"
+            params["group"] = group
         sql = text(
-            """SELECT
+            f"""SELECT
             electrons.id as id,
             electrons.name as name,
             electrons.transport_graph_node_id as node_id,
@@ -58,10 +149,10 @@ class Graph:
             END
             ) as sublattice_dispatch_id
             from electrons join lattices on electrons.parent_lattice_id = lattices.id
-            where lattices.id = :a
+            where lattices.id = :a {group_filter}
         """
         )
-        result = self.db_con.execute(sql, {"a": parent_lattice_id}).fetchall()
+        result = self.db_con.execute(sql, params).fetchall()
         return result
 
     def get_links(self, parent_lattice_id: int):
@@ -84,6 +175,7 @@ class Graph:
             )
             .join(Electron, Electron.id == ElectronDependency.electron_id)
             .filter(Electron.parent_lattice_id == parent_lattice_id)
+            .order_by(ElectronDependency.id)
             .all()
         )
 
@@ -107,3 +199,171 @@ class Graph:
             links = self.get_links(parrent_id)
             return {"dispatch_id": str(dispatch_id), "nodes": nodes, "links": links}
         return None
+
+    def _get_parent_lattice_id(self, dispatch_id: UUID) -> Optional[int]:
+        parent_lattice_id = (
+            self.db_con.query(Lattice.id).where(Lattice.dispatch_id == str(dispatch_id)).first()
+        )
+        return parent_lattice_id[0] if parent_lattice_id is not None else None
+
+    def get_groups(self, parent_lattice_id: int, group_by: GraphGroupBy):
+        """
+        Get the groups of nodes of a lattice with their status histograms
+        Args:
+            parent_lattice_id: Refers to the parent_lattice_id in electron table
+            group_by: Whether nodes are grouped by name or task group
+        Return:
+            list of groups ordered by their first node
+        """
+        group_column = _group_column(Electron, group_by)
+        rows = (
+            self.db_con.query(
+                group_column.label("group"),
+                Electron.status,
+                func.count(Electron.id).label("node_count"),
+                func.min(Electron.transport_graph_node_id).label("first_node_id"),
+                func.min(Electron.started_at).label("started_at"),
+                func.max(Electron.completed_at).label("completed_at"),
+            )
+            .filter(Electron.parent_lattice_id == parent_lattice_id)
+            .group_by(group_column, Electron.status)
+            .all()
+        )
+
+        groups = {}
+        for row in rows:
+            group = groups.setdefault(
+                row.group,
+                {
+                    "group": row.group,
+                    "node_count": 0,
+                    "status_counts": {},
+                    "first_node_id": row.first_node_id,
+                    "started_at": row.started_at,
+                    "completed_at": row.completed_at,
+                },
+            )
+            group["node_count"] += row.node_count
+            group["status_counts"][row.status] = row.node_count
+            group["first_node_id"] = min(group["first_node_id"], row.first_node_id)
+            group["started_at"] = _earliest(group["started_at"], row.started_at)
+            group["completed_at"] = _latest(group["completed_at"], row.completed_at)
+        return sorted(groups.values(), key=lambda group: group["first_node_id"])
+
+    def get_group_links(self, parent_lattice_id: int, group_by: GraphGroupBy):
+        """
+        Get the links between the groups of nodes of a lattice
+        Args:
+            parent_lattice_id: Refers to the parent_lattice_id in electron table
+            group_by: Whether nodes are grouped by name or task group
+        Return:
+            list of links between distinct groups with the number of edges they collapse
+        """
+        source, target = aliased(Electron), aliased(Electron)
+        source_group = _group_column(source, group_by)
+        target_group = _group_column(target, group_by)
+        rows = (
+            self.db_con.query(
+                source_group.label("source"),
+                target_group.label("target"),
+                func.count(ElectronDependency.id).label("edge_count"),
+            )
+            .join(target, target.id == ElectronDependency.electron_id)
+            .join(source, source.id == ElectronDependency.parent_electron_id)
+            .filter(target.parent_lattice_id == parent_lattice_id)
+            .group_by(source_group, target_group)
+            .all()
+        )
+        return [
+            {"source": row.source, "target": row.target, "edge_count": row.edge_count}
+            for row in rows
+            if row.source != row.target
+        ]
+
+    def get_links_of_group(
+        self, parent_lattice_id: int, group_by: GraphGroupBy, group: Union[str, int]
+    ):
+        """
+        Get the links from and to the nodes of a group
+        Args:
+            parent_lattice_id: Refers to the parent_lattice_id in electron table
+            group_by: Whether nodes are grouped by name or task group
+            group: Name or task group id of the nodes
+        Return:
+            list of links with the groups of their source and target nodes
+        """
+        source, target = aliased(Electron), aliased(Electron)
+        source_group = _group_column(source, group_by)
+        target_group = _group_column(target, group_by)
+        return (
+            self.db_con.query(
+                ElectronDependency.edge_name,
+                ElectronDependency.parameter_type,
+                ElectronDependency.electron_id.label("target"),
+                ElectronDependency.parent_electron_id.label("source"),
+                ElectronDependency.arg_index,
+                source_group.label("source_group"),
+                target_group.label("target_group"),
+            )
+            .join(target, target.id == ElectronDependency.electron_id)
+            .join(source, source.id == ElectronDependency.parent_electron_id)
+            .filter(
+                target.parent_lattice_id == parent_lattice_id,
+                (source_group == group) | (target_group == group),
+            )
+            .all()
+        )
+
+    def get_graph_summary(self, dispatch_id: UUID, group_by: GraphGroupBy):
+        """
+        Get the graph of a dispatch with its nodes collapsed into groups
+        When dispatch id passed to get the summary
+            Group the nodes of the lattice by name or task group
+            Count the links between distinct groups
+        Args:
+            dispatch_id: Refers to the dispatch id from lattices table
+            group_by: Whether nodes are grouped by name or task group
+        Return:
+            graph summary with list of groups and links, cached until the dispatch changes
+        """
+
+        def build():
+            parent_lattice_id = self._get_parent_lattice_id(dispatch_id)
+            if parent_lattice_id is None:
+                return None
+            return {
+                "dispatch_id": str(dispatch_id),
+                "group_by": group_by.value,
+                "groups": self.get_groups(parent_lattice_id, group_by),
+                "links": self.get_group_links(parent_lattice_id, group_by),
+            }
+
+        return graph_cache.get(str(dispatch_id), ("summary", group_by.value), build)
+
+    def get_graph_group(self, dispatch_id: UUID, group_by: GraphGroupBy, group: Union[str, int]):
+        """
+        Get the nodes of a group of the graph of a dispatch and their links
+        When dispatch id passed to expand a group
+            Get the nodes of the group from Electrons table
+            Get the links from and to the group from Electron dependency table
+        Args:
+            dispatch_id: Refers to the dispatch id from lattices table
+            group_by: Whether nodes are grouped by name or task group
+            group: Name or task group id of the nodes
+        Return:
+            graph data with list of nodes and links, cached until the dispatch changes
+        """
+
+        def build():
+            parent_lattice_id = self._get_parent_lattice_id(dispatch_id)
+            if parent_lattice_id is None:
+                return None
+            return {
+                "dispatch_id": str(dispatch_id),
+                "group_by": group_by.value,
+                "group": group,
+                "nodes": self.get_nodes(parent_lattice_id, group_by, group),
+                "links": self.get_links_of_group(parent_lattice_id, group_by, group),
+            }
+
+        return graph_cache.get(str(dispatch_id), ("group", group_by.value, group), build)
@@ -14,15 +14,28 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import os
-import re
-from datetime import datetime
 
-from fastapi.responses import Response
+from fastapi.responses import StreamingResponse
 
 from covalent._shared_files.config import get_config
+from covalent_ui.api.v1.utils.log_index import get_log_index
 
 UI_LOGFILE = get_config("user_interface.log_dir") + "/covalent_ui.log"
 
+# Size of the chunks of the log sent by the download endpoint
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+def _read_chunks(path: str, size: int):
+    """Read the first `size` bytes of a file in chunks"""
+    with open(path, "rb") as file:
+        while size > 0:
+            chunk = file.read(min(size, DOWNLOAD_CHUNK_SIZE))
+            if not chunk:
+                break
+            size -= len(chunk)
+            yield chunk
+
 
 class Logs:
     """Logs data access layer"""
@@ -31,55 +44,27 @@ class Logs:
         self.config = get_config
 
     def get_logs(self, sort_by, direction, search, count, offset):
-        with open(UI_LOGFILE, "r", encoding="utf-8") as logfile:
-            search.lower()
-            unmatch_str = ""
-            log = []
-            reverse_list = direction.value == "DESC"
-            for i in logfile:
-                split_reg = r"\[(.*)\] \[(TRACE|DEBUG|INFO|NOTICE|WARN|WARNING|ERROR|SEVERE|CRITICAL|FATAL)\]"  # r"\[(.*)\] \[(.*)\] ((.|\n)*)"
-                data = re.split(pattern=split_reg, string=i)
-                if len(data) > 1:
-                    try:
-                        parse_str = datetime.strptime(data[1], "%Y-%m-%d %H:%M:%S,%f")
-                        json_data = {
-                            "log_date": f"{parse_str}",
-                            "status": data[2],
-                            "message": data[3],
-                        }
-                    except ValueError:
-                        json_data = {"log_date": f"{None}", "status": data[2], "message": data[1:]}
-                    log.append(json_data)
-                else:
-                    len_log = len(log)
-                    unmatch_str += i
-                    if len_log > 0 and ((unmatch_str != "")):
-                        msg = log[len_log - 1]["message"] + "\n"
-                        log[len_log - 1]["message"] = msg + unmatch_str
-                        unmatch_str = ""
-                    else:
-                        log.append({"log_date": None, "status": "INFO", "message": unmatch_str})
-                        unmatch_str = ""
-            log = [
-                i
-                for i in log
-                if (i["message"].lower().__contains__(search))
-                or (i["status"].lower().__contains__(search))
-            ]
-            result = sorted(
-                log,
-                key=lambda e: (e[sort_by.value] is not None, e[sort_by.value]),
-                reverse=reverse_list,
-            )
-            total_count = len(result)
-            result = result[offset : count + offset] if count != 0 else log[offset:]
-            return {"items": result, "total_count": total_count}
+        """
+        Get a page of log entries, served from an index of the log file
+        which is updated with the entries logged since the last request.
+        """
+        if not os.path.exists(UI_LOGFILE):
+            return {"items": [], "total_count": 0}
+
+        items, total_count = get_log_index(UI_LOGFILE).get_entries(
+            sort_by=sort_by.value,
+            descending=direction.value == "DESC",
+            search=search,
+            count=count,
+            offset=offset,
+        )
+        return {"items": items, "total_count": total_count}
 
     def download_logs(self):
         """Download logs"""
         data = None
         if os.path.exists(UI_LOGFILE):
-            with open(UI_LOGFILE, "rb") as file:
-                data = file.read().decode("utf-8")
-                return Response(data)
+            # Only stream what was logged so far, since the log keeps growing
+            size = os.path.getsize(UI_LOGFILE)
+            return StreamingResponse(_read_chunks(UI_LOGFILE, size), media_type="text/plain")
         return {"data": data}
@@ -14,16 +14,21 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import base64
+import json
 import uuid
 from datetime import datetime, timezone
-from typing import List
+from typing import Any, Dict, List, Set, Tuple
 
-from sqlalchemy import case, extract, update
+from fastapi import HTTPException
+from sqlalchemy import case, column, extract, text, update
 from sqlalchemy.orm import Session
-from sqlalchemy.sql import desc, func, or_
+from sqlalchemy.sql import and_, desc, func, nullsfirst, nullslast, or_
 from sqlalchemy.util import immutabledict
 
-from covalent_dispatcher._db.models import ElectronDependency
+from covalent_dispatcher._db.models import DispatchStatusCount, ElectronDependency
+from covalent_dispatcher._db.retention import DELETE_BATCH_SIZE
+from covalent_dispatcher._db.summary import SEARCH_TABLE, STATUS_COUNTS_TABLE
 from covalent_ui.api.v1.database.schema.electron import Electron
 from covalent_ui.api.v1.database.schema.lattices import Lattice
 from covalent_ui.api.v1.models.dispatch_model import (
@@ -33,11 +38,40 @@ from covalent_ui.api.v1.models.dispatch_model import (
     DispatchDashBoardResponse,
     DispatchModule,
     DispatchResponse,
+    SortBy,
     SortDirection,
 )
 from covalent_ui.api.v1.utils.status import Status
 
 
+def _runtime():
+    """Run time of a lattice in milliseconds, up to now for running lattices"""
+    return (
+        func.coalesce(
+            extract("epoch", Lattice.completed_at),
+            extract("epoch", func.now()),
+        )
+        - extract("epoch", Lattice.started_at)
+    ) * 1000
+
+
+def _encode_cursor(value: Any, last_id: int) -> str:
+    """Encode the sort key and id of the last lattice of a page as an opaque cursor"""
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    return base64.urlsafe_b64encode(json.dumps([value, last_id]).encode()).decode()
+
+
+def _decode_cursor(cursor: str, sort_by: SortBy) -> Tuple[Any, int]:
+    try:
+        value, last_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if value is not None and sort_by in (SortBy.STARTED, SortBy.ENDED):
+            value = datetime.fromisoformat(value)
+        return value, int(last_id)
+    except Exception as ex:
+        raise HTTPException(status_code=400, detail=[{"msg": "Invalid cursor"}]) from ex
+
+
 class Summary:
     """Summary data access layer"""
 
@@ -45,92 +79,72 @@ class Summary:
         self.db_con = db_con
 
     def get_summary(
-        self, count, offset, sort_by, search, sort_direction, status_filter
+        self, count, offset, sort_by, search, sort_direction, status_filter, cursor=None
     ) -> List[Lattice]:
         """
         Get summary of top most lattices
         Args:
             req.count: number of rows to be selected
-            req.offset: number rows to be skipped
+            req.offset: number rows to be skipped, ignored when a cursor is given
             req.sort_by: sort by field name(run_time, status, started, lattice)
             req.search: search by text
             req.direction: sort by direction ASE, DESC
+            req.status_filter: status of the lattices to select
+            req.cursor: cursor of the page, as returned with the previous page
         Return:
-            List of top most Lattices and count
+            List of top most Lattices, count and the cursor of the next page
         """
-        result = None
 
         status_filters = self.get_filters(status_filter)
+        sort_key = self._get_sort_key(sort_by)
+        descending = sort_direction == SortDirection.DESCENDING
+        summary_tables = self._get_summary_tables()
 
         data = self.db_con.query(
+            Lattice.id.label("id"),
             Lattice.dispatch_id.label("dispatch_id"),
             Lattice.name.label("lattice_name"),
-            (
-                (
-                    func.coalesce(
-                        extract("epoch", Lattice.completed_at),
-                        extract("epoch", func.now()),
-                    )
-                    - extract("epoch", Lattice.started_at)
-                )
-                * 1000
-            ).label("runtime"),
+            _runtime().label("runtime"),
             Lattice.electron_num.label("total_electrons"),
             Lattice.completed_electron_num.label("total_electrons_completed"),
             Lattice.started_at.label("started_at"),
             func.coalesce(Lattice.completed_at, None).label("ended_at"),
             Lattice.status.label("status"),
             Lattice.updated_at.label("updated_at"),
-        ).filter(
-            or_(
-                Lattice.name.ilike(f"%{search}%"),
-                Lattice.dispatch_id.ilike(f"%{search}%"),
-            ),
-            Lattice.status.in_(status_filters),
-            Lattice.is_active.is_not(False),
-            Lattice.electron_id.is_(None),
-        )
+            sort_key.label("sort_key"),
+        ).filter(*self._get_list_filters(search, status_filters, summary_tables))
 
-        if sort_by.value == "status":
-            case_status = case(
-                [
-                    (Lattice.status == Status.NEW_OBJECT.value, 0),
-                    (Lattice.status == Status.RUNNING.value, 1),
-                    (Lattice.status == Status.COMPLETED.value, 2),
-                    (Lattice.status == Status.POSTPROCESSING.value, 3),
-                    (Lattice.status == Status.POSTPROCESSING_FAILED.value, 4),
-                    (Lattice.status == Status.PENDING_POSTPROCESSING.value, 5),
-                    (Lattice.status == Status.FAILED.value, 6),
-                    (Lattice.status == Status.CANCELLED.value, 7),
-                ]
-            )
-            data = data.order_by(
-                desc(case_status) if sort_direction == SortDirection.DESCENDING else case_status
-            )
+        # Ties are broken by id so that the cursor identifies a position in the list
+        if descending:
+            data = data.order_by(nullslast(desc(sort_key)), Lattice.id)
         else:
-            data = data.order_by(
-                desc(sort_by.value)
-                if sort_direction == SortDirection.DESCENDING
-                else sort_by.value
-            )
+            data = data.order_by(nullsfirst(sort_key), Lattice.id)
 
-        results = data.offset(offset).limit(count).all()
+        if cursor is not None:
+            data = data.filter(self._get_keyset_filter(sort_by, sort_key, descending, cursor))
+        else:
+            data = data.offset(offset)
 
-        counter = (
-            self.db_con.query(func.count(Lattice.id))
-            .filter(
-                or_(
-                    Lattice.name.ilike(f"%{search}%"),
-                    Lattice.dispatch_id.ilike(f"%{search}%"),
-                ),
-                Lattice.status.in_(status_filters),
-                Lattice.is_active.is_not(False),
-                Lattice.electron_id.is_(None),
+        results = data.limit(count).all()
+
+        next_cursor = None
+        if len(results) == count:
+            next_cursor = _encode_cursor(results[-1].sort_key, results[-1].id)
+
+        if not search and STATUS_COUNTS_TABLE in summary_tables:
+            counts = self._get_status_counts(summary_tables)
+            total_count = sum(counts[status]["count"] for status in status_filters)
+        else:
+            total_count = (
+                self.db_con.query(func.count(Lattice.id))
+                .filter(*self._get_list_filters(search, status_filters, summary_tables))
+                .scalar()
             )
-            .first()
-        )
+
         return DispatchResponse(
-            items=[DispatchModule.from_orm(result) for result in results], total_count=counter[0]
+            items=[DispatchModule.from_orm(result) for result in results],
+            total_count=total_count,
+            next_cursor=next_cursor,
         )
 
     def get_summary_overview(self) -> Lattice:
@@ -145,30 +159,7 @@ class Summary:
             Total dispatcher duration
         """
 
-        total_jobs_running = self.db_con.query(
-            (func.count(Lattice.id))
-            .filter(
-                Lattice.status == "RUNNING",
-                Lattice.is_active.is_not(False),
-                Lattice.electron_id.is_(None),
-            )
-            .label("total_jobs_running")
-        ).first()
-
-        total_jobs_done = self.db_con.query(
-            (func.count(Lattice.id))
-            .filter(
-                or_(
-                    Lattice.status == "COMPLETED",
-                    Lattice.status == "POSTPROCESSING",
-                    Lattice.status == "POSTPROCESSING_FAILED",
-                    Lattice.status == "PENDING_POSTPROCESSING",
-                ),
-                Lattice.is_active.is_not(False),
-                Lattice.electron_id.is_(None),
-            )
-            .label("total_jobs_done")
-        ).first()
+        counts = self._get_status_counts(self._get_summary_tables())
 
         last_ran_job_status = (
             self.db_con.query(Lattice.status)
@@ -177,69 +168,156 @@ class Summary:
             .first()
         )
 
-        run_time = (
-            self.db_con.query(
-                (
+        return DispatchDashBoardResponse(
+            total_jobs_running=counts[Status.RUNNING.value]["count"],
+            total_jobs_completed=sum(
+                counts[status]["count"] for status in self.get_filters(Status.COMPLETED)
+            ),
+            latest_running_task_status=last_ran_job_status[0]
+            if last_ran_job_status is not None
+            else None,
+            total_dispatcher_duration=sum(status["run_time"] for status in counts.values()),
+            total_jobs_failed=counts[Status.FAILED.value]["count"],
+            total_jobs_cancelled=counts[Status.CANCELLED.value]["count"],
+            total_jobs_new_object=counts[Status.NEW_OBJECT.value]["count"],
+            total_jobs=sum(status["count"] for status in counts.values()),
+        )
+
+    def _get_summary_tables(self) -> Set[str]:
+        """Return the summary tables maintained by the database, if any"""
+        if self.db_con.get_bind().dialect.name != "sqlite":
+            return set()
+        rows = self.db_con.execute(
+            text("SELECT name FROM sqlite_master WHERE name IN (:counts, :search)"),
+            {"counts": STATUS_COUNTS_TABLE, "search": SEARCH_TABLE},
+        )
+        return {row[0] for row in rows}
+
+    def _get_status_counts(self, summary_tables: Set[str]) -> Dict[str, Dict[str, int]]:
+        """
+        Number and total run time of the active dispatches by status, read from the
+        status counts table when the database maintains it
+        """
+        if STATUS_COUNTS_TABLE in summary_tables:
+            rows = self.db_con.query(
+                DispatchStatusCount.status, DispatchStatusCount.count, DispatchStatusCount.run_time
+            ).all()
+        else:
+            rows = (
+                self.db_con.query(
+                    Lattice.status,
+                    func.count(Lattice.id),
                     func.sum(
                         extract("epoch", Lattice.completed_at)
                         - extract("epoch", Lattice.started_at)
                     )
-                    * 1000
-                ).label("run_time")
+                    * 1000,
+                )
+                .filter(Lattice.is_active.is_not(False), Lattice.electron_id.is_(None))
+                .group_by(Lattice.status)
+                .all()
             )
-            .filter(Lattice.is_active.is_not(False), Lattice.electron_id.is_(None))
-            .first()
-        )
 
-        total_failed = self.db_con.query(
-            (func.count(Lattice.id))
-            .filter(
-                Lattice.status == "FAILED",
-                Lattice.is_active.is_not(False),
-                Lattice.electron_id.is_(None),
-            )
-            .label("total_jobs_failed")
-        ).first()
+        counts = {status.value: {"count": 0, "run_time": 0} for status in Status}
+        for status, count, run_time in rows:
+            counts[status] = {"count": count, "run_time": int(run_time or 0)}
+        return counts
 
-        total_jobs = self.db_con.query(
-            (func.count(Lattice.id))
-            .filter(Lattice.is_active.is_not(False), Lattice.electron_id.is_(None))
-            .label("total_jobs")
-        ).first()
-
-        total_jobs_cancelled = self.db_con.query(
-            (func.count(Lattice.id))
-            .filter(
-                Lattice.status == "CANCELLED",
-                Lattice.is_active.is_not(False),
-                Lattice.electron_id.is_(None),
+    def _get_list_filters(self, search, status_filters, summary_tables) -> list:
+        filters = [
+            Lattice.status.in_(status_filters),
+            Lattice.is_active.is_not(False),
+            Lattice.electron_id.is_(None),
+        ]
+        if not search:
+            return filters
+
+        # The trigram index only matches literal substrings of at least 3 characters
+        if SEARCH_TABLE in summary_tables and len(search) >= 3 and not set(search) & set("%_"):
+            phrase = '"' + search.replace('"', '""') + '"'
+            matches = text(
+                f"SELECT rowid FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH :phrase"
+            ).bindparams(phrase=phrase)
+            filters.append(Lattice.id.in_(matches.columns(column("rowid"))))
+        else:
+            filters.append(
+                or_(
+                    Lattice.name.ilike(f"%{search}%"),
+                    Lattice.dispatch_id.ilike(f"%{search}%"),
+                )
             )
-            .label("total_jobs_cancelled")
-        ).first()
-
-        total_jobs_new_object = self.db_con.query(
-            (func.count(Lattice.id))
-            .filter(
-                Lattice.status == "NEW_OBJECT",
-                Lattice.is_active.is_not(False),
-                Lattice.electron_id.is_(None),
+        return filters
+
+    def _get_sort_key(self, sort_by: SortBy):
+        if sort_by == SortBy.STATUS:
+            return case(
+                [
+                    (Lattice.status == Status.NEW_OBJECT.value, 0),
+                    (Lattice.status == Status.RUNNING.value, 1),
+                    (Lattice.status == Status.COMPLETED.value, 2),
+                    (Lattice.status == Status.POSTPROCESSING.value, 3),
+                    (Lattice.status == Status.POSTPROCESSING_FAILED.value, 4),
+                    (Lattice.status == Status.PENDING_POSTPROCESSING.value, 5),
+                    (Lattice.status == Status.FAILED.value, 6),
+                    (Lattice.status == Status.CANCELLED.value, 7),
+                ]
             )
-            .label("total_jobs_new_object")
-        ).first()
+        return {
+            SortBy.RUNTIME: _runtime(),
+            SortBy.STARTED: Lattice.started_at,
+            SortBy.LATTICE_NAME: Lattice.name,
+            SortBy.ENDED: Lattice.completed_at,
+        }[sort_by]
 
-        run_time = 0 if run_time is None else run_time
-        return DispatchDashBoardResponse(
-            total_jobs_running=total_jobs_running[0],
-            total_jobs_completed=total_jobs_done[0],
-            latest_running_task_status=last_ran_job_status[0]
-            if last_ran_job_status is not None
-            else None,
-            total_dispatcher_duration=run_time[0] if run_time is not None else 0,
-            total_jobs_failed=total_failed[0],
-            total_jobs_cancelled=total_jobs_cancelled[0],
-            total_jobs_new_object=total_jobs_new_object[0],
-            total_jobs=total_jobs[0],
-        )
+    def _get_keyset_filter(self, sort_by: SortBy, sort_key, descending: bool, cursor: str):
+        """
+        Select the lattices after the cursor in the order of `(sort_key, id)`, where
+        NULL sort keys come first in ascending order and ties are in ascending id
+        """
+        value, last_id = _decode_cursor(cursor, sort_by)
+        if value is None:
+            after_null = and_(sort_key.is_(None), Lattice.id > last_id)
+            return after_null if descending else or_(after_null, sort_key.is_not(None))
+
+        after = sort_key < value if descending else sort_key > value
+        keyset = or_(after, and_(sort_key == value, Lattice.id > last_id))
+        return or_(keyset, sort_key.is_(None)) if descending else keyset
+
+    def _deactivate_lattices(self, lattice_ids: List[int]) -> None:
+        """
+        Soft delete lattices together with their electrons and electron dependencies
+        with one statement per table for every `DELETE_BATCH_SIZE` lattices
+        Args:
+            lattice_ids: Ids of the lattices to delete
+        """
+        now = datetime.now(timezone.utc)
+        no_sync = immutabledict({"synchronize_session": False})
+        for start in range(0, len(lattice_ids), DELETE_BATCH_SIZE):
+            chunk = lattice_ids[start : start + DELETE_BATCH_SIZE]
+            electron_ids = (
+                self.db_con.query(Electron.id)
+                .filter(Electron.parent_lattice_id.in_(chunk))
+                .scalar_subquery()
+            )
+            self.db_con.execute(
+                update(ElectronDependency)
+                .where(ElectronDependency.parent_electron_id.in_(electron_ids))
+                .values({ElectronDependency.updated_at: now, ElectronDependency.is_active: False}),
+                execution_options=no_sync,
+            )
+            self.db_con.execute(
+                update(Electron)
+                .where(Electron.parent_lattice_id.in_(chunk))
+                .values({Electron.updated_at: now, Electron.is_active: False}),
+                execution_options=no_sync,
+            )
+            self.db_con.execute(
+                update(Lattice)
+                .where(Lattice.id.in_(chunk))
+                .values({Lattice.updated_at: now, Lattice.is_active: False}),
+                execution_options=no_sync,
+            )
+        self.db_con.commit()
 
     def delete_dispatches(self, data: DeleteDispatchesRequest):
         """
@@ -258,68 +336,28 @@ class Summary:
                 failure_items=failure,
                 message=message,
             )
-        for dispatch_id in data.dispatches:
-            try:
-                lattice_id = (
-                    self.db_con.query(Lattice.id)
-                    .filter(
-                        Lattice.dispatch_id == str(dispatch_id),
-                        Lattice.is_active.is_not(False),
-                    )
-                    .first()
-                )
-                if lattice_id is None:
-                    failure.append(dispatch_id)
-                    continue
-                electron_ids = (
-                    self.db_con.query(Electron.id)
-                    .filter(
-                        Electron.parent_lattice_id == lattice_id[0],
-                        Electron.is_active.is_not(False),
-                    )
-                    .scalar_subquery()
-                )
-
-                update_electron_dependency = (
-                    update(ElectronDependency)
-                    .where(ElectronDependency.parent_electron_id.in_(electron_ids))
-                    .values(
-                        {
-                            ElectronDependency.updated_at: datetime.now(timezone.utc),
-                            ElectronDependency.is_active: False,
-                        }
-                    )
-                )
-                self.db_con.execute(
-                    update_electron_dependency,
-                    execution_options=immutabledict({"synchronize_session": "fetch"}),
-                )
-                update_electron = (
-                    update(Electron)
-                    .where(Electron.parent_lattice_id == lattice_id[0])
-                    .values(
-                        {
-                            Electron.updated_at: datetime.now(timezone.utc),
-                            Electron.is_active: False,
-                        }
-                    )
-                )
-                self.db_con.execute(update_electron)
-
-                update_lattice = (
-                    update(Lattice)
-                    .where(Lattice.id == lattice_id[0])
-                    .values(
-                        {
-                            Lattice.updated_at: datetime.now(timezone.utc),
-                            Lattice.is_active: False,
-                        }
-                    )
+        lattice_ids = {}
+        dispatch_ids = list({str(dispatch_id) for dispatch_id in data.dispatches})
+        for start in range(0, len(dispatch_ids), DELETE_BATCH_SIZE):
+            rows = (
+                self.db_con.query(Lattice.id, Lattice.dispatch_id)
+                .filter(
+                    Lattice.dispatch_id.in_(dispatch_ids[start : start + DELETE_BATCH_SIZE]),
+                    Lattice.is_active.is_not(False),
                 )
-                self.db_con.execute(update_lattice)
-                self.db_con.commit()
+                .all()
+            )
+            lattice_ids.update({row.dispatch_id: row.id for row in rows})
+        try:
+            self._deactivate_lattices(list(lattice_ids.values()))
+        except Exception:
+            self.db_con.rollback()
+            lattice_ids = {}
+        # A dispatch listed more than once is only deleted the first time
+        for dispatch_id in data.dispatches:
+            if lattice_ids.pop(str(dispatch_id), None) is not None:
                 success.append(dispatch_id)
-            except Exception:
+            else:
                 failure.append(dispatch_id)
         if len(success) > 0:
             message = "Dispatch(es) have been deleted successfully!"
@@ -360,60 +398,10 @@ class Summary:
             dispatch_ids = [o.id for o in filter_dispatches]
             dispatches = [uuid.UUID(o.dispatch_id) for o in filter_dispatches]
             if len(dispatches) >= 1:
-                electron_ids = (
-                    self.db_con.query(Electron.id)
-                    .filter(
-                        Electron.parent_lattice_id.in_(dispatch_ids),
-                        Electron.is_active.is_not(False),
-                    )
-                    .scalar_subquery()
-                )
-
-                update_electron_dependency = (
-                    update(ElectronDependency)
-                    .where(ElectronDependency.parent_electron_id.in_(electron_ids))
-                    .values(
-                        {
-                            ElectronDependency.updated_at: datetime.now(timezone.utc),
-                            ElectronDependency.is_active: False,
-                        }
-                    )
-                )
-                update_electron = (
-                    update(Electron)
-                    .where(Electron.id.in_(electron_ids))
-                    .values(
-                        {
-                            Electron.updated_at: datetime.now(timezone.utc),
-                            Electron.is_active: False,
-                        }
-                    )
-                )
-                update_lattice = (
-                    update(Lattice)
-                    .where(Lattice.id.in_(dispatch_ids))
-                    .values(
-                        {
-                            Lattice.updated_at: datetime.now(timezone.utc),
-                            Lattice.is_active: False,
-                        }
-                    )
-                )
-                self.db_con.execute(
-                    update_electron_dependency,
-                    execution_options=immutabledict({"synchronize_session": "fetch"}),
-                )
-                self.db_con.execute(
-                    update_electron,
-                    execution_options=immutabledict({"synchronize_session": "fetch"}),
-                )
-                self.db_con.execute(
-                    update_lattice,
-                    execution_options=immutabledict({"synchronize_session": "fetch"}),
-                )
-                self.db_con.commit()
+                self._deactivate_lattices(dispatch_ids)
                 success = dispatches
         except Exception:
+            self.db_con.rollback()
             failure = dispatches
         if (len(failure) == 0 and len(success) == 0) or (len(failure) > 0 and len(success) == 0):
             message = "No dispatches were deleted"
@@ -18,16 +18,19 @@
 
 from sqlalchemy.ext.declarative import declarative_base
 
-from covalent_dispatcher._db.datastore import DataStore
+from covalent_dispatcher._db.datastore import DataStore, workflow_db
 
 Base = declarative_base()
-engine = DataStore.factory().engine
+
+# Share the engines of the dispatcher rather than opening more connections to the database
+engine = workflow_db.engine
+read_engine = workflow_db.read_engine
 
 
 def init_db(db_path: str = None):
-    global engine
-    engine = (
-        DataStore(db_URL=db_path, initialize_db=True).engine
-        if db_path is not None
-        else DataStore().engine
+    global engine, read_engine
+    data_store = (
+        DataStore(db_URL=db_path, initialize_db=True) if db_path is not None else DataStore()
     )
+    engine = data_store.engine
+    read_engine = data_store.read_engine
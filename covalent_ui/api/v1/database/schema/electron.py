@@ -114,6 +114,9 @@ class Electron(Base):
     # Name of the file containing errors generated by the task runner or executor
     error_filename = Column(Text)
 
+    # ID of the task group the node is executed in, which defaults to its node id
+    task_group_id = Column(Integer)
+
     # Name of the column which signifies soft deletion of the electrons corresponding to a lattice
     is_active = Column(Boolean, nullable=False, default=True)
 
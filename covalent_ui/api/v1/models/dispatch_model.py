@@ -21,7 +21,7 @@ from datetime import datetime
 from typing import List, Optional, Union
 from uuid import UUID
 
-from pydantic import BaseModel, conint
+from pydantic import BaseModel, confloat, conint
 
 from covalent_ui.api.v1.utils.models_helper import SortBy, SortDirection
 from covalent_ui.api.v1.utils.status import Status
@@ -60,6 +60,7 @@ class DispatchResponse(BaseModel):
 
     items: List[DispatchModule]
     total_count: int
+    next_cursor: Optional[str] = None
 
     class Config:
         """Configure example for openAPI"""
@@ -77,6 +78,7 @@ class DispatchResponse(BaseModel):
                     }
                 ],
                 "total_count": 10,
+                "next_cursor": "WyIyMDIyLTA2LTEzVDA3OjQ1OjAyLjExNDMyOCIsIDQyXQ==",
             }
         }
 
@@ -102,6 +104,27 @@ class DeleteDispatchesResponse(BaseModel):
     message: Union[str, None] = None
 
 
+class RetentionPolicyRequest(BaseModel):
+    """Retention policy request model"""
+
+    max_age_days: Optional[confloat(ge=0)] = None
+    statuses: Optional[List[Status]] = None
+    max_size: Optional[conint(ge=0)] = None
+
+
+class RetentionJobResponse(BaseModel):
+    """Retention job progress model"""
+
+    job_id: str
+    state: str
+    total_dispatches: int
+    deleted_dispatches: int
+    removed_directories: int
+    error: Union[str, None] = None
+    started_at: Union[datetime, None] = None
+    completed_at: Union[datetime, None] = None
+
+
 class DispatchDashBoardResponse(BaseModel):
     """Dashboard metadate model"""
 
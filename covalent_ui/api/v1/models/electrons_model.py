@@ -35,6 +35,7 @@ class Job(BaseModel):
 class JobsResponse(BaseModel):
     data: Union[List[Job], None] = None
     msg: Union[str, None] = None
+    next_cursor: Union[str, None] = None
 
 
 class JobDetails(BaseModel):
@@ -73,6 +74,13 @@ class ElectronFileResponse(BaseModel):
     python_object: Union[str, None] = None
 
 
+class ElectronTailResponse(BaseModel):
+    """Electron Log Tail Response Model"""
+
+    data: Union[str, None] = None
+    offset: int = 0
+
+
 class ElectronExecutorResponse(BaseModel):
     """Electron File Response Model"""
 
@@ -123,3 +131,10 @@ class ElectronFileOutput(str, Enum):
     ERROR = "error"
     INFO = "info"
     INPUTS = "inputs"
+
+
+class ElectronTailOutput(str, Enum):
+    """Electron log files which can be followed"""
+
+    STDOUT = "stdout"
+    STDERR = "stderr"
@@ -16,7 +16,7 @@
 
 """Graph request and response model"""
 
-from typing import Union
+from typing import List, Union
 
 from pydantic import BaseModel
 
@@ -26,3 +26,21 @@ class GraphResponse(BaseModel):
 
     dispatch_id: Union[str, None] = None
     graph: Union[dict, None] = None
+
+
+class GraphSummaryResponse(BaseModel):
+    """Graph Summary Response Model"""
+
+    dispatch_id: Union[str, None] = None
+    group_by: Union[str, None] = None
+    groups: Union[List[dict], None] = None
+    links: Union[List[dict], None] = None
+
+
+class GraphGroupResponse(BaseModel):
+    """Graph Group Response Model"""
+
+    dispatch_id: Union[str, None] = None
+    group_by: Union[str, None] = None
+    group: Union[int, str, None] = None
+    graph: Union[dict, None] = None
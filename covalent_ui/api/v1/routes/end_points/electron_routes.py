@@ -19,24 +19,24 @@
 import uuid
 from typing import List, Optional
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 
 import covalent_ui.api.v1.database.config.db as db
-from covalent._results_manager.results_manager import get_result
-from covalent_dispatcher._core.execution import _get_task_inputs as get_task_inputs
 from covalent_ui.api.v1.data_layer.electron_dal import Electrons
 from covalent_ui.api.v1.models.electrons_model import (
     ElectronExecutorResponse,
     ElectronFileOutput,
     ElectronFileResponse,
     ElectronResponse,
+    ElectronTailOutput,
+    ElectronTailResponse,
     Job,
     JobDetails,
     JobDetailsResponse,
     JobsResponse,
 )
-from covalent_ui.api.v1.utils.file_handle import FileHandler, validate_data
+from covalent_ui.api.v1.utils.file_handle import FileHandler
 from covalent_ui.api.v1.utils.models_helper import JobsSortBy, SortDirection
 
 routes: APIRouter = APIRouter()
@@ -52,7 +52,7 @@ def get_electron_details(dispatch_id: uuid.UUID, electron_id: int):
     Returns:
         Returns the electron details
     """
-    with Session(db.engine) as session:
+    with Session(db.read_engine) as session:
         electron = Electrons(session)
         result = electron.get_electrons_id(dispatch_id, electron_id)
         if result is None:
@@ -93,27 +93,6 @@ def get_electron_details(dispatch_id: uuid.UUID, electron_id: int):
         )
 
 
-def get_electron_inputs(dispatch_id: uuid.UUID, electron_id: int) -> str:
-    """
-    Get Electron Inputs
-    Args:
-        dispatch_id: Dispatch id of lattice/sublattice
-        electron_id: Transport graph node id of a electron
-    Returns:
-        Returns the inputs data from Result object
-    """
-
-    result_object = get_result(dispatch_id=str(dispatch_id), wait=False)
-
-    with Session(db.engine) as session:
-        electron = Electrons(session)
-        result = electron.get_electrons_id(dispatch_id, electron_id)
-        inputs = get_task_inputs(
-            node_id=electron_id, node_name=result.name, result_object=result_object
-        )
-        return validate_data(inputs)
-
-
 @routes.get("/{dispatch_id}/electron/{electron_id}/details/{name}")
 def get_electron_file(dispatch_id: uuid.UUID, electron_id: int, name: ElectronFileOutput):
     """
@@ -127,13 +106,13 @@ def get_electron_file(dispatch_id: uuid.UUID, electron_id: int, name: ElectronFi
         Returns electron details based on the given name
     """
 
-    with Session(db.engine) as session:
+    with Session(db.read_engine) as session:
         electron = Electrons(session)
         result = electron.get_electrons_id(dispatch_id, electron_id)
         if result is not None:
             handler = FileHandler(result["storage_path"])
             if name == "inputs":
-                response, python_object = get_electron_inputs(
+                response, python_object = electron.get_electron_inputs(
                     dispatch_id=dispatch_id, electron_id=electron_id
                 )
                 return ElectronFileResponse(data=str(response), python_object=str(python_object))
@@ -189,25 +168,69 @@ def get_electron_file(dispatch_id: uuid.UUID, electron_id: int, name: ElectronFi
             )
 
 
+@routes.get(
+    "/{dispatch_id}/electron/{electron_id}/tail/{name}", response_model=ElectronTailResponse
+)
+def get_electron_log_tail(
+    dispatch_id: uuid.UUID,
+    electron_id: int,
+    name: ElectronTailOutput,
+    offset: Optional[int] = Query(None, ge=0),
+):
+    """
+    Get a chunk of an electron's stdout or stderr
+    Args:
+        dispatch_id: Dispatch id of lattice/sublattice
+        electron_id: Transport graph node id of a electron
+        name: stdout or stderr
+        offset: Byte offset to read from, as returned by the previous request.
+            The end of the log is returned when omitted.
+    Returns:
+        Returns the chunk read and the offset to request next
+    """
+
+    with Session(db.read_engine) as session:
+        electron = Electrons(session)
+        result = electron.get_electrons_id(dispatch_id, electron_id)
+        if result is None:
+            raise HTTPException(
+                status_code=400,
+                detail=[
+                    {
+                        "loc": ["path", "dispatch_id"],
+                        "msg": f"Dispatch ID {dispatch_id} or Electron ID does not exist",
+                        "type": None,
+                    }
+                ],
+            )
+        handler = FileHandler(result["storage_path"])
+        data, next_offset = handler.read_tail(result[f"{name.value}_filename"], offset)
+        return ElectronTailResponse(data=data, offset=next_offset)
+
+
 @routes.get("/{dispatch_id}/electron/{electron_id}/jobs", response_model=List[Job])
 def get_electron_jobs(
     dispatch_id: uuid.UUID,
     electron_id: int,
+    response: Response,
     sort_by: Optional[JobsSortBy] = JobsSortBy.START_TIME,
     sort_direction: Optional[SortDirection] = SortDirection.DESCENDING,
     count: Optional[int] = None,
     offset: Optional[int] = Query(0),
+    cursor: Optional[str] = None,
 ) -> List[Job]:
     """Get Electron Jobs List
 
     Args:
         dispatch_id: To fetch electron data with dispatch id
         electron_id: To fetch electron data with the provided electron id.
+        cursor: Cursor of the page to fetch, as returned in the `X-Next-Cursor`
+            header of the previous page. Only used when sorting by start time.
 
     Returns:
         Returns the list of electron jobs
     """
-    with Session(db.engine) as session:
+    with Session(db.read_engine) as session:
         electron = Electrons(session)
         jobs_response: JobsResponse = electron.get_jobs(
             dispatch_id=dispatch_id,
@@ -216,12 +239,15 @@ def get_electron_jobs(
             sort_direction=sort_direction,
             count=count,
             offset=offset,
+            cursor=cursor,
         )
         if jobs_response.data is None:
             raise HTTPException(
                 status_code=422,
                 detail=[{"msg": jobs_response.msg}],
             )
+        if jobs_response.next_cursor is not None:
+            response.headers["X-Next-Cursor"] = jobs_response.next_cursor
         return jobs_response.data
 
 
@@ -237,7 +263,7 @@ def get_electron_job_overview(dispatch_id: uuid.UUID, electron_id: int, job_id:
     Returns:
         Returns the electron job details
     """
-    with Session(db.engine) as session:
+    with Session(db.read_engine) as session:
         electron = Electrons(session)
         job_response: JobDetailsResponse = electron.get_job_detail(
             dispatch_id, electron_id, job_id
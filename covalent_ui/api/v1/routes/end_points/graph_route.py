@@ -18,13 +18,18 @@
 
 import uuid
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Query, status
 from fastapi.encoders import jsonable_encoder
 from sqlalchemy.orm import Session
 
 import covalent_ui.api.v1.database.config.db as db
 from covalent_ui.api.v1.data_layer.graph_dal import Graph
-from covalent_ui.api.v1.models.graph_model import GraphResponse
+from covalent_ui.api.v1.models.graph_model import (
+    GraphGroupResponse,
+    GraphResponse,
+    GraphSummaryResponse,
+)
+from covalent_ui.api.v1.utils.models_helper import GraphGroupBy
 
 routes: APIRouter = APIRouter()
 
@@ -40,7 +45,7 @@ def get_graph(dispatch_id: uuid.UUID):
         Returns the lattice data with the dispatch id provided
     """
 
-    with Session(db.engine) as session:
+    with Session(db.read_engine) as session:
         graph = Graph(session)
         graph_data = graph.get_graph(dispatch_id)
         if graph_data is not None:
@@ -61,3 +66,89 @@ def get_graph(dispatch_id: uuid.UUID):
                 }
             ],
         )
+
+
+def _invalid_dispatch_id(dispatch_id: uuid.UUID) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=[
+            {
+                "loc": ["path", "dispatch_id"],
+                "msg": f"Dispatch ID {dispatch_id} does not exist",
+                "type": None,
+            }
+        ],
+    )
+
+
+@routes.get("/{dispatch_id}/graph/summary", response_model=GraphSummaryResponse)
+def get_graph_summary(dispatch_id: uuid.UUID, group_by: GraphGroupBy = GraphGroupBy.NAME):
+    """Get Graph Summary
+
+    Args:
+        dispatch_id: To fetch lattice data with the provided dispatch id
+        group_by: Collapse the nodes with the same electron name or task group
+
+    Returns:
+        Returns the groups of nodes with their status histograms and the links between them
+    """
+
+    with Session(db.read_engine) as session:
+        graph = Graph(session)
+        summary = graph.get_graph_summary(dispatch_id, group_by)
+        if summary is None:
+            raise _invalid_dispatch_id(dispatch_id)
+        return GraphSummaryResponse(
+            dispatch_id=summary["dispatch_id"],
+            group_by=summary["group_by"],
+            groups=jsonable_encoder(summary["groups"]),
+            links=summary["links"],
+        )
+
+
+@routes.get("/{dispatch_id}/graph/group", response_model=GraphGroupResponse)
+def get_graph_group(
+    dispatch_id: uuid.UUID,
+    group: str = Query(...),
+    group_by: GraphGroupBy = GraphGroupBy.NAME,
+):
+    """Get Graph Group
+
+    Args:
+        dispatch_id: To fetch lattice data with the provided dispatch id
+        group: Electron name or task group id of the group to expand
+        group_by: Whether `group` is an electron name or a task group id
+
+    Returns:
+        Returns the nodes of the group and the links from and to them
+    """
+
+    if group_by == GraphGroupBy.TASK_GROUP:
+        try:
+            group = int(group)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=[
+                    {
+                        "loc": ["query", "group"],
+                        "msg": f"Task group {group} is not an integer",
+                        "type": None,
+                    }
+                ],
+            )
+
+    with Session(db.read_engine) as session:
+        graph = Graph(session)
+        graph_data = graph.get_graph_group(dispatch_id, group_by, group)
+        if graph_data is None:
+            raise _invalid_dispatch_id(dispatch_id)
+        return GraphGroupResponse(
+            dispatch_id=graph_data["dispatch_id"],
+            group_by=graph_data["group_by"],
+            group=graph_data["group"],
+            graph={
+                "nodes": jsonable_encoder(graph_data["nodes"]),
+                "links": jsonable_encoder(graph_data["links"]),
+            },
+        )
@@ -50,7 +50,7 @@ def get_lattice_details(dispatch_id: uuid.UUID):
         Returns the lattice data with the dispatch id provided
     """
 
-    with Session(db.engine) as session:
+    with Session(db.read_engine) as session:
         lattice = Lattices(session)
         data = lattice.get_lattices_id(dispatch_id)
         if data is not None:
@@ -89,7 +89,7 @@ def get_lattice_files(dispatch_id: uuid.UUID, name: LatticeFileOutput):
     Returns:
         Returns the lattice file data with the dispatch id and file_module provided provided
     """
-    with Session(db.engine) as session:
+    with Session(db.read_engine) as session:
         lattice = Lattices(session)
         lattice_data = lattice.get_lattices_id_storage_file(dispatch_id)
         if lattice_data is not None:
@@ -157,7 +157,7 @@ def get_sub_lattice(
     Returns:
         List of Sub Lattices details
     """
-    with Session(db.engine) as session:
+    with Session(db.read_engine) as session:
         lattice = Lattices(session)
         data = lattice.get_sub_lattice_details(
             dispatch_id=dispatch_id, sort_by=sort_by, sort_direction=sort_direction
@@ -16,19 +16,28 @@
 
 """Summary Routes"""
 
+from datetime import timedelta
 from typing import Optional
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, HTTPException, Query, status
 from pydantic import conint
 from sqlalchemy.orm import Session
 
 import covalent_ui.api.v1.database.config.db as db
+from covalent_dispatcher._db.retention import (
+    RetentionJobRunningError,
+    RetentionPolicy,
+    get_retention_job,
+    start_retention_job,
+)
 from covalent_ui.api.v1.data_layer.summary_dal import Summary
 from covalent_ui.api.v1.models.dispatch_model import (
     DeleteAllDispatchesRequest,
     DeleteDispatchesRequest,
     DeleteDispatchesResponse,
     DispatchDashBoardResponse,
+    RetentionJobResponse,
+    RetentionPolicyRequest,
     SortBy,
     SortDirection,
 )
@@ -45,18 +54,23 @@ def get_all_dispatches(
     search: Optional[str] = "",
     sort_direction: Optional[SortDirection] = SortDirection.DESCENDING,
     status_filter: Optional[Status] = Status.ALL,
+    cursor: Optional[str] = None,
 ):
     """Get All Dispatches
 
     Args:
         req: Dispatch Summary Request
+        cursor: Cursor of the page to fetch, as returned in `next_cursor` with the
+            previous page. Takes precedence over `offset`.
 
     Returns:
         List of Dispatch Summary
     """
-    with Session(db.engine) as session:
+    with Session(db.read_engine) as session:
         summary = Summary(session)
-        return summary.get_summary(count, offset, sort_by, search, sort_direction, status_filter)
+        return summary.get_summary(
+            count, offset, sort_by, search, sort_direction, status_filter, cursor
+        )
 
 
 @routes.get("/overview", response_model=DispatchDashBoardResponse)
@@ -69,7 +83,7 @@ def get_dashboard_details():
     Returns:
         An Overview of dispatches as object
     """
-    with Session(db.engine) as session:
+    with Session(db.read_engine) as session:
         summary = Summary(session)
         return summary.get_summary_overview()
 
@@ -106,3 +120,54 @@ def delete_all_dispatches(req: Optional[DeleteAllDispatchesRequest]):
     with Session(db.engine) as session:
         summary = Summary(session)
         return summary.delete_all_dispatches(req)
+
+
+@routes.post(
+    "/retention", response_model=RetentionJobResponse, status_code=status.HTTP_202_ACCEPTED
+)
+def start_retention(req: RetentionPolicyRequest):
+    """Permanently delete old and deleted dispatches in the background
+
+    Args:
+        req: Retention policy selecting the dispatches to delete. Dispatches
+            deleted from the UI are always selected.
+
+    Returns:
+        Progress of the started retention job
+    """
+
+    policy_args = {"max_size": req.max_size}
+    if req.max_age_days is not None:
+        policy_args["max_age"] = timedelta(days=req.max_age_days)
+    if req.statuses is not None:
+        policy_args["statuses"] = [status_filter.value for status_filter in req.statuses]
+    try:
+        policy = RetentionPolicy(**policy_args)
+    except ValueError as ex:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=[{"msg": str(ex)}])
+
+    try:
+        job = start_retention_job(policy)
+    except RetentionJobRunningError as ex:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=[{"msg": str(ex)}])
+    return job.progress()
+
+
+@routes.get("/retention/{job_id}", response_model=RetentionJobResponse)
+def get_retention(job_id: str):
+    """Get the progress of a retention job
+
+    Args:
+        job_id: Id of the retention job
+
+    Returns:
+        Progress of the retention job
+    """
+
+    job = get_retention_job(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=[{"msg": f"Retention job {job_id} does not exist"}],
+        )
+    return job.progress()
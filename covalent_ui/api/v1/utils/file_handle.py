@@ -18,11 +18,68 @@
 
 import base64
 import json
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Iterable, Optional, Tuple
 
 import cloudpickle as pickle
 
 from covalent._workflow.transport import TransportableObject, _TransportGraph
 
+# Maximum number of bytes of a text file returned by a single tail request
+MAX_TAIL_BYTES = 1024 * 1024
+
+# Maximum number of rendered previews kept in memory
+PREVIEW_CACHE_SIZE = 256
+
+# Maximum number of files read at the same time by the UI server
+FILE_READ_WORKERS = 8
+
+# Seconds a request waits for a file to be read before giving up
+FILE_READ_TIMEOUT = 10
+
+# Maximum size in bytes of a file read to render a preview; text files are truncated
+MAX_PREVIEW_BYTES = 64 * 1024 * 1024
+
+
+class FileReadError(Exception):
+    """Base class of the errors raised when a file cannot be read in time or size"""
+
+
+class FileReadTimeoutError(FileReadError):
+    """Raised when reading a file takes longer than `FILE_READ_TIMEOUT` seconds"""
+
+
+class FileTooLargeError(FileReadError):
+    """Raised when a pickle file is larger than `MAX_PREVIEW_BYTES`"""
+
+
+_file_read_pool = ThreadPoolExecutor(
+    max_workers=FILE_READ_WORKERS, thread_name_prefix="covalent-ui-file-read"
+)
+
+
+def run_file_read(fn: Callable, *args, timeout: float = FILE_READ_TIMEOUT, **kwargs) -> Any:
+    """Run a blocking read of files in the bounded pool of file readers.
+
+    Slow storage then ties up at most `FILE_READ_WORKERS` threads, and requests
+    fail after `timeout` seconds instead of holding a server thread until the
+    read completes.
+
+    Raises:
+        FileReadTimeoutError: The read did not complete within `timeout` seconds.
+    """
+    future = _file_read_pool.submit(fn, *args, **kwargs)
+    try:
+        return future.result(timeout=timeout)
+    except FutureTimeoutError as ex:
+        future.cancel()
+        name = getattr(fn, "__name__", "file")
+        raise FileReadTimeoutError(f"Reading {name} timed out after {timeout}s") from ex
+
 
 def transportable_object(obj):
     """Decode transportable object
@@ -88,6 +145,51 @@ def validate_data(unpickled_object):
         return unpickled_object, unpickled_object
 
 
+class PreviewCache:
+    """LRU cache of previews rendered from files.
+
+    Previews are keyed by the paths, modification times and sizes of the files
+    they were rendered from, so that a preview is rendered again once any of
+    its files changes."""
+
+    def __init__(self, maxsize: int = PREVIEW_CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self._previews = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, name: str, paths: Iterable[str], render: Callable[[], Any]) -> Any:
+        """Return the preview `name` of the files at `paths`, calling `render` on a miss.
+        Previews of missing files are rendered without being cached."""
+        try:
+            key = (name,) + tuple(_file_version(path) for path in paths)
+        except OSError:
+            return render()
+
+        with self._lock:
+            if key in self._previews:
+                self._previews.move_to_end(key)
+                return self._previews[key]
+
+        preview = render()
+        with self._lock:
+            self._previews[key] = preview
+            while len(self._previews) > self.maxsize:
+                self._previews.popitem(last=False)
+        return preview
+
+    def clear(self) -> None:
+        with self._lock:
+            self._previews.clear()
+
+
+def _file_version(path: str) -> Tuple[str, int, int]:
+    stat = os.stat(path)
+    return path, stat.st_mtime_ns, stat.st_size
+
+
+preview_cache = PreviewCache()
+
+
 class FileHandler:
     """File read"""
 
@@ -97,27 +199,77 @@ class FileHandler:
     def read_from_pickle(self, path):
         """Return data from pickle file"""
         try:
-            unpickled_object = self.__unpickle_file(path)
-            res = validate_data(unpickled_object)
-            return res
+            return preview_cache.get(
+                "pickle",
+                [self.location + "/" + path],
+                lambda: validate_data(self.__unpickle_file(path)),
+            )
+        except FileReadError:
+            raise
         except Exception:
             return None
 
+    def read_object(self, path):
+        """Return the object in a pickle file, or None if it cannot be read"""
+        return self.__unpickle_file(path)
+
     def read_from_text(self, path):
-        """Return data from text file"""
+        """Return data from text file, truncated to `MAX_PREVIEW_BYTES`"""
         try:
-            with open(self.location + "/" + path, "r", encoding="utf-8") as read_file:
-                text_object = read_file.read()
-                read_file.close()
-                return text_object if text_object is not None else ""
+            return run_file_read(self._read_text, self.location + "/" + path)
+        except FileReadError:
+            raise
         except Exception:
             return None
 
+    def read_tail(
+        self, path, offset: Optional[int] = None, max_bytes: int = MAX_TAIL_BYTES
+    ) -> Tuple[Optional[str], int]:
+        """Return up to `max_bytes` of a text file starting at byte `offset`
+        together with the offset to resume reading from.
+
+        When `offset` is None, the last `max_bytes` of the file are returned so
+        that clients can start following large logs without reading them whole."""
+        try:
+            return run_file_read(self._read_tail, self.location + "/" + path, offset, max_bytes)
+        except FileReadError:
+            raise
+        except Exception:
+            return None, offset or 0
+
+    @staticmethod
+    def _read_text(full_path: str) -> str:
+        with open(full_path, "rb") as read_file:
+            data = read_file.read(MAX_PREVIEW_BYTES + 1)
+        if len(data) > MAX_PREVIEW_BYTES:
+            return data[:MAX_PREVIEW_BYTES].decode("utf-8", errors="ignore")
+        return data.decode("utf-8")
+
+    @staticmethod
+    def _read_tail(full_path: str, offset: Optional[int], max_bytes: int) -> Tuple[str, int]:
+        with open(full_path, "rb") as read_file:
+            size = read_file.seek(0, os.SEEK_END)
+            if offset is None:
+                offset = max(size - max_bytes, 0)
+            offset = min(max(offset, 0), size)
+            read_file.seek(offset)
+            chunk = read_file.read(max_bytes)
+            return chunk.decode("utf-8", errors="ignore"), offset + len(chunk)
+
+    @staticmethod
+    def _load_pickle(full_path: str):
+        with open(full_path, "rb") as read_file:
+            size = os.fstat(read_file.fileno()).st_size
+            if size > MAX_PREVIEW_BYTES:
+                raise FileTooLargeError(
+                    f"{os.path.basename(full_path)} is too large to preview ({size} bytes)"
+                )
+            return pickle.load(read_file)
+
     def __unpickle_file(self, path):
         try:
-            with open(self.location + "/" + path, "rb") as read_file:
-                unpickled_object = pickle.load(read_file)
-                read_file.close()
-                return unpickled_object
+            return run_file_read(self._load_pickle, self.location + "/" + path)
+        except FileReadError:
+            raise
         except Exception:
             return None
@@ -0,0 +1,288 @@
+# Copyright 2023 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Sidecar index of the entries of a log file, which is updated incrementally as the log grows"""
+
+import os
+import re
+import sqlite3
+import threading
+from contextlib import closing
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+
+INDEX_VERSION = 1
+
+# Number of bytes at the start of the log used to detect that the file was replaced
+HEAD_SIZE = 64
+
+# Number of entries inserted into the index at once
+BATCH_SIZE = 10000
+
+SORT_COLUMNS = ("log_date", "status")
+
+_ENTRY_PATTERN = re.compile(
+    r"\[(.*)\] \[(TRACE|DEBUG|INFO|NOTICE|WARN|WARNING|ERROR|SEVERE|CRITICAL|FATAL)\]"
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value);
+CREATE TABLE IF NOT EXISTS entries (
+    id INTEGER PRIMARY KEY,
+    offset INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    log_date TEXT,
+    status TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_log_date ON entries (log_date, id);
+CREATE INDEX IF NOT EXISTS entries_status ON entries (status, id);
+"""
+
+
+def _parse_date(date_str: str) -> Optional[str]:
+    """Convert a log timestamp such as `2022-09-23 07:43:59,752` to the format shown by the UI"""
+
+    try:
+        parsed = datetime.fromisoformat(date_str.replace(",", "."))
+    except ValueError:
+        try:
+            parsed = datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S,%f")
+        except ValueError:
+            return None
+    return f"{parsed}"
+
+
+def _parse_line(line: str) -> Optional[Tuple[Optional[str], str, str]]:
+    """Return the date, level and message of a line starting a log entry, None for other lines"""
+
+    data = _ENTRY_PATTERN.split(line, maxsplit=1)
+    if len(data) == 1:
+        return None
+    return _parse_date(data[1]), data[2], data[3]
+
+
+def parse_entry(text: str) -> Dict[str, Optional[str]]:
+    """
+    Parse the text of a log entry, made of its first line and any following continuation lines
+
+    Args:
+        text: Text of the entry as written to the log.
+
+    Returns:
+        Dictionary with the date, level and message of the entry.
+    """
+
+    lines = text.splitlines(keepends=True) or [""]
+    parsed = _parse_line(lines[0])
+    if parsed is None:
+        # Lines written before the first well-formed entry of the log
+        log_date, status, message = None, "INFO", lines[0]
+    else:
+        log_date, status, message = parsed
+
+    for line in lines[1:]:
+        message = f"{message}\n{line}"
+
+    return {"log_date": log_date, "status": status, "message": message}
+
+
+class LogIndex:
+    """
+    Index of the entries of a log file, stored in a SQLite database next to the log.
+
+    Each entry records the byte range of a log entry together with its date and
+    level, so that pages of entries can be served by seeking into the log. The
+    index is brought up to date by parsing only what was appended to the log
+    since the last update, and is rebuilt if the log is replaced or truncated.
+
+    Attributes:
+        log_path: Path to the log file.
+        index_path: Path to the index database.
+    """
+
+    def __init__(self, log_path: str, index_path: Optional[str] = None) -> None:
+        self.log_path = log_path
+        self.index_path = index_path or f"{log_path}.idx"
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.index_path)
+        conn.executescript(_SCHEMA)
+        return conn
+
+    def _get_meta(self, conn: sqlite3.Connection) -> Dict:
+        return dict(conn.execute("SELECT key, value FROM meta"))
+
+    def _is_valid(self, meta: Dict, stat: os.stat_result, logfile) -> bool:
+        """Whether the index describes a prefix of the current log file"""
+
+        if meta.get("version") != INDEX_VERSION or meta.get("inode") != stat.st_ino:
+            return False
+        if stat.st_size < meta.get("size", 0):
+            return False
+        head = meta.get("head", b"")
+        logfile.seek(0)
+        return logfile.read(len(head)) == head
+
+    def update(self) -> None:
+        """Index the entries appended to the log since the last update"""
+
+        stat = os.stat(self.log_path)
+
+        with self._lock, closing(self._connect()) as conn, conn, open(
+            self.log_path, "rb"
+        ) as logfile:
+            meta = self._get_meta(conn)
+            if not self._is_valid(meta, stat, logfile):
+                conn.execute("DELETE FROM entries")
+                meta = {"size": 0}
+
+            if stat.st_size == meta["size"]:
+                return
+
+            # The last entry may have gained continuation lines, so it is parsed again
+            last_entry = conn.execute(
+                "SELECT id, offset FROM entries ORDER BY id DESC LIMIT 1"
+            ).fetchone()
+            if last_entry:
+                next_id, start = last_entry
+                conn.execute("DELETE FROM entries WHERE id = ?", (next_id,))
+            else:
+                next_id, start = 1, 0
+
+            logfile.seek(start)
+            rows = []
+            entry = None
+            position = start
+            for line in logfile:
+                parsed = _parse_line(line.decode("utf-8", errors="replace"))
+                if parsed is not None or entry is None:
+                    if entry is not None:
+                        rows.append(entry)
+                    log_date, status = parsed[:2] if parsed else (None, "INFO")
+                    entry = [next_id, position, 0, log_date, status]
+                    next_id += 1
+
+                position += len(line)
+                entry[2] = position - entry[1]
+
+                if len(rows) >= BATCH_SIZE:
+                    conn.executemany("INSERT INTO entries VALUES (?, ?, ?, ?, ?)", rows)
+                    rows = []
+
+            if entry is not None:
+                rows.append(entry)
+            conn.executemany("INSERT INTO entries VALUES (?, ?, ?, ?, ?)", rows)
+
+            logfile.seek(0)
+            meta = {
+                "version": INDEX_VERSION,
+                "inode": stat.st_ino,
+                "size": position,
+                "head": logfile.read(min(position, HEAD_SIZE)),
+            }
+            conn.executemany("INSERT OR REPLACE INTO meta VALUES (?, ?)", meta.items())
+
+    def _iter_matches(self, conn: sqlite3.Connection, search: str) -> Iterator[int]:
+        """Scan the log in file order and yield the ids of the entries matching `search`"""
+
+        with open(self.log_path, "rb") as logfile:
+            for entry_id, offset, length, status in conn.execute(
+                "SELECT id, offset, length, status FROM entries ORDER BY id"
+            ):
+                if search in status.lower():
+                    yield entry_id
+                    continue
+
+                logfile.seek(offset)
+                text = logfile.read(length).decode("utf-8", errors="replace")
+                # The raw text contains all of the message except for separators
+                if "\n" not in search and search not in text.lower():
+                    continue
+                if search in parse_entry(text)["message"].lower():
+                    yield entry_id
+
+    def get_entries(
+        self,
+        sort_by: str = "log_date",
+        descending: bool = True,
+        search: str = "",
+        count: int = 0,
+        offset: int = 0,
+    ) -> Tuple[List[Dict], int]:
+        """
+        Return a page of log entries
+
+        Args:
+            sort_by: Field to sort the entries by, one of `SORT_COLUMNS`.
+            descending: Whether to sort in descending order.
+            search: Only return entries whose message or level contain this
+                string, ignoring case.
+            count: Number of entries to return. All entries from `offset`
+                are returned in the order of the log if zero.
+            offset: Number of entries to skip.
+
+        Returns:
+            Tuple of the entries of the page and the total number of matching entries.
+        """
+
+        if sort_by not in SORT_COLUMNS:
+            raise ValueError(f"Cannot sort log entries by {sort_by}")
+
+        self.update()
+
+        with closing(self._connect()) as conn:
+            table = "entries"
+            if search:
+                conn.execute("CREATE TEMP TABLE matches (id INTEGER PRIMARY KEY)")
+                conn.executemany(
+                    "INSERT INTO matches VALUES (?)",
+                    ((entry_id,) for entry_id in self._iter_matches(conn, search.lower())),
+                )
+                table = "entries JOIN matches USING (id)"
+
+            (total_count,) = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()
+
+            # Missing dates sort first in ascending order and last in descending order,
+            # and entries which compare equal keep their order in the log
+            if count:
+                direction = "DESC" if descending else "ASC"
+                query = f"SELECT offset, length FROM {table} ORDER BY {sort_by} {direction}, id"
+                rows = conn.execute(f"{query} LIMIT ? OFFSET ?", (count, offset)).fetchall()
+            else:
+                query = f"SELECT offset, length FROM {table} ORDER BY id"
+                rows = conn.execute(f"{query} LIMIT -1 OFFSET ?", (offset,)).fetchall()
+
+        entries = []
+        with open(self.log_path, "rb") as logfile:
+            for entry_offset, length in rows:
+                logfile.seek(entry_offset)
+                entries.append(parse_entry(logfile.read(length).decode("utf-8", errors="replace")))
+
+        return entries, total_count
+
+
+_log_indexes: Dict[str, LogIndex] = {}
+_log_indexes_lock = threading.Lock()
+
+
+def get_log_index(log_path: str) -> LogIndex:
+    """Return the index of the log at `log_path`, shared by all requests"""
+
+    with _log_indexes_lock:
+        if log_path not in _log_indexes:
+            _log_indexes[log_path] = LogIndex(log_path)
+        return _log_indexes[log_path]
@@ -53,3 +53,10 @@ class SortDirection(CaseInsensitiveEnum):
 
     ASCENDING = "ASC"
     DESCENDING = "DESC"
+
+
+class GraphGroupBy(CaseInsensitiveEnum):
+    """Values to collapse the nodes of a graph by"""
+
+    NAME = "name"
+    TASK_GROUP = "task_group"
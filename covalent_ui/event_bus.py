@@ -0,0 +1,124 @@
+# Copyright 2023 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""In-process publish/subscribe bus carrying events from the dispatcher to the UI server"""
+
+import asyncio
+import threading
+from typing import Any, Dict, List, Tuple
+
+from covalent._shared_files import logger
+
+app_log = logger.app_log
+
+# Maximum number of events waiting to be consumed by a subscriber
+DEFAULT_QUEUE_SIZE = 1000
+
+Event = Tuple[str, Dict[str, Any]]
+
+
+class EventBus:
+    """
+    Broadcast events to subscribers running in the same process.
+
+    Each subscriber receives every event published after it subscribed on its
+    own asyncio queue. Events can be published from any thread; they are put
+    on the queues in the event loop of each subscriber. When a subscriber falls
+    behind by more than `maxsize` events, its oldest events are dropped.
+
+    Attributes:
+        maxsize: Maximum number of events queued for a subscriber.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_QUEUE_SIZE) -> None:
+        self.maxsize = maxsize
+        self._subscribers: List[Tuple[asyncio.AbstractEventLoop, asyncio.Queue]] = []
+        self._lock = threading.Lock()
+
+    def has_subscribers(self) -> bool:
+        """Whether any subscriber is listening"""
+
+        return bool(self._subscribers)
+
+    def subscribe(self) -> asyncio.Queue:
+        """
+        Subscribe to the events published from now on.
+        Must be called from the event loop which consumes the events.
+
+        Returns:
+            Queue of `(event, payload)` tuples.
+        """
+
+        queue = asyncio.Queue(maxsize=self.maxsize)
+        with self._lock:
+            self._subscribers.append((asyncio.get_running_loop(), queue))
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        """Stop delivering events to `queue`"""
+
+        with self._lock:
+            self._subscribers = [(loop, q) for loop, q in self._subscribers if q is not queue]
+
+    @staticmethod
+    def _put(queue: asyncio.Queue, event: Event) -> None:
+        if queue.full():
+            dropped, _ = queue.get_nowait()
+            app_log.debug(f"Event bus subscriber is falling behind, dropped {dropped} event")
+        queue.put_nowait(event)
+
+    def publish(self, event: str, payload: Dict[str, Any]) -> bool:
+        """
+        Publish an event to all subscribers
+
+        Args:
+            event: Name of the event.
+            payload: Data of the event, shared by all subscribers.
+
+        Returns:
+            Whether the event was delivered to at least one subscriber.
+        """
+
+        with self._lock:
+            subscribers = list(self._subscribers)
+
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        delivered = False
+        for loop, queue in subscribers:
+            if loop is running_loop:
+                self._put(queue, (event, payload))
+            else:
+                try:
+                    loop.call_soon_threadsafe(self._put, queue, (event, payload))
+                except RuntimeError:
+                    # The event loop of the subscriber is closed
+                    continue
+            delivered = True
+
+        return delivered
+
+
+_event_bus = EventBus()
+
+
+def get_event_bus() -> EventBus:
+    """Return the event bus shared by the dispatcher and the UI server"""
+
+    return _event_bus
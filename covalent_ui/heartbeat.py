@@ -86,8 +86,17 @@ async def cancel_all_with_status(status: Status) -> List[str]:
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    from covalent_ui.api.main import forward_bus_events
+
     heartbeat = Heartbeat()
     asyncio.create_task(heartbeat.start())
+    bus_forwarder = asyncio.create_task(forward_bus_events())
+
+    if get_config("dask.autoscale") == "true":
+        from covalent_dispatcher._core.dispatcher import get_ready_task_count
+        from covalent_dispatcher._service.app_dask import QueueDepthReporter
+
+        asyncio.create_task(QueueDepthReporter(get_ready_task_count).start())
 
     yield
 
@@ -99,4 +108,9 @@ async def lifespan(app: FastAPI):
     ]:
         await cancel_all_with_status(status)
 
+    from covalent_ui.result_webhook import get_publisher
+
+    await get_publisher().close()
+    bus_forwarder.cancel()
+
     Heartbeat.stop()
@@ -14,7 +14,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import json
+from datetime import datetime
+from typing import Dict, Optional
 
 import aiohttp
 import requests
@@ -24,11 +27,158 @@ from covalent._results_manager import Result
 from covalent._shared_files import logger
 from covalent._shared_files.utils import get_ui_url
 from covalent_dispatcher._db.dispatchdb import encode_dict, extract_graph, extract_metadata
+from covalent_ui.event_bus import get_event_bus
 
 app_log = logger.app_log
 
 # UI server webhook for result updates
 
+# Seconds during which updates are collected before being sent to the UI server together
+UPDATE_INTERVAL = 0.1
+
+
+def _isoformat(timestamp: Optional[datetime]) -> Optional[str]:
+    return timestamp.isoformat() if timestamp else None
+
+
+class UpdatePublisher:
+    """
+    Publisher of dispatch and node updates to the UI server.
+
+    Updates are coalesced over `interval` seconds, keeping only the latest
+    status of each dispatch and node. They are handed to the UI server through
+    the event bus when it runs in this process, and otherwise sent as a single
+    request over a pooled HTTP session. The UI server forwards node updates to the clients
+    subscribed to the dispatch, so that clients update the affected nodes
+    instead of fetching the whole graph again.
+
+    Attributes:
+        interval: Seconds during which updates are collected before being sent.
+    """
+
+    def __init__(self, interval: float = UPDATE_INTERVAL) -> None:
+        self.interval = interval
+
+        # Map of dispatch_id -> pending update of the dispatch and its nodes
+        self._pending: Dict[str, Dict] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_pending(self, dispatch_id: str) -> Dict:
+        if dispatch_id not in self._pending:
+            self._pending[dispatch_id] = {"dispatch_id": dispatch_id, "nodes": {}}
+        return self._pending[dispatch_id]
+
+    def _schedule_flush(self) -> None:
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.interval)
+
+        # Updates published while these are being sent are flushed by a new task.
+        self._flush_task = None
+        await self.flush()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            timeout = aiohttp.ClientTimeout(total=1)
+            self._session = aiohttp.ClientSession(timeout=timeout)
+            self._session_loop = loop
+        return self._session
+
+    def publish_result(self, result: Result) -> None:
+        """
+        Queue an update of the status of a dispatch
+
+        Args:
+            result: The updated result object.
+        """
+
+        self._get_pending(result.dispatch_id)["result"] = {
+            "dispatch_id": result.dispatch_id,
+            "results_dir": result.results_dir,
+            "status": result.status.STATUS,
+        }
+        self._schedule_flush()
+
+    def publish_node(
+        self,
+        dispatch_id: str,
+        node_id: int,
+        status: str,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+    ) -> None:
+        """
+        Queue an update of the status of a node
+
+        Args:
+            dispatch_id: ID of the dispatch the node belongs to.
+            node_id: ID of the node in the transport graph.
+            status: New status of the node.
+            start_time: Time at which the node started running, if known.
+            end_time: Time at which the node finished running, if known.
+        """
+
+        nodes = self._get_pending(dispatch_id)["nodes"]
+        delta = nodes.setdefault(node_id, {"node_id": node_id})
+        delta["status"] = str(status)
+        if start_time is not None:
+            delta["started_at"] = _isoformat(start_time)
+        if end_time is not None:
+            delta["completed_at"] = _isoformat(end_time)
+        self._schedule_flush()
+
+    async def flush(self) -> None:
+        """Send the pending updates to the UI server"""
+
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return
+
+        updates = [
+            {**update, "nodes": list(update["nodes"].values())} for update in pending.values()
+        ]
+
+        # Hand the updates over directly when the UI server runs in this process
+        if get_event_bus().publish("result-updates", {"updates": updates}):
+            return
+
+        try:
+            session = self._get_session()
+            async with session.post(
+                get_ui_url(ui_server.WEBHOOK_PATH),
+                json={"event": "result-updates", "updates": updates},
+            ) as resp:
+                status = resp.status
+                text = await resp.text()
+                app_log.debug(f"Sent {len(updates)} result updates, received {status}, {text}")
+        except Exception as ex:
+            # catch all requests-related exceptions
+            app_log.debug(f"Unable to send result update to UI server: {ex}")
+
+    async def close(self) -> None:
+        """Send any pending updates and close the HTTP session"""
+
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+        await self.flush()
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+_publisher = UpdatePublisher()
+
+
+def get_publisher() -> UpdatePublisher:
+    """Return the update publisher shared by all dispatches"""
+
+    return _publisher
+
 
 async def send_update(result: Result) -> None:
     """
@@ -36,34 +186,15 @@ async def send_update(result: Result) -> None:
     updated result to have been saved to the results directory prior to the
     update.
 
+    The update is sent together with the other updates made within
+    `UPDATE_INTERVAL` seconds.
+
     Args: result: The updated result object.
 
     Returns: None
     """
 
-    result_update = json.dumps(
-        {
-            "event": "result-update",
-            "result": {
-                "dispatch_id": result.dispatch_id,
-                "results_dir": result.results_dir,
-                "status": result.status.STATUS,
-            },
-        },
-    )
-    try:
-        # ignore response
-        timeout = aiohttp.ClientTimeout(total=1)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.post(
-                get_ui_url(ui_server.WEBHOOK_PATH), json=json.loads(result_update)
-            ) as resp:
-                status = resp.status
-                text = await resp.text()
-                app_log.debug(f"send_update received response {status}, {text}")
-    except Exception as ex:
-        # catch all requests-related exceptions
-        app_log.debug(f"Unable to send result update to UI server: {ex}")
+    get_publisher().publish_result(result)
 
 
 def send_draw_request(lattice) -> None:
@@ -81,24 +212,26 @@ def send_draw_request(lattice) -> None:
     named_args = {k: v.object_string for k, v in lattice.named_args.items()}
     named_kwargs = {k: v.object_string for k, v in lattice.named_kwargs.items()}
 
-    draw_request = json.dumps(
-        {
-            "event": "draw-request",
-            "payload": {
-                "lattice": {
-                    "function_string": lattice.workflow_function_string,
-                    "doc": lattice.__doc__,
-                    "name": lattice.__name__,
-                    "inputs": encode_dict({**named_args, **named_kwargs}),
-                    "metadata": extract_metadata(lattice.metadata),
-                },
-                "graph": extract_graph(graph),
+    draw_request = {
+        "event": "draw-request",
+        "payload": {
+            "lattice": {
+                "function_string": lattice.workflow_function_string,
+                "doc": lattice.__doc__,
+                "name": lattice.__name__,
+                "inputs": encode_dict({**named_args, **named_kwargs}),
+                "metadata": extract_metadata(lattice.metadata),
             },
-        }
-    )
+            "graph": extract_graph(graph),
+        },
+    }
+
+    # Hand the request over directly when the UI server runs in this process
+    if get_event_bus().publish("draw-request", draw_request):
+        return
 
     try:
-        response = requests.post(get_ui_url("/api/draw"), data=draw_request)
+        response = requests.post(get_ui_url("/api/draw"), data=json.dumps(draw_request))
         response.raise_for_status()
     except requests.exceptions.HTTPError as ex:
         app_log.error(ex)
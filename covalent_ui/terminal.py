@@ -0,0 +1,205 @@
+# Copyright 2023 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Terminal sessions of the UI, bridging a shell in a pseudo-terminal to a socket client"""
+
+import asyncio
+import codecs
+import fcntl
+import os
+import pty
+import signal
+import struct
+import termios
+from typing import Awaitable, Callable, Optional
+
+from covalent._shared_files import logger
+
+app_log = logger.app_log
+
+# Maximum number of bytes read from the pseudo-terminal at once
+MAX_READ_BYTES = 64 * 1024
+
+# Number of bytes of output waiting to be sent above which the pseudo-terminal is no longer read
+MAX_BUFFERED_BYTES = 1024 * 1024
+
+# Seconds during which output is collected before being sent to the client
+COALESCE_INTERVAL = 0.005
+
+# Seconds between checks whether a shell which closed its terminal has exited
+REAP_INTERVAL = 0.05
+
+
+def set_winsize(fd, row, col, xpix=0, ypix=0):
+    winsize = struct.pack("HHHH", row, col, xpix, ypix)
+    fcntl.ioctl(fd, termios.TIOCSWINSZ, winsize)
+
+
+class TerminalSession:
+    """
+    Shell running in a pseudo-terminal, whose output is sent to one client.
+
+    The pseudo-terminal is read when the event loop reports it readable rather
+    than polled. Output read while a previous chunk is being sent is buffered
+    and sent as a single chunk. When more than `MAX_BUFFERED_BYTES` are waiting
+    for a slow client, the pseudo-terminal is no longer read until the buffer
+    drains, which in turn blocks the shell writing to it. A shell which exits
+    on its own is reaped once its output has been sent.
+
+    Attributes:
+        emit: Coroutine function sending a chunk of output to the client, which
+            should only return once the client received it.
+        pid: Process id of the shell.
+        fd: File descriptor of the pseudo-terminal.
+    """
+
+    def __init__(self, emit: Callable[[str], Awaitable]) -> None:
+        self.emit = emit
+        self.pid: Optional[int] = None
+        self.fd: Optional[int] = None
+        self._buffer = bytearray()
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._output_ready = asyncio.Event()
+        self._reading = False
+        self._closed = False
+        self._sender: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def start(self, rows: int = 50, cols: int = 50) -> None:
+        """Start the shell and forward its output. Must be called from the event loop."""
+
+        pid, fd = pty.fork()
+        if pid == 0:
+            shell = os.environ.get("SHELL", "bash")
+            try:
+                os.execvp(shell, [shell])
+            finally:
+                os._exit(1)
+
+        self.pid, self.fd = pid, fd
+        set_winsize(fd, rows, cols)
+        os.set_blocking(fd, False)
+
+        self._loop = asyncio.get_running_loop()
+        self._resume_reading()
+        self._sender = self._loop.create_task(self._send_output())
+
+    def _resume_reading(self) -> None:
+        if not self._reading and not self._closed:
+            self._loop.add_reader(self.fd, self._read_output)
+            self._reading = True
+
+    def _pause_reading(self) -> None:
+        if self._reading:
+            self._loop.remove_reader(self.fd)
+            self._reading = False
+
+    def _read_output(self) -> None:
+        try:
+            data = os.read(self.fd, MAX_READ_BYTES)
+        except BlockingIOError:
+            return
+        except OSError:
+            # The shell exited
+            data = b""
+
+        if not data:
+            self._pause_reading()
+            self._closed = True
+        else:
+            self._buffer += data
+            if len(self._buffer) >= MAX_BUFFERED_BYTES:
+                self._pause_reading()
+        self._output_ready.set()
+
+    async def _send_output(self) -> None:
+        while True:
+            await self._output_ready.wait()
+            await asyncio.sleep(COALESCE_INTERVAL)
+            self._output_ready.clear()
+
+            output = self._decoder.decode(self._buffer, final=self._closed)
+            self._buffer.clear()
+            if output:
+                try:
+                    await self.emit(output)
+                except Exception as ex:
+                    app_log.debug(f"Unable to send terminal output: {ex}")
+
+            if self._closed:
+                await self._reap()
+                return
+            self._resume_reading()
+
+    async def _reap(self) -> None:
+        # The shell closed the terminal, wait for it to exit
+        while self.pid is not None:
+            try:
+                pid, _ = os.waitpid(self.pid, os.WNOHANG)
+            except ChildProcessError:
+                pid = self.pid
+            if pid:
+                self.pid = None
+            else:
+                await asyncio.sleep(REAP_INTERVAL)
+
+    def write(self, data: str) -> None:
+        """Write input to the shell as if it was typed in the terminal"""
+
+        if self.fd is None or self._closed:
+            return
+        view = memoryview(data.encode())
+        while view:
+            try:
+                written = os.write(self.fd, view)
+            except BlockingIOError:
+                app_log.debug("Terminal input dropped, the shell is not reading it")
+                return
+            except OSError:
+                return
+            view = view[written:]
+
+    def resize(self, rows: int, cols: int) -> None:
+        """Set the size of the terminal"""
+
+        if self.fd is not None and not self._closed:
+            set_winsize(self.fd, rows, cols)
+
+    async def close(self) -> None:
+        """Kill the shell and release the pseudo-terminal"""
+
+        self._pause_reading()
+        self._closed = True
+        if self._sender is not None:
+            self._sender.cancel()
+            try:
+                await self._sender
+            except asyncio.CancelledError:
+                pass
+
+        if self.pid is not None:
+            try:
+                os.killpg(self.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            try:
+                os.waitpid(self.pid, 0)
+            except ChildProcessError:
+                pass
+            self.pid = None
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
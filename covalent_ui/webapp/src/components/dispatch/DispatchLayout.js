@@ -27,7 +27,12 @@ import PageLoading from '../common/PageLoading'
 import { graphBgColor } from '../../utils/theme'
 import LatticeDrawer, { latticeDrawerWidth } from '../common/LatticeDrawer'
 import NavDrawer, { navDrawerWidth } from '../common/NavDrawer'
-import { graphResults, resetGraphState } from '../../redux/graphSlice'
+import {
+  applyNodeUpdates,
+  graphResults,
+  resetGraphState,
+} from '../../redux/graphSlice'
+import socket from '../../utils/socket'
 import { resetLatticeState } from '../../redux/latticeSlice'
 import { resetElectronState } from '../../redux/electronSlice'
 import DispatchTopBar from './DispatchTopBar'
@@ -55,6 +60,28 @@ export function DispatchLayout() {
     // eslint-disable-next-line react-hooks/exhaustive-deps
   }, [callSocketApi, sublatticesDispatchId])
 
+  // apply node status updates of the displayed graph as they are pushed
+  const graphDispatchId = sublatticesDispatchId?.dispatchId || dispatchId
+  useEffect(() => {
+    const onNodeUpdates = (update) => {
+      if (update.dispatch_id === graphDispatchId) {
+        dispatch(applyNodeUpdates(update.nodes))
+      }
+    }
+    // rooms are left on disconnect, so subscribe again whenever connected
+    const subscribe = () =>
+      socket.emit('subscribe', { dispatch_id: graphDispatchId })
+    subscribe()
+    socket.on('connect', subscribe)
+    socket.on('node-updates', onNodeUpdates)
+    return () => {
+      socket.off('connect', subscribe)
+      socket.off('node-updates', onNodeUpdates)
+      socket.emit('unsubscribe', { dispatch_id: graphDispatchId })
+    }
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [graphDispatchId])
+
   // reset store values to initial state when moved to another page
   useEffect(() => {
     return () => {
@@ -54,8 +54,14 @@ export const Terminal = () => {
   })
   useEffect(() => {
     if (socket) {
-      socket.on('pty-output', function (data) {
-        xtermRef?.current?.terminal.write(data.output)
+      socket.on('pty-output', function (data, ack) {
+        // Acknowledge the output once written so that the server sends more
+        const terminal = xtermRef?.current?.terminal
+        if (terminal) {
+          terminal.write(data.output, ack)
+        } else if (ack) {
+          ack()
+        }
       })
     }
   })
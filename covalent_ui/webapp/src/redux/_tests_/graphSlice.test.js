@@ -14,7 +14,7 @@
  * limitations under the License.
  */
 
-import { graphResults, graphSlice } from '../graphSlice'
+import { applyNodeUpdates, graphResults, graphSlice } from '../graphSlice'
 
 describe('graph slice tests', () => {
   it('graph slice rendered rejected', () => {
@@ -116,4 +116,35 @@ describe('graph slice tests', () => {
       graphResultsList: { isFetching: false, error: null },
     })
   })
+
+  it('graph slice applies node updates', () => {
+    const state = graphSlice.reducer(
+      {
+        graphList: {
+          nodes: [
+            { id: 69, node_id: 0, status: 'RUNNING', completed_at: null },
+            { id: 70, node_id: 1, status: 'NEW_OBJECT', completed_at: null },
+          ],
+        },
+        graphResultsList: { isFetching: false, error: null },
+      },
+      applyNodeUpdates([
+        {
+          node_id: 0,
+          status: 'COMPLETED',
+          completed_at: '2022-08-09T06:19:32.183245',
+        },
+        { node_id: 5, status: 'RUNNING' },
+      ])
+    )
+    expect(state.graphList.nodes).toEqual([
+      {
+        id: 69,
+        node_id: 0,
+        status: 'COMPLETED',
+        completed_at: '2022-08-09T06:19:32.183245',
+      },
+      { id: 70, node_id: 1, status: 'NEW_OBJECT', completed_at: null },
+    ])
+  })
 })
@@ -36,6 +36,16 @@ export const graphSlice = createSlice({
     resetGraphState() {
       return initialState
     },
+    // merge node updates pushed by the server into the cached graph
+    applyNodeUpdates(state, { payload }) {
+      const nodes = state.graphList.nodes || []
+      payload.forEach((update) => {
+        const node = nodes.find((n) => n.node_id === update.node_id)
+        if (node) {
+          Object.assign(node, update)
+        }
+      })
+    },
   },
   extraReducers: (builder) => {
     builder
@@ -56,4 +66,4 @@ export const graphSlice = createSlice({
   },
 })
 
-export const { resetGraphState } = graphSlice.actions
+export const { resetGraphState, applyNodeUpdates } = graphSlice.actions
@@ -26,6 +26,7 @@
      return {
        on() {},
        off() {},
+       emit() {},
      }
    }
 
@@ -19,6 +19,7 @@ Tests for the core functionality of the dispatcher.
 """
 
 
+import base64
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -28,6 +29,7 @@ from covalent._results_manager import Result
 from covalent._shared_files.defaults import sublattice_prefix
 from covalent._shared_files.util_classes import RESULT_STATUS
 from covalent._workflow.lattice import Lattice
+from covalent._workflow.transport import TransportableObject
 from covalent_dispatcher._core.data_manager import (
     _dispatch_status_queues,
     _get_result_object_from_new_lattice,
@@ -87,6 +89,37 @@ def get_mock_result() -> Result:
     return result_object
 
 
+def test_generate_node_result_qelectron_db(mocker):
+    """Test that QElectron databases returned with the output or in stdout are stored."""
+
+    write_mock = mocker.patch("covalent_dispatcher._core.data_manager.write_qelectron_db")
+    output = TransportableObject(1)
+    output._header["qelectron_db"] = base64.b64encode(b"mock-data.mdb").decode()
+
+    node_result = generate_node_result(
+        dispatch_id="mock-dispatch-id",
+        node_id=0,
+        node_name="mock_node_name",
+        output=output,
+        stdout="hello",
+    )
+    write_mock.assert_called_once_with("mock-dispatch-id", 0, b"mock-data.mdb")
+    assert node_result["qelectron_data_exists"]
+    assert node_result["stdout"] == "hello"
+    assert node_result["output"] == TransportableObject(1)
+
+    write_mock.reset_mock()
+    node_result = generate_node_result(
+        dispatch_id="mock-dispatch-id",
+        node_id=0,
+        node_name="mock_node_name",
+        output=TransportableObject(1),
+        stdout="hello",
+    )
+    write_mock.assert_not_called()
+    assert not node_result["qelectron_data_exists"]
+
+
 @pytest.mark.asyncio
 async def test_handle_built_sublattice(mocker):
     """Test the handle_built_sublattice function."""
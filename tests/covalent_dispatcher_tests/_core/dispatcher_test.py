@@ -38,8 +38,10 @@ from covalent_dispatcher._core.dispatcher import (
     _handle_failed_node,
     _plan_workflow,
     _run_planned_workflow,
+    _runs_on_local_dask,
     _submit_task,
     cancel_dispatch,
+    get_ready_task_count,
     run_dispatch,
     run_workflow,
 )
@@ -581,3 +583,78 @@ async def test_submit_task(mocker):
     ]
     update_node_result_mock.assert_called_with(mock_result, generate_node_result_mock.return_value)
     generate_node_result_mock.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_ready_task_count(mocker):
+    """Test that local Dask tasks count as ready until the runner reports their status."""
+
+    def transport_graph_get_value_side_effect(node_id, key):
+        if key == "name":
+            return "mock-name"
+        if key == "status":
+            return RESULT_STATUS.NEW_OBJECT
+        if key == "metadata":
+            if node_id == 0:
+                return {
+                    "executor": "dask",
+                    "executor_data": {"attributes": {"scheduler_address": "tcp://local:8786"}},
+                }
+            return {"executor": "local", "executor_data": {}}
+
+    result_object = MagicMock()
+    result_object.dispatch_id = "mock-dispatch"
+    result_object._task_failed = False
+    result_object._task_cancelled = False
+    result_object.lattice.transport_graph.get_node_value.side_effect = (
+        transport_graph_get_value_side_effect
+    )
+
+    mocker.patch("covalent_dispatcher._core.dispatcher.datasvc.upsert_lattice_data")
+    mocker.patch("covalent_dispatcher._core.dispatcher.result_webhook.send_update")
+    mocker.patch(
+        "covalent_dispatcher._core.dispatcher._get_abstract_task_inputs",
+        return_value={"args": [], "kwargs": {}},
+    )
+    mocker.patch("covalent_dispatcher._core.dispatcher.runner.run_abstract_task", MagicMock())
+    mocker.patch("covalent_dispatcher._core.dispatcher.asyncio.create_task")
+    mocker.patch(
+        "covalent_dispatcher._core.dispatcher.get_config", return_value="tcp://local:8786"
+    )
+    mocker.patch(
+        "covalent_dispatcher._core.dispatcher._get_initial_tasks_and_deps",
+        return_value=(2, [0, 1], {0: 0, 1: 0}),
+    )
+
+    counts = []
+
+    class MockQueue:
+        def __init__(self):
+            self.messages = [(0, RESULT_STATUS.RUNNING, {}), (0, RESULT_STATUS.COMPLETED, {})]
+            self.messages += [(1, RESULT_STATUS.COMPLETED, {})]
+
+        async def get(self):
+            counts.append(get_ready_task_count())
+            return self.messages.pop(0)
+
+    assert get_ready_task_count() == 0
+    await _run_planned_workflow(result_object, MockQueue())
+    assert counts == [1, 0, 0]
+    assert get_ready_task_count() == 0
+
+
+@pytest.mark.parametrize(
+    "executor,executor_data,expected",
+    [
+        ("local", {}, False),
+        ("dask", {"attributes": {"scheduler_address": ""}}, True),
+        ("dask", {"attributes": {"scheduler_address": "tcp://local:8786"}}, True),
+        ("dask", {"attributes": {"scheduler_address": "tcp://remote:8786"}}, False),
+    ],
+)
+def test_runs_on_local_dask(mocker, executor, executor_data, expected):
+    """Test that only tasks for the Dask cluster started with Covalent are counted."""
+    mocker.patch(
+        "covalent_dispatcher._core.dispatcher.get_config", return_value="tcp://local:8786"
+    )
+    assert _runs_on_local_dask(executor, executor_data) is expected
@@ -18,8 +18,13 @@
 Unit tests for DataStore object
 """
 
+import pytest
+from sqlalchemy import select
+from sqlalchemy.exc import OperationalError
+
 from covalent._shared_files.config import get_config
-from covalent_dispatcher._db.datastore import DataStore
+from covalent_dispatcher._db import models
+from covalent_dispatcher._db.datastore import SQLITE_BUSY_TIMEOUT_MS, DataStore, create_db_engine
 
 
 def test_datastore_init():
@@ -27,3 +32,55 @@ def test_datastore_init():
 
     ds = DataStore(db_URL=None)
     assert ds.db_URL == "sqlite+pysqlite:///" + get_config("dispatcher.db_path")
+
+
+def _pragma(engine, name):
+    with engine.connect() as connection:
+        return connection.exec_driver_sql(f"PRAGMA {name}").scalar()
+
+
+def test_datastore_sqlite_engines(tmp_path):
+    """Test that SQLite databases use write-ahead logging and read-only connections for reads."""
+
+    db_URL = f"sqlite+pysqlite:///{tmp_path / 'workflows.sqlite'}"
+    ds = DataStore(db_URL=db_URL, initialize_db=True)
+    assert ds.read_engine is not ds.engine
+
+    for engine in [ds.engine, ds.read_engine]:
+        assert _pragma(engine, "journal_mode") == "wal"
+        # NORMAL
+        assert _pragma(engine, "synchronous") == 1
+        assert _pragma(engine, "busy_timeout") == SQLITE_BUSY_TIMEOUT_MS
+
+    assert _pragma(ds.engine, "query_only") == 0
+    assert _pragma(ds.read_engine, "query_only") == 1
+
+    with ds.session() as session:
+        session.add(models.Job(id=1))
+    with ds.read_session() as session:
+        assert session.scalars(select(models.Job.id)).all() == [1]
+        with pytest.raises(OperationalError):
+            session.add(models.Job(id=2))
+            session.flush()
+
+
+def test_datastore_in_memory_engines():
+    """Test that reads of an in-memory database go to the same database as writes."""
+
+    ds = DataStore(db_URL="sqlite+pysqlite:///:memory:", initialize_db=True)
+    assert ds.read_engine is ds.engine
+
+
+def test_create_db_engine_pool(mocker, monkeypatch):
+    """Test that client-server databases get a tuned pool and read-only replica connections."""
+
+    monkeypatch.setenv("COVALENT_DATABASE_POOL_SIZE", "4")
+    create_engine_mock = mocker.patch("covalent_dispatcher._db.datastore.create_engine")
+
+    create_db_engine("postgresql://localhost/covalent", read_only=True, max_overflow=1)
+
+    kwargs = create_engine_mock.call_args.kwargs
+    assert kwargs["pool_size"] == 4
+    assert kwargs["max_overflow"] == 1
+    assert kwargs["pool_pre_ping"] is True
+    assert kwargs["connect_args"] == {"options": "-c default_transaction_read_only=on"}
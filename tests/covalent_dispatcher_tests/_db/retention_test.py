@@ -0,0 +1,177 @@
+# Copyright 2023 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the retention jobs deleting old dispatches"""
+
+import os
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+
+from covalent_dispatcher._db import models
+from covalent_dispatcher._db.datastore import DataStore
+from covalent_dispatcher._db.retention import RetentionJob, RetentionPolicy
+
+
+@pytest.fixture
+def db():
+    """Instantiate and return an in-memory database."""
+
+    return DataStore(
+        db_URL="sqlite+pysqlite:///:memory:",
+        initialize_db=True,
+    )
+
+
+def _add_dispatch(session, results_dir, id, status, completed_at, is_active=True, **kwargs):
+    dispatch_id = f"dispatch-{id}"
+    storage_path = os.path.join(results_dir, dispatch_id)
+    os.makedirs(storage_path)
+    with open(os.path.join(storage_path, "result.pkl"), "wb") as f:
+        f.write(b"0" * 100)
+
+    session.add(
+        models.Lattice(
+            id=id,
+            dispatch_id=dispatch_id,
+            name="workflow",
+            status=status,
+            electron_num=1,
+            completed_electron_num=1,
+            storage_path=storage_path,
+            is_active=is_active,
+            started_at=completed_at,
+            completed_at=completed_at,
+            **kwargs,
+        )
+    )
+    session.add(models.Job(id=id))
+    session.add(
+        models.Electron(
+            id=id,
+            parent_lattice_id=id,
+            transport_graph_node_id=0,
+            type="function",
+            name="task",
+            status=status,
+            job_id=id,
+        )
+    )
+    session.add(
+        models.ElectronDependency(
+            electron_id=id, parent_electron_id=id, edge_name="x", parameter_type="arg"
+        )
+    )
+
+
+@pytest.fixture
+def dispatches(db, tmp_path, mocker):
+    """Seed dispatches of different ages and statuses with their artifacts."""
+
+    mocker.patch(
+        "covalent_dispatcher._db.retention.get_config", return_value=str(tmp_path / "qelectron")
+    )
+    results_dir = str(tmp_path / "results")
+    now = datetime.utcnow()
+    with db.session() as session:
+        _add_dispatch(session, results_dir, 1, "COMPLETED", now - timedelta(days=30))
+        _add_dispatch(session, results_dir, 2, "FAILED", now - timedelta(days=20))
+        _add_dispatch(session, results_dir, 3, "COMPLETED", now - timedelta(days=1))
+        _add_dispatch(session, results_dir, 4, "RUNNING", None)
+        _add_dispatch(session, results_dir, 5, "COMPLETED", now, is_active=False)
+        # Sublattice of dispatch 1
+        _add_dispatch(
+            session,
+            results_dir,
+            6,
+            "COMPLETED",
+            now - timedelta(days=30),
+            electron_id=1,
+            root_dispatch_id="dispatch-1",
+        )
+    return results_dir
+
+
+def _remaining(db):
+    with db.session() as session:
+        lattices = session.scalars(select(models.Lattice.id)).all()
+        electrons = session.scalars(select(models.Electron.id)).all()
+        jobs = session.scalars(select(models.Job.id)).all()
+        dependencies = session.scalars(select(models.ElectronDependency.electron_id)).all()
+    return sorted(lattices), sorted(electrons), sorted(jobs), sorted(dependencies)
+
+
+def test_retention_policy_validation():
+    """Test that running dispatches cannot be selected"""
+
+    with pytest.raises(ValueError):
+        RetentionPolicy(statuses=["RUNNING"])
+    with pytest.raises(ValueError):
+        RetentionPolicy(max_size=-1)
+
+
+def test_retention_by_age(db, dispatches):
+    """Test that old and deleted dispatches are removed with their sublattices and artifacts"""
+
+    job = RetentionJob(RetentionPolicy(max_age=timedelta(days=10), statuses=["COMPLETED"]), db)
+    assert job.select_dispatches() == ["dispatch-1", "dispatch-5"]
+
+    job.run()
+
+    progress = job.progress()
+    assert progress["state"] == "completed"
+    assert progress["total_dispatches"] == 2
+    assert progress["deleted_dispatches"] == 2
+    assert progress["removed_directories"] == 3
+    assert _remaining(db) == ([2, 3, 4], [2, 3, 4], [2, 3, 4], [2, 3, 4])
+    assert sorted(os.listdir(dispatches)) == ["dispatch-2", "dispatch-3", "dispatch-4"]
+
+
+def test_retention_by_size(db, dispatches):
+    """Test that the oldest finished dispatches are removed until the artifacts fit"""
+
+    job = RetentionJob(RetentionPolicy(max_size=250), db)
+    assert job.select_dispatches() == ["dispatch-5", "dispatch-1", "dispatch-2"]
+
+
+def test_retention_deleted_only(db, dispatches):
+    """Test that only deleted dispatches are removed by default"""
+
+    job = RetentionJob(RetentionPolicy(), db)
+    assert job.select_dispatches() == ["dispatch-5"]
+
+
+def test_retention_deleted_running(db, dispatches):
+    """Test that dispatches deleted from the UI are kept while they are running"""
+
+    with db.session() as session:
+        _add_dispatch(session, dispatches, 7, "RUNNING", None, is_active=False)
+
+    job = RetentionJob(RetentionPolicy(max_size=0), db)
+    assert "dispatch-7" not in job.select_dispatches()
+
+
+def test_retention_in_chunks(db, dispatches, mocker):
+    """Test that dispatches and sublattices are deleted in chunks"""
+
+    mocker.patch("covalent_dispatcher._db.retention.DELETE_BATCH_SIZE", 1)
+
+    job = RetentionJob(RetentionPolicy(max_age=timedelta(days=10)), db)
+    job.run()
+
+    assert job.progress()["deleted_dispatches"] == 3
+    assert _remaining(db) == ([3, 4], [3, 4], [3, 4], [3, 4])
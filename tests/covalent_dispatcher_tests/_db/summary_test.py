@@ -0,0 +1,136 @@
+# Copyright 2023 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the dispatch summary maintained by the database"""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import delete, select, text, update
+
+from covalent_dispatcher._db import models
+from covalent_dispatcher._db.datastore import DataStore
+from covalent_dispatcher._db.summary import create_dispatch_summary
+
+
+@pytest.fixture
+def db():
+    """Instantiate and return an in-memory database."""
+
+    return DataStore(
+        db_URL="sqlite+pysqlite:///:memory:",
+        initialize_db=True,
+    )
+
+
+def _lattice(id, name, status, electron_id=None, completed_at=None):
+    return models.Lattice(
+        id=id,
+        dispatch_id=f"dispatch-{id}",
+        electron_id=electron_id,
+        name=name,
+        status=status,
+        electron_num=1,
+        completed_electron_num=0,
+        started_at=datetime(2023, 1, 1, 0, 0, 0),
+        completed_at=completed_at,
+    )
+
+
+def _status_counts(session):
+    rows = session.execute(
+        select(
+            models.DispatchStatusCount.status,
+            models.DispatchStatusCount.count,
+            models.DispatchStatusCount.run_time,
+        )
+    ).all()
+    return {status: (count, run_time) for status, count, run_time in rows if count}
+
+
+def _search(session, phrase):
+    rows = session.execute(
+        text("SELECT rowid FROM lattices_search WHERE lattices_search MATCH :phrase"),
+        {"phrase": f'"{phrase}"'},
+    )
+    return sorted(row[0] for row in rows)
+
+
+def test_status_counts_follow_lattice_writes(db: DataStore):
+    """Test that the status counts are updated on inserts, transitions and deletions"""
+
+    with db.session() as session:
+        session.add(_lattice(1, "workflow", "RUNNING"))
+        session.add(_lattice(2, "workflow", "RUNNING"))
+        session.add(_lattice(3, "sublattice", "RUNNING", electron_id=1))
+
+    with db.session() as session:
+        assert _status_counts(session) == {"RUNNING": (2, 0)}
+
+        session.execute(
+            update(models.Lattice)
+            .where(models.Lattice.id == 1)
+            .values(status="COMPLETED", completed_at=datetime(2023, 1, 1, 0, 0, 10))
+        )
+        session.execute(
+            update(models.Lattice).where(models.Lattice.id == 2).values(completed_electron_num=1)
+        )
+
+    with db.session() as session:
+        assert _status_counts(session) == {"RUNNING": (1, 0), "COMPLETED": (1, 10000)}
+
+        session.execute(
+            update(models.Lattice).where(models.Lattice.id == 1).values(is_active=False)
+        )
+        session.execute(delete(models.Lattice).where(models.Lattice.id == 2))
+
+    with db.session() as session:
+        assert _status_counts(session) == {}
+
+
+def test_search_index_follows_lattice_writes(db: DataStore):
+    """Test that the search index matches substrings of names and dispatch ids"""
+
+    with db.session() as session:
+        session.add(_lattice(1, "Train_Model", "RUNNING"))
+        session.add(_lattice(2, "evaluate", "RUNNING"))
+
+    with db.session() as session:
+        assert _search(session, "model") == [1]
+        assert _search(session, "dispatch-") == [1, 2]
+
+        session.execute(update(models.Lattice).where(models.Lattice.id == 2).values(name="model"))
+
+    with db.session() as session:
+        assert _search(session, "model") == [1, 2]
+
+
+def test_create_dispatch_summary_backfills(db: DataStore):
+    """Test that existing lattices are counted and indexed when the summary is created"""
+
+    with db.session() as session:
+        session.add(_lattice(1, "workflow", "FAILED"))
+        session.execute(text("DELETE FROM dispatch_status_counts"))
+        session.execute(
+            text("INSERT INTO lattices_search (lattices_search) VALUES ('delete-all')")
+        )
+
+    with db.engine.begin() as connection:
+        create_dispatch_summary(connection)
+
+    with db.session() as session:
+        assert _status_counts(session) == {"FAILED": (1, 0)}
+        assert _search(session, "workflow") == [1]
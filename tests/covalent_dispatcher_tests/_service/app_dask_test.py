@@ -0,0 +1,168 @@
+# Copyright 2023 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for the local Dask cluster service."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from covalent_dispatcher._service.app_dask import (
+    DaskAdminWorker,
+    DaskAutoscaler,
+    QueueDepthReporter,
+)
+
+
+def get_autoscaler(num_workers=2, **kwargs):
+    cluster = MagicMock()
+    cluster.workers = {i: MagicMock() for i in range(num_workers)}
+    params = {"min_workers": 1, "max_workers": 4, "cooldown": 30}
+    params.update(kwargs)
+    return DaskAutoscaler(cluster, **params)
+
+
+@pytest.mark.parametrize(
+    "queue_depth,busy_tasks,memory_fractions,threads_per_worker,expected",
+    [
+        (0, 0, [], 1, 1),
+        (3, 0, [0.1, 0.1], 1, 3),
+        (2, 1, [0.1, 0.1], 1, 3),
+        (10, 0, [0.1, 0.1], 1, 4),
+        (5, 0, [0.1, 0.1], 2, 3),
+        (0, 0, [0.1, 0.9], 1, 3),
+    ],
+)
+def test_autoscaler_desired_workers(
+    queue_depth, busy_tasks, memory_fractions, threads_per_worker, expected
+):
+    """Test that the desired cluster size follows demand within the bounds"""
+
+    autoscaler = get_autoscaler(threads_per_worker=threads_per_worker)
+    autoscaler.set_queue_depth(queue_depth)
+    assert autoscaler.desired_workers(2, busy_tasks, memory_fractions) == expected
+
+
+@pytest.mark.asyncio
+async def test_autoscaler_step_respects_cooldown(mocker):
+    """Test that the cluster is scaled once and then left alone until the cooldown expires"""
+
+    mock_time = mocker.patch("covalent_dispatcher._service.app_dask.time.monotonic")
+    autoscaler = get_autoscaler(num_workers=2)
+    autoscaler._get_cluster_load = AsyncMock(return_value=(0, [0.1, 0.1]))
+    autoscaler.set_queue_depth(4)
+
+    mock_time.return_value = 100
+    assert await autoscaler.step() == 4
+    autoscaler.cluster.scale.assert_called_once_with(4)
+
+    autoscaler.set_queue_depth(0)
+    mock_time.return_value = 110
+    assert await autoscaler.step() is None
+    autoscaler.cluster.scale.assert_called_once()
+
+    autoscaler._retire_workers = AsyncMock(return_value=[2, 3, 1])
+    autoscaler.cluster.workers = {i: MagicMock() for i in range(4)}
+    mock_time.return_value = 131
+    assert await autoscaler.step() == 1
+    autoscaler._retire_workers.assert_awaited_once_with(3)
+    autoscaler.cluster.scale.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_autoscaler_retire_workers(mocker):
+    """Test that scaling down retires the workers chosen by the scheduler"""
+
+    mock_rpc = mocker.patch("covalent_dispatcher._service.app_dask.rpc")
+    scheduler = mock_rpc.return_value.__aenter__.return_value
+    scheduler.workers_to_close = AsyncMock(return_value=[0, 2])
+    scheduler.retire_workers = AsyncMock()
+
+    autoscaler = get_autoscaler(num_workers=3)
+    autoscaler.cluster.worker_spec = {0: {}, 1: {}, 2: {}}
+    assert await autoscaler._retire_workers(2) == [0, 2]
+
+    scheduler.workers_to_close.assert_awaited_once_with(n=2, attribute="name")
+    scheduler.retire_workers.assert_awaited_once_with(
+        names=[0, 2], remove=True, close_workers=True
+    )
+    assert autoscaler.cluster.worker_spec == {1: {}}
+    autoscaler.cluster.scale.assert_called_once_with(1)
+
+
+@pytest.mark.asyncio
+async def test_autoscaler_step_without_idle_workers():
+    """Test that the cooldown is not started when the scheduler retires no worker"""
+
+    autoscaler = get_autoscaler(num_workers=3)
+    autoscaler._get_cluster_load = AsyncMock(return_value=(0, [0.1, 0.1, 0.1]))
+    autoscaler._retire_workers = AsyncMock(return_value=[])
+
+    assert await autoscaler.step() is None
+    assert autoscaler._last_scaled is None
+
+
+@pytest.mark.asyncio
+async def test_autoscaler_get_cluster_load(mocker):
+    """Test that busy tasks and memory usage are aggregated over the workers"""
+
+    identity = {
+        "workers": {
+            "tcp://w1": {
+                "memory_limit": 100,
+                "metrics": {"memory": 50, "task_counts": {"executing": 1, "memory": 3}},
+            },
+            "tcp://w2": {
+                "memory_limit": 100,
+                "metrics": {"memory": 20, "task_counts": {"executing": 1, "ready": 2}},
+            },
+        }
+    }
+    mock_rpc = mocker.patch("covalent_dispatcher._service.app_dask.rpc")
+    mock_rpc.return_value.__aenter__.return_value.identity = AsyncMock(return_value=identity)
+
+    autoscaler = get_autoscaler()
+    assert await autoscaler._get_cluster_load() == (4, [0.5, 0.2])
+
+
+@pytest.mark.asyncio
+async def test_admin_worker_set_queue_depth():
+    """Test that the admin handler forwards the dispatcher queue depth to the autoscaler"""
+
+    autoscaler = get_autoscaler()
+    admin = DaskAdminWorker(MagicMock(), "127.0.0.1", 0, autoscaler=autoscaler)
+
+    await admin.handlers["cluster_queue_depth"](depth=7)
+    assert autoscaler.queue_depth == 7
+
+
+@pytest.mark.asyncio
+async def test_queue_depth_reporter(mocker):
+    """Test that the reporter sends the dispatcher queue depth to the admin server"""
+
+    mocker.patch(
+        "covalent_dispatcher._service.app_dask.get_config",
+        side_effect=lambda key: {"dask.admin_host": "127.0.0.1", "dask.admin_port": 1234}[key],
+    )
+    mock_rpc = mocker.patch("covalent_dispatcher._service.app_dask.rpc")
+    mock_queue_depth = mock_rpc.return_value.__aenter__.return_value.cluster_queue_depth
+    mock_queue_depth.side_effect = AsyncMock()
+
+    reporter = QueueDepthReporter(lambda: 5, interval=1)
+    await reporter.report()
+
+    mock_rpc.assert_called_once_with("tcp://127.0.0.1:1234", timeout=2)
+    mock_queue_depth.assert_called_once_with(depth=5)
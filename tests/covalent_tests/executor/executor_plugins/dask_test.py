@@ -284,3 +284,48 @@ def test_dask_task_cancel(mocker):
     result = asyncio.run(dask_exec.cancel(task_metadata, job_handle))
     mock_app_log.assert_called_with(f"Cancelled future with key {job_handle}")
     assert result is True
+
+
+def test_dask_executor_keep_outputs_on_cluster(mocker):
+    """Test that outputs stay on the cluster and are passed to downstream tasks as futures"""
+
+    import gc
+
+    from dask.distributed import Future, LocalCluster
+
+    from covalent._workflow.transportable_object import TransportableObject
+    from covalent.executor.executor_plugins import dask as dask_plugin
+
+    cluster = LocalCluster()
+
+    dask_exec = DaskExecutor(cluster.scheduler_address, keep_outputs_on_cluster=True)
+    mocker.patch.object(dask_exec, "get_cancel_requested", AsyncMock(return_value=False))
+    mocker.patch.object(dask_exec, "set_job_handle", AsyncMock())
+    resolve_spy = mocker.spy(dask_plugin, "_resolve_cluster_future")
+
+    def produce():
+        return TransportableObject([1, 2, 3])
+
+    def consume(x):
+        return sum(x.get_deserialized())
+
+    async def run_tasks():
+        parent_output = await dask_exec.run(produce, [], {}, {"dispatch_id": "asdf", "node_id": 0})
+        assert id(parent_output) in dask_plugin._cluster_futures[cluster.scheduler_address]
+
+        child_output = await dask_exec.run(
+            consume, [parent_output], {}, {"dispatch_id": "asdf", "node_id": 1}
+        )
+        assert isinstance(resolve_spy.spy_return, Future)
+        assert child_output == 6
+
+        # Drop every reference to the parent output, including the ones held by the spy
+        resolve_spy.reset_mock()
+        del parent_output
+        gc.collect()
+        return child_output
+
+    asyncio.run(run_tasks())
+
+    assert not dask_plugin._cluster_futures[cluster.scheduler_address]
+    cluster.close()
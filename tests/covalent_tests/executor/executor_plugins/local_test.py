@@ -170,7 +170,8 @@ def local_executor_run__mock_task(x):
     return x**2
 
 
-def test_local_executor_run(mocker):
+def test_local_executor_run(mocker, monkeypatch, tmp_path):
+    monkeypatch.setenv("COVALENT_DATA_DIR", str(tmp_path))
     le = LocalExecutor()
     mock_set_job_handle = mocker.patch.object(le, "set_job_handle", MagicMock(return_value=42))
     mock_get_cancel_requested = mocker.patch.object(
@@ -190,7 +191,8 @@ def local_executor_run_exception_handling__mock_task(x):
     raise RuntimeError("error")
 
 
-def test_local_executor_run_exception_handling(mocker):
+def test_local_executor_run_exception_handling(mocker, monkeypatch, tmp_path):
+    monkeypatch.setenv("COVALENT_DATA_DIR", str(tmp_path))
     le = LocalExecutor()
     mock_set_job_handle = mocker.patch.object(le, "set_job_handle", MagicMock(return_value=42))
     mock_get_cancel_requested = mocker.patch.object(
@@ -206,6 +208,9 @@ def test_local_executor_run_exception_handling(mocker):
     le._task_stdout.getvalue() == "f output"
     assert "RuntimeError" in le._task_stderr.getvalue()
 
+    # Output is streamed to the node's log file as the task runs
+    assert (tmp_path / "asdf" / "node_1" / "stdout.log").read_text() == "f output\n"
+
 
 def test_local_executor_get_cancel_requested(mocker):
     """
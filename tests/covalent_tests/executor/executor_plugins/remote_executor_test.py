@@ -16,12 +16,13 @@
 
 """Tests for Covalent remote executor."""
 
+import asyncio
 import tempfile
 from typing import Dict
 
 import pytest
 
-from covalent.executor.executor_plugins.remote_executor import RemoteExecutor
+from covalent.executor.executor_plugins.remote_executor import RemoteExecutor, StatusPoller
 
 
 class MockRemoteExecutor(RemoteExecutor):
@@ -155,3 +156,158 @@ async def test_cancel():
     """Test sending cancel workflow request to remote backend"""
     res = await MockRemoteExecutor().cancel()
     assert res == "workflow cancel request succeeded"
+
+
+class MockBackend:
+    """Mock remote backend whose jobs finish after a given number of status queries."""
+
+    def __init__(self, polls_to_finish: Dict):
+        self.polls_to_finish = polls_to_finish
+        self.calls = []
+
+    async def get_statuses(self, job_handles):
+        self.calls.append(list(job_handles))
+        statuses = {}
+        for job_handle in job_handles:
+            self.polls_to_finish[job_handle] -= 1
+            statuses[job_handle] = "DONE" if self.polls_to_finish[job_handle] <= 0 else "RUNNING"
+        return statuses
+
+
+class MockBatchRemoteExecutor(MockRemoteExecutor):
+    def __init__(self, backend):
+        super().__init__()
+        self.backend = backend
+        self.credentials_file = "mock_credentials"
+        self.poll_freq = 0.04
+        self.min_poll_freq = 0.01
+
+    async def get_statuses(self, job_handles):
+        return await self.backend.get_statuses(job_handles)
+
+    def is_terminal_status(self, status):
+        return status == "DONE"
+
+
+@pytest.mark.asyncio
+async def test_wait_for_completion_batches_status_queries():
+    """Test that the shared poller batches the status queries of many jobs"""
+
+    backend = MockBackend({f"job-{i}": 1 for i in range(100)})
+    executors = [MockBatchRemoteExecutor(backend) for _ in range(100)]
+
+    statuses = await asyncio.gather(
+        *[executor.wait_for_completion(f"job-{i}") for i, executor in enumerate(executors)]
+    )
+
+    assert statuses == ["DONE"] * 100
+    assert len(backend.calls) < 10
+    assert sorted(h for call in backend.calls for h in call) == sorted(
+        f"job-{i}" for i in range(100)
+    )
+    assert len(executors[0].get_status_poller()) == 0
+
+
+@pytest.mark.asyncio
+async def test_status_poller_backoff(mocker):
+    """Test that the polling interval grows up to the maximum for long jobs"""
+
+    backend = MockBackend({"job": 3})
+    poller = StatusPoller(
+        backend.get_statuses, lambda s: s == "DONE", min_interval=1, max_interval=3, backoff=2
+    )
+    schedule_spy = mocker.spy(poller, "_schedule_poll")
+
+    poller.watch("job")
+    await poller.poll(["job"])
+    await poller.poll(["job"])
+    await poller.poll(["job"])
+
+    assert [c.args[1] for c in schedule_spy.call_args_list] == [1, 2, 3]
+    assert poller._futures == {}
+    poller._task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_status_poller_notify():
+    """Test that pushed completions resolve the waiting task without polling"""
+
+    backend = MockBackend({"job": 100})
+    executor = MockBatchRemoteExecutor(backend)
+    executor.min_poll_freq = 10
+
+    waiter = asyncio.create_task(executor.wait_for_completion("job"))
+    await asyncio.sleep(0)
+    executor.notify_completion("job", "DONE")
+
+    assert await waiter == "DONE"
+    assert backend.calls == []
+
+
+@pytest.mark.asyncio
+async def test_status_poller_backend_error():
+    """Test that jobs only fail after repeated backend errors"""
+
+    calls = []
+
+    async def get_statuses(job_handles):
+        calls.append(list(job_handles))
+        raise RuntimeError("backend unavailable")
+
+    poller = StatusPoller(
+        get_statuses, lambda s: True, min_interval=0.01, max_interval=0.01, max_errors=3
+    )
+    with pytest.raises(RuntimeError, match="backend unavailable"):
+        await poller.watch("job")
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_status_poller_transient_error():
+    """Test that a transient backend error does not fail the jobs of the batch"""
+
+    backend = MockBackend({"job-1": 2, "job-2": 2})
+    failures = [RuntimeError("backend unavailable")]
+
+    async def get_statuses(job_handles):
+        if failures:
+            raise failures.pop()
+        return await backend.get_statuses(job_handles)
+
+    poller = StatusPoller(
+        get_statuses, lambda s: s == "DONE", min_interval=0.01, max_interval=0.01
+    )
+    statuses = await asyncio.gather(poller.watch("job-1"), poller.watch("job-2"))
+    assert statuses == ["DONE", "DONE"]
+
+
+@pytest.mark.asyncio
+async def test_status_poller_job_error():
+    """Test that an exception returned as the status of a job only fails that job"""
+
+    async def get_statuses(job_handles):
+        return {"job-1": ValueError("job not found"), "job-2": "DONE"}
+
+    poller = StatusPoller(
+        get_statuses, lambda s: s == "DONE", min_interval=0.01, max_interval=0.01
+    )
+    failed = poller.watch("job-1")
+    done = poller.watch("job-2")
+    assert await done == "DONE"
+    with pytest.raises(ValueError, match="job not found"):
+        await failed
+
+
+def test_status_poller_key():
+    """Test that executors talking to different endpoints do not share a poller"""
+
+    executor_1 = MockBatchRemoteExecutor(None)
+    executor_2 = MockBatchRemoteExecutor(None)
+    assert executor_1._status_poller_key() == executor_2._status_poller_key()
+
+    executor_2.region = "us-west-2"
+    assert executor_1._status_poller_key() != executor_2._status_poller_key()
+
+    executor_1.region = "us-west-2"
+    executor_1.poll_freq = 60
+    assert executor_1._status_poller_key() != executor_2._status_poller_key()
@@ -21,11 +21,24 @@ from unittest.mock import MagicMock
 import pytest
 
 from covalent.executor import BaseExecutor, _executor_manager, _ExecutorManager
+from covalent.executor.utils.plugin_index import PluginSpec
+
+
+@pytest.fixture(autouse=True)
+def reset_executor_manager():
+    """Discard changes made by a test to the shared executor manager."""
+
+    yield
+    vars(_executor_manager).clear()
+    _ExecutorManager.__init__(_executor_manager)
 
 
 def test_get_executor_local(mocker):
     """Test that config is reloaded when the get_executor method is called for the local executor."""
 
+    # Discover the plugins first since that registers their default config too
+    _executor_manager.executor_plugins_map
+
     update_config_mock = mocker.patch("covalent.executor.update_config")
     _executor_manager.get_executor(name="local")
     update_config_mock.assert_called_once_with()
@@ -38,10 +51,30 @@ def test_executor_manager_init(mocker):
         "covalent.executor._ExecutorManager.generate_plugins_list"
     )
 
-    _ExecutorManager()
+    em = _ExecutorManager()
+    generate_plugins_list_mock.assert_not_called()
+
+    # Plugins are discovered on first access of the executor map only
+    em.executor_plugins_map
+    em.executor_plugins_map
     generate_plugins_list_mock.assert_called_once_with()
 
 
+def test_plugin_classes_resolved_lazily():
+    """Test that executor classes are resolved as module attributes on first access."""
+
+    import covalent.executor as executor_module
+    from covalent.quantum.qcluster.simulator import Simulator
+
+    assert executor_module.LocalExecutor.__name__ == "LocalExecutor"
+    assert issubclass(executor_module.LocalExecutor, BaseExecutor)
+    assert executor_module.Simulator is Simulator
+    assert "LocalExecutor" in vars(executor_module)
+
+    with pytest.raises(AttributeError):
+        executor_module.NonExistentExecutor
+
+
 def test_executor_manager_generate_plugins_list(mocker):
     """Test the generate plugins list method of the executor manager object."""
 
@@ -49,6 +82,7 @@ def test_executor_manager_generate_plugins_list(mocker):
 
     em = _ExecutorManager()
     init_mock.called_once_with()
+    em._plugin_specs = {}
 
     load_executors_mock = mocker.patch("covalent.executor._ExecutorManager._load_executors")
 
@@ -60,16 +94,49 @@ def test_executor_manager_generate_plugins_list(mocker):
     load_installed_plugins_mock = mocker.patch(
         "covalent.executor._ExecutorManager._load_installed_plugins"
     )
+    mocker.patch("covalent.executor.get_plugins_fingerprint", return_value="fingerprint")
+    read_plugin_index_mock = mocker.patch("covalent.executor.read_plugin_index", return_value=None)
+    write_plugin_index_mock = mocker.patch("covalent.executor.write_plugin_index")
 
     em.generate_plugins_list()
-    os_path_join_mock.assert_called_once_with("covalent", "executor_plugins")
-    get_config_mock.assert_called_once_with("sdk.executor_dir")
+    assert os_path_join_mock.mock_calls[0] == mocker.call("covalent", "executor_plugins")
+    get_config_mock.assert_any_call("sdk.executor_dir")
+    read_plugin_index_mock.assert_called_once_with("pkg_plugins_path", "fingerprint")
 
     assert load_executors_mock.mock_calls == [
         mocker.call("pkg_plugins_path"),
         mocker.call("user_plugins_path"),
     ]
-    load_installed_plugins_mock.called_once_with()
+    load_installed_plugins_mock.assert_called_once_with()
+    write_plugin_index_mock.assert_called_once()
+
+
+def test_executor_manager_generate_plugins_list_from_index(mocker):
+    """Test that plugins are listed from an up to date index without importing them."""
+
+    mocker.patch("covalent.executor._ExecutorManager.__init__", return_value=None)
+    em = _ExecutorManager()
+    em.executor_plugins_map = {}
+
+    plugin_spec = PluginSpec(
+        name="mock", class_name="MockExecutor", module="mock_module", defaults={"a": 1}
+    )
+    mocker.patch("covalent.executor.read_plugin_index", return_value=[plugin_spec])
+    load_executors_mock = mocker.patch("covalent.executor._ExecutorManager._load_executors")
+    update_config_mock = mocker.patch("covalent.executor.update_config")
+    load_mock = mocker.patch.object(PluginSpec, "load", return_value="MockExecutor class")
+
+    em.generate_plugins_list()
+    load_executors_mock.assert_not_called()
+    update_config_mock.assert_called_once_with(
+        {"executors": {"mock": {"a": 1}}}, override_existing=False
+    )
+    assert em.executor_plugins_map.find("MockExecutor") == "mock"
+    load_mock.assert_not_called()
+
+    assert em.executor_plugins_map["mock"] == "MockExecutor class"
+    assert em.executor_plugins_map["mock"] == "MockExecutor class"
+    load_mock.assert_called_once_with()
 
 
 def test_get_executor(mocker):
@@ -125,7 +192,7 @@ def test_warning_when_plugin_name_is_invalid(mocker):
     em = _ExecutorManager()
     the_module = MagicMock()
     the_module.__name__ = "test_module"
-    em._is_plugin_name_valid = MagicMock(return_value=False)
+    mocker.patch.object(em, "_is_plugin_name_valid", return_value=False)
     app_log_mock = mocker.patch("covalent.executor.app_log")
 
     em._populate_executor_map_from_module(the_module)
@@ -138,8 +205,8 @@ def test_zero_plugin_class_else_case(mocker):
     em = _ExecutorManager()
     the_module = MagicMock()
     the_module.__name__ = "test_module"
-    em._is_plugin_name_valid = MagicMock(return_value=True)
-    em.nonzero_plugin_classes = MagicMock(return_value=False)
+    mocker.patch.object(em, "_is_plugin_name_valid", return_value=True)
+    mocker.patch.object(em, "nonzero_plugin_classes", return_value=False)
     app_log_mock = mocker.patch("covalent.executor.app_log")
 
     mocker.patch("covalent.executor.inspect.getmembers")
@@ -0,0 +1,99 @@
+# Copyright 2023 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the executor plugin index"""
+
+import os
+import time
+
+from covalent.executor.utils.plugin_index import (
+    PluginSpec,
+    get_plugins_fingerprint,
+    read_plugin_index,
+    write_plugin_index,
+)
+
+PLUGIN_MODULE = """
+EXECUTOR_PLUGIN_NAME = "MockExecutor"
+
+
+class MockExecutor:
+    pass
+"""
+
+
+def test_plugin_index_round_trip(tmp_path):
+    """Test that the index is only read back while the fingerprint matches"""
+
+    index_path = str(tmp_path / "cache" / "executor_plugins.json")
+    plugins = [
+        PluginSpec(name="local", class_name="LocalExecutor", module="local", defaults={"a": 1}),
+        PluginSpec(name="mock", class_name="MockExecutor", module="mock_plugin"),
+    ]
+
+    assert read_plugin_index(index_path, "fingerprint") is None
+
+    write_plugin_index(index_path, "fingerprint", plugins)
+    assert read_plugin_index(index_path, "fingerprint") == plugins
+    assert read_plugin_index(index_path, "other fingerprint") is None
+
+
+def test_plugin_index_not_written_for_unserializable_defaults(tmp_path):
+    """Test that plugins with defaults which are not JSON serializable are discovered again"""
+
+    index_path = str(tmp_path / "executor_plugins.json")
+    plugins = [PluginSpec(name="mock", class_name="Mock", module="mock", defaults={"a": object()})]
+
+    write_plugin_index(index_path, "fingerprint", plugins)
+    assert not os.path.exists(index_path)
+    assert os.listdir(tmp_path) == []
+
+
+def test_plugins_fingerprint(tmp_path):
+    """Test that adding or changing a plugin module changes the fingerprint"""
+
+    plugin_dir = str(tmp_path)
+    fingerprint = get_plugins_fingerprint([plugin_dir])
+    assert get_plugins_fingerprint([plugin_dir]) == fingerprint
+
+    module_file = tmp_path / "mock_plugin.py"
+    module_file.write_text(PLUGIN_MODULE)
+    new_fingerprint = get_plugins_fingerprint([plugin_dir])
+    assert new_fingerprint != fingerprint
+
+    mtime = time.time() + 10
+    os.utime(module_file, (mtime, mtime))
+    assert get_plugins_fingerprint([plugin_dir]) != new_fingerprint
+
+
+def test_plugin_spec_load(tmp_path):
+    """Test loading plugin classes from a file and from an importable module"""
+
+    module_file = tmp_path / "mock_plugin.py"
+    module_file.write_text(PLUGIN_MODULE)
+
+    spec = PluginSpec(
+        name="mock_plugin",
+        class_name="MockExecutor",
+        module=str(module_file)[:-3],
+        path=str(module_file),
+    )
+    assert spec.load().__name__ == "MockExecutor"
+
+    spec = PluginSpec(
+        name="sp", class_name="SpooledStream", module="covalent.executor.utils.wrappers"
+    )
+    assert spec.load().__name__ == "SpooledStream"
@@ -0,0 +1,84 @@
+# Copyright 2023 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for the executor wrappers"""
+
+import sys
+
+import covalent.executor.utils.wrappers as wrappers
+from covalent.executor.utils.wrappers import SpooledStream, io_wrapper
+
+
+def test_spooled_stream(tmp_path):
+    """Test that all output is retained and streamed to the log file as it is written"""
+
+    log_path = tmp_path / "node_0" / "stdout.log"
+    stream = SpooledStream(spool_size=4, log_path=str(log_path))
+    stream.write("hello ")
+    assert log_path.read_text() == "hello "
+    stream.write("world")
+
+    assert stream.bytes_written == 11
+    assert stream.getvalue() == "hello world"
+    assert log_path.read_text() == "hello world"
+
+    stream.write("!")
+    assert stream.getvalue() == "hello world!"
+    assert stream.getvalue(max_bytes=6) == "[... 6 bytes of output truncated ...]\nworld!"
+    assert stream.getvalue(max_bytes=12) == "hello world!"
+    stream.close()
+
+
+def test_io_wrapper(tmp_path):
+    """Test that io_wrapper captures output and tracebacks"""
+
+    def task(x):
+        print("a" * 10)
+        print("error", file=sys.stderr)
+        return x + 1
+
+    stdout_path = tmp_path / "stdout.log"
+    stderr_path = tmp_path / "stderr.log"
+    output, stdout, stderr, tb = io_wrapper(
+        task, [1], {}, str(tmp_path), str(stdout_path), str(stderr_path)
+    )
+    assert output == 2
+    assert stdout == "a" * 10 + "\n"
+    assert stderr == "error\n"
+    assert tb == ""
+    assert stdout_path.read_text() == stdout
+    assert stderr_path.read_text() == stderr
+
+    output, stdout, stderr, tb = io_wrapper(task, ["1"], {}, str(tmp_path))
+    assert output is None
+    assert stdout == "a" * 10 + "\n"
+    assert "TypeError" in tb
+
+
+def test_io_wrapper_bounds_returned_output(tmp_path, monkeypatch):
+    """Test that io_wrapper returns only the tail of long output but logs all of it"""
+
+    monkeypatch.setattr(wrappers, "STREAM_SPOOL_SIZE", 16)
+
+    def task():
+        print("a" * 100 + "b" * 15)
+
+    stdout_path = tmp_path / "stdout.log"
+    _, stdout, stderr, _ = io_wrapper(task, [], {}, str(tmp_path), str(stdout_path))
+    assert stdout == "[... 100 bytes of output truncated ...]\n" + "b" * 15 + "\n"
+    assert stderr == ""
+    assert stdout_path.read_text() == "a" * 100 + "b" * 15 + "\n"
@@ -46,7 +46,7 @@ class TestRsyncStrategy:
         Popen.communicate.return_value = ("", "")
         Popen.returncode = 0
         popen_mock = mocker.patch(
-            "covalent._file_transfer.strategies.rsync_strategy.Popen", return_value=Popen
+            "covalent._shared_files.subprocess_runner.Popen", return_value=Popen
         )
         mocker.patch(
             "covalent._file_transfer.strategies.rsync_strategy.Rsync.get_rsync_ssh_cmd",
@@ -82,7 +82,7 @@ class TestRsyncStrategy:
         Popen = Mock()
         Popen.communicate.return_value = ("", "syntax or usage error (code 1)")
         Popen.returncode = 1
-        mocker.patch("covalent._file_transfer.strategies.rsync_strategy.Popen", return_value=Popen)
+        mocker.patch("covalent._shared_files.subprocess_runner.Popen", return_value=Popen)
         mocker.patch(
             "covalent._file_transfer.strategies.rsync_strategy.Rsync.get_rsync_ssh_cmd",
             return_value=MOCK_CMD,
@@ -152,3 +152,41 @@ class TestRsyncStrategy:
             download_cmd_without_key
             == f"rsync -ae ssh {self.MOCK_USER}@{self.MOCK_HOST}:{self.MOCK_REMOTE_FILEPATH} {self.MOCK_LOCAL_FILEPATH}"
         )
+
+    def test_get_ssh_rsync_cmd_with_multiplexing(self, mocker):
+        mocker.patch("os.path.exists", return_value=True)
+        mocker.patch(
+            "covalent._file_transfer.strategies.rsync_strategy.get_ssh_control_options",
+            return_value="-o ControlMaster=auto",
+        )
+
+        local_file = File(self.MOCK_LOCAL_FILEPATH)
+        remote_file = File(self.MOCK_REMOTE_FILEPATH)
+
+        upload_cmd = Rsync(
+            user=self.MOCK_USER,
+            host=self.MOCK_HOST,
+            private_key_path=self.MOCK_PRIVATE_KEY_PATH,
+            multiplex_ssh=True,
+        ).get_rsync_ssh_cmd(local_file, remote_file, transfer_from_remote=False)
+
+        assert (
+            upload_cmd
+            == f'rsync -ae "ssh -i {self.MOCK_PRIVATE_KEY_PATH} -o ControlMaster=auto" {self.MOCK_LOCAL_FILEPATH} {self.MOCK_USER}@{self.MOCK_HOST}:{self.MOCK_REMOTE_FILEPATH}'
+        )
+
+    def test_remote_transfers_are_limited_per_host(self, mocker):
+        mock_run_sync = mocker.patch(
+            "covalent._shared_files.subprocess_runner.SubprocessRunner.run_sync",
+            return_value=(0, b"", b""),
+        )
+        mocker.patch(
+            "covalent._file_transfer.strategies.rsync_strategy.Rsync.get_rsync_ssh_cmd",
+            return_value="rsync ...",
+        )
+
+        Rsync(user=self.MOCK_USER, host=self.MOCK_HOST).upload(
+            File("/tmp/source.csv"), File("/tmp/dest.csv")
+        )()
+
+        mock_run_sync.assert_called_once_with("rsync ...", host=self.MOCK_HOST)
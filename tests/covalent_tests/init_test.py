@@ -0,0 +1,30 @@
+# Copyright 2023 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the public namespace of the covalent package"""
+
+import importlib
+
+import covalent as ct
+
+
+def test_public_namespace():
+    """Test that lazily imported attributes are exported but helper imports are not"""
+
+    assert "qelectron" in ct.__all__
+    assert "QCluster" in ct.__all__
+    assert "import_module" not in ct.__all__
+    assert importlib.import_module.__module__ == "importlib"
@@ -0,0 +1,104 @@
+# Copyright 2023 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for the QElectron database utilities"""
+
+import base64
+
+from covalent._shared_files.qelectron_utils import (
+    _QE_DB_DATA_MARKER,
+    attach_qelectron_db,
+    collect_qelectron_db,
+    extract_qelectron_db,
+    pop_qelectron_db,
+    remove_qelectron_db,
+)
+from covalent._workflow.transport import TransportableObject
+from covalent.executor.utils import set_context
+
+
+def test_extract_qelectron_db():
+    """Test that the database printed between markers is extracted from stdout"""
+
+    data = b"mock-data.mdb"
+    encoded = base64.b64encode(data).decode()
+    stdout = f"hello\n{_QE_DB_DATA_MARKER}{encoded}{_QE_DB_DATA_MARKER}\n"
+
+    assert extract_qelectron_db(stdout) == ("hello", data)
+    assert remove_qelectron_db(stdout) == "hello"
+    assert extract_qelectron_db("hello\n") == ("hello\n", b"")
+    assert extract_qelectron_db(f"hello {_QE_DB_DATA_MARKER}") == (
+        f"hello {_QE_DB_DATA_MARKER}",
+        b"",
+    )
+    assert extract_qelectron_db("") == ("", b"")
+
+
+def test_attach_and_pop_qelectron_db(mocker, tmp_path):
+    """Test that the database is returned alongside the task output"""
+
+    mocker.patch(
+        "covalent._shared_files.qelectron_utils.get_config",
+        return_value={"qelectron_db_path": str(tmp_path)},
+    )
+    output = TransportableObject(1)
+
+    with set_context(0, "mock-dispatch-id"):
+        collect_qelectron_db()
+    attach_qelectron_db(output)
+    assert pop_qelectron_db(output) == b""
+
+    node_dir = tmp_path / "mock-dispatch-id" / "node-0"
+    node_dir.mkdir(parents=True)
+    (node_dir / "data.mdb").write_bytes(b"mock-data.mdb")
+
+    with set_context(0, "mock-dispatch-id"):
+        collect_qelectron_db()
+    attach_qelectron_db(output)
+    assert pop_qelectron_db(output) == b"mock-data.mdb"
+
+    # The collected database is only attached once
+    attach_qelectron_db(output)
+    assert pop_qelectron_db(output) == b""
+
+    # The output is restored to its original form
+    assert output == TransportableObject(1)
+    assert pop_qelectron_db(None) == b""
+
+
+def test_qelectron_db_survives_serialization(mocker, tmp_path):
+    """Test that the database attached to the output survives its archived form"""
+
+    mocker.patch(
+        "covalent._shared_files.qelectron_utils.get_config",
+        return_value={"qelectron_db_path": str(tmp_path)},
+    )
+    node_dir = tmp_path / "mock-dispatch-id" / "node-0"
+    node_dir.mkdir(parents=True)
+    (node_dir / "data.mdb").write_bytes(b"mock-data.mdb")
+
+    output = TransportableObject(1)
+    with set_context(0, "mock-dispatch-id"):
+        collect_qelectron_db()
+    attach_qelectron_db(output)
+
+    received = TransportableObject.deserialize(output.serialize())
+    assert pop_qelectron_db(received) == b"mock-data.mdb"
+    assert received.get_deserialized() == 1
+
+    received = TransportableObject.from_dict(output.to_dict())
+    assert pop_qelectron_db(received) == b"mock-data.mdb"
@@ -0,0 +1,98 @@
+# Copyright 2023 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for the subprocess runner module."""
+
+import asyncio
+
+import pytest
+
+from covalent._shared_files.subprocess_runner import (
+    SubprocessRunner,
+    get_ssh_control_options,
+    get_subprocess_runner,
+)
+
+
+@pytest.mark.asyncio
+async def test_run_streams_stdout():
+    """Test that stdout lines are passed to the callback and returned"""
+
+    lines = []
+    proc, stdout, stderr = await SubprocessRunner().run(
+        "echo one && echo two && echo err 1>&2", stdout_callback=lines.append
+    )
+
+    assert proc.returncode == 0
+    assert lines == [b"one\n", b"two\n"]
+    assert stdout == b"one\ntwo\n"
+    assert stderr == b"err\n"
+
+
+@pytest.mark.asyncio
+async def test_run_reads_long_lines():
+    """Test that lines longer than the stream reader limit are read in full"""
+
+    long_line = b"x" * 100_000
+    lines = []
+    proc, stdout, stderr = await SubprocessRunner().run(
+        "printf '%0100000d\\n' 0 | tr 0 x && printf tail && printf '%0100000d' 0 1>&2",
+        stdout_callback=lines.append,
+    )
+
+    assert proc.returncode == 0
+    assert lines == [long_line + b"\n", b"tail"]
+    assert stdout == long_line + b"\ntail"
+    assert stderr == b"0" * 100_000
+
+
+@pytest.mark.asyncio
+async def test_run_limits_concurrency_per_host(tmp_path):
+    """Test that no more than `max_per_host` commands run against a host at once"""
+
+    runner = SubprocessRunner(max_concurrency=10, max_per_host=2)
+    # Each command records how many commands were running when it started
+    cmd = f"f=$(mktemp -p {tmp_path}); ls {tmp_path} | wc -l; sleep 0.2; rm $f"
+
+    results = await asyncio.gather(*[runner.run(cmd, host="remote") for _ in range(6)])
+
+    assert max(int(stdout) for _, stdout, _ in results) <= 2
+
+
+def test_run_sync():
+    """Test running a command synchronously"""
+
+    returncode, stdout, stderr = SubprocessRunner().run_sync("echo hello", host="remote")
+    assert returncode == 0
+    assert stdout == b"hello\n"
+
+    returncode, _, stderr = SubprocessRunner().run_sync("exit 3")
+    assert returncode == 3
+
+
+def test_get_subprocess_runner_is_shared():
+    """Test that a single runner is shared by the process"""
+
+    assert get_subprocess_runner() is get_subprocess_runner()
+
+
+def test_get_ssh_control_options():
+    """Test the ssh connection multiplexing options"""
+
+    options = get_ssh_control_options("/tmp/ssh", persist=30)
+    assert options == (
+        "-o ControlMaster=auto -o ControlPath=/tmp/ssh/covalent-%r@%h:%p -o ControlPersist=30"
+    )
@@ -16,6 +16,7 @@
 
 """Electron test"""
 import datetime
+from urllib.parse import quote
 
 import pytest
 from numpy import array
@@ -165,6 +166,40 @@ def test_electrons_details_stdout():
         assert response.json() == test_data["response_data"]
 
 
+def test_electrons_log_tail():
+    """Test following an electron's stdout in chunks"""
+    test_data = output_data["test_electrons_details"]["case_stdout_1"]
+    expected = test_data["response_data"]["data"]
+    api_path = "/api/v1/dispatches/{}/electron/{}/tail/{}"
+
+    response = object_test_template(
+        api_path=api_path,
+        app=fastapi_app,
+        method_type=MethodType.GET,
+        path=test_data["path"],
+    )
+    assert response.status_code == 200
+    assert response.json() == {"data": expected, "offset": len(expected)}
+
+    response = object_test_template(
+        api_path=api_path,
+        app=fastapi_app,
+        method_type=MethodType.GET,
+        path=test_data["path"],
+        query_data={"offset": 7},
+    )
+    assert response.json() == {"data": expected[7:], "offset": len(expected)}
+
+    path = {**test_data["path"], "dispatch_id": "78525234-72ec-42dc-94a0-f4751707f9ce"}
+    response = object_test_template(
+        api_path=api_path,
+        app=fastapi_app,
+        method_type=MethodType.GET,
+        path=path,
+    )
+    assert response.status_code == 400
+
+
 def test_electrons_details_deps():
     """Test electrons for deps details"""
     test_data = output_data["test_electrons_details"]["case_deps_1"]
@@ -290,6 +325,36 @@ def test_electrons_inputs_bad_request():
         assert response.json() == test_data["response_data"]
 
 
+@pytest.mark.parametrize(
+    "electron_id,inputs",
+    [
+        (3, {"args": ("Hello shore - Node 0 !!", "Hello shore - Node 1  !!"), "kwargs": {}}),
+        (
+            4,
+            {
+                "args": (),
+                "kwargs": {"arg_1": "Hello shore - Node 3 !!", "arg_2": "Hello shore - Node 5 !!"},
+            },
+        ),
+    ],
+)
+def test_electrons_inputs(electron_id, inputs):
+    """Test that electron inputs are rendered from the outputs of the parent electrons"""
+    api_path = output_data["test_electrons_details"]["api_path"]
+    response = object_test_template(
+        api_path=api_path,
+        app=fastapi_app,
+        method_type=MethodType.GET,
+        path={
+            "dispatch_id": "78525234-72ec-42dc-94a0-f4751707f9cd",
+            "electron_id": electron_id,
+            "name": "inputs",
+        },
+    )
+    assert response.status_code == 200
+    assert response.json()["data"] == str(inputs)
+
+
 mock_input_data_jobs = {
     "circuit_0@b72cce1f-a73f-4f3e-8de2-c31cf1d5092f": {
         "electron_node_id": "0",
@@ -394,6 +459,13 @@ mock_input_data_jobs = {
 def qelectron_mocked_data_for_jobs(mocker):
     from covalent.quantum.qserver.database import Database
 
+    # Database written before jobs were indexed.
+    mocker.patch.object(Database, "get_summary", return_value=None)
+    mocker.patch.object(
+        Database,
+        "get",
+        side_effect=lambda job_id, default=None, **_: mock_input_data_jobs.get(job_id, default),
+    )
     return mocker.patch.object(Database, "get_db", return_value=mock_input_data_jobs)
 
 
@@ -409,6 +481,78 @@ def test_get_qelectrons_jobs(qelectron_mocked_data_for_jobs):
     assert response.json() == test_data["response_data"]
 
 
+def test_get_qelectrons_jobs_indexed(mocker, tmp_path):
+    """Test paginating jobs with the index of the QElectron database"""
+    from covalent.quantum.qserver.database import Database
+
+    dispatch_id = "e8fd09c9-1406-4686-9e77-c8d4d64a76ee"
+    mocker.patch(
+        "covalent_ui.api.v1.data_layer.electron_dal._path_to_qelectron_db", return_value=tmp_path
+    )
+    get_db_mock = mocker.patch.object(Database, "get_db")
+
+    job = mock_input_data_jobs["circuit_0@b72cce1f-a73f-4f3e-8de2-c31cf1d5092f"]
+    job_ids = [f"circuit_{i}@b72cce1f-a73f-4f3e-8de2-c31cf1d5092f" for i in range(3)]
+    jobs = [
+        {**job, "circuit_id": job_id, "save_time": job["save_time"] + datetime.timedelta(i)}
+        for i, job_id in enumerate(job_ids)
+    ]
+    Database(tmp_path).set(job_ids, jobs, dispatch_id=dispatch_id, node_id=0)
+
+    api_path = output_data["test_get_qelectrons_jobs"]["api_path"]
+    path = {"dispatch_id": dispatch_id, "node_id": 0}
+    response = object_test_template(
+        api_path=api_path,
+        app=fastapi_app,
+        method_type=MethodType.GET,
+        path=path,
+        query_data={"count": 2},
+    )
+    assert response.status_code == 200
+    assert [job["job_id"] for job in response.json()] == job_ids[:0:-1]
+
+    cursor = quote(response.headers["X-Next-Cursor"])
+    response = object_test_template(
+        api_path=api_path,
+        app=fastapi_app,
+        method_type=MethodType.GET,
+        path=path,
+        query_data={"count": 2, "cursor": cursor},
+    )
+    assert [job["job_id"] for job in response.json()] == job_ids[:1]
+    assert "X-Next-Cursor" not in response.headers
+
+    response = object_test_template(
+        api_path=api_path,
+        app=fastapi_app,
+        method_type=MethodType.GET,
+        path=path,
+        query_data={"sort_by": "job_id", "sort_direction": "ASC", "offset": 1},
+    )
+    assert [job["job_id"] for job in response.json()] == job_ids[1:]
+
+    # Only the index was read.
+    get_db_mock.assert_not_called()
+
+
+def test_qelectron_avg_calls_without_circuits(mocker, tmp_path):
+    """Test the average execution time of a node that executed no circuits"""
+    from covalent.quantum.qserver.database import Database
+    from covalent_ui.api.v1.data_layer.electron_dal import _qelectron_avg_calls
+
+    mocker.patch(
+        "covalent_ui.api.v1.data_layer.electron_dal._path_to_qelectron_db", return_value=tmp_path
+    )
+    mocker.patch.object(
+        Database, "get_summary", return_value={"num_circuits": 0, "total_execution_time": 0.0}
+    )
+    assert _qelectron_avg_calls("dispatch", 0) == 0
+
+    mocker.patch.object(Database, "get_summary", return_value=None)
+    mocker.patch.object(Database, "get_db", return_value={})
+    assert _qelectron_avg_calls("dispatch", 0) == 0
+
+
 def test_get_qelectron_job_detail(qelectron_mocked_data_for_jobs):
     test_data = output_data["test_get_qelectron_job_detail"]["case_1"]
     response = object_test_template(
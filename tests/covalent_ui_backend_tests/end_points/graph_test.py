@@ -60,3 +60,95 @@ def test_graph_invalid_dispatch_id():
     assert response.status_code == test_data["status_code"]
     if "response_data" in test_data:
         assert response.json() == test_data["response_data"]
+
+
+def test_graph_summary():
+    """test graph summary API"""
+    test_data = output_data["test_graph_summary"]["case_group_by_name"]
+    response = object_test_template(
+        api_path=output_data["test_graph_summary"]["api_path"],
+        app=fastapi_app,
+        method_type=MethodType.GET,
+        path=test_data["path"],
+        query_data=test_data["query_data"],
+    )
+    assert response.status_code == test_data["status_code"]
+    summary = response.json()
+    assert summary["group_by"] == "name"
+    assert [
+        (group["group"], group["node_count"], group["status_counts"])
+        for group in summary["groups"]
+    ] == test_data["groups"]
+    links = sorted(summary["links"], key=lambda link: (link["source"], link["target"]))
+    assert links == test_data["links"]
+
+
+def test_graph_summary_invalid_dispatch_id():
+    """test graph summary with invalid dispatch id"""
+    test_data = output_data["test_graph_summary"]["case_invalid_dispatch_id"]
+    response = object_test_template(
+        api_path=output_data["test_graph_summary"]["api_path"],
+        app=fastapi_app,
+        method_type=MethodType.GET,
+        path=test_data["path"],
+        query_data=test_data["query_data"],
+    )
+    assert response.status_code == test_data["status_code"]
+
+
+@pytest.mark.parametrize(
+    "case", ["case_group_by_name", "case_group_by_task_group", "case_invalid_task_group"]
+)
+def test_graph_group(case):
+    """test graph group expansion API"""
+    test_data = output_data["test_graph_group"][case]
+    response = object_test_template(
+        api_path=output_data["test_graph_group"]["api_path"],
+        app=fastapi_app,
+        method_type=MethodType.GET,
+        path=test_data["path"],
+        query_data=test_data["query_data"],
+    )
+    assert response.status_code == test_data["status_code"]
+    if "group" in test_data:
+        graph_group = response.json()
+        assert graph_group["group"] == test_data["group"]
+        assert [node["node_id"] for node in graph_group["graph"]["nodes"]] == test_data["node_ids"]
+        links = sorted(
+            (link["source_group"], link["target_group"]) for link in graph_group["graph"]["links"]
+        )
+        assert links == test_data["links"]
+
+
+def test_graph_cache():
+    """test that graph views are cached until their dispatch is invalidated"""
+    from covalent_ui.api.v1.data_layer.graph_dal import GraphCache
+
+    cache = GraphCache(maxsize=2)
+    builds = []
+
+    def build(view):
+        builds.append(view)
+        return view
+
+    assert cache.get("d1", "summary", lambda: build("d1 summary")) == "d1 summary"
+    assert cache.get("d1", "summary", lambda: build("d1 summary")) == "d1 summary"
+    assert builds == ["d1 summary"]
+
+    cache.get("d2", "summary", lambda: build("d2 summary"))
+    cache.invalidate("d1")
+    assert cache.get("d1", "summary", lambda: build("d1 summary")) == "d1 summary"
+    assert cache.get("d2", "summary", lambda: build("d2 summary")) == "d2 summary"
+    assert builds == ["d1 summary", "d2 summary", "d1 summary"]
+
+    # Views built while their dispatch is invalidated are not cached
+    def build_invalidated():
+        cache.invalidate("d3")
+        return build("d3 summary")
+
+    cache.get("d3", "summary", build_invalidated)
+    cache.get("d3", "summary", lambda: build("d3 summary"))
+    assert builds[-2:] == ["d3 summary", "d3 summary"]
+
+    # Missing dispatches are not cached
+    assert cache.get("d4", "summary", lambda: None) is None
@@ -52,6 +52,32 @@ def test_webhook():
         assert response.json() == test_data["response_data"]
 
 
+def test_webhook_batch(mocker):
+    """Test that batched updates are forwarded to all clients and to dispatch rooms"""
+    emit_mock = mocker.patch("covalent_ui.api.main.sio.emit")
+    invalidate_mock = mocker.patch("covalent_ui.api.main.graph_cache.invalidate")
+    result = {"dispatch_id": "d1", "results_dir": "results", "status": "COMPLETED"}
+    nodes = [{"node_id": 0, "status": "COMPLETED"}]
+    response = object_test_template(
+        api_path=output_data["test_webhook"]["api_path"],
+        app=fastapi_app,
+        method_type=MethodType.POST,
+        body_data={
+            "event": "result-updates",
+            "updates": [
+                {"dispatch_id": "d1", "nodes": nodes, "result": result},
+                {"dispatch_id": "d2", "nodes": []},
+            ],
+        },
+    )
+    assert response.json() == {"ok": True}
+    assert emit_mock.mock_calls == [
+        mocker.call("result-update", {"event": "result-update", "result": result}),
+        mocker.call("node-updates", {"dispatch_id": "d1", "nodes": nodes}, room="d1"),
+    ]
+    assert invalidate_mock.mock_calls == [mocker.call("d1"), mocker.call("d2")]
+
+
 def test_draw(mocker):
     """Test Draw API"""
     test_data = output_data["test_draw"]["case1"]
@@ -152,6 +152,54 @@ def test_list_invalid_offset():
     assert response.status_code == test_data["status_code"]
 
 
+def test_list_cursor():
+    """Test paging through the list with cursors"""
+    api_path = output_data["test_list"]["api_path"]
+    query = {"count": 2, "sort_by": "started_at", "sort_direction": "DESC"}
+
+    response = object_test_template(
+        api_path=api_path, app=fastapi_app, method_type=MethodType.GET, query_data=query
+    )
+    first_page = response.json()
+    assert [item["dispatch_id"][:8] for item in first_page["items"]] == ["e8fd09c9", "a95d84ad"]
+    assert first_page["total_count"] == 3
+
+    response = object_test_template(
+        api_path=api_path,
+        app=fastapi_app,
+        method_type=MethodType.GET,
+        query_data={**query, "cursor": first_page["next_cursor"]},
+    )
+    second_page = response.json()
+    assert [item["dispatch_id"][:8] for item in second_page["items"]] == ["78525234"]
+    assert second_page["next_cursor"] is None
+
+
+def test_list_invalid_cursor():
+    """Test list with a malformed cursor"""
+    response = object_test_template(
+        api_path=output_data["test_list"]["api_path"],
+        app=fastapi_app,
+        method_type=MethodType.GET,
+        query_data={"count": 2, "cursor": "not-a-cursor"},
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize("search", ["a95d84ad", "a9"])
+def test_list_search_index(search):
+    """Test searching the list with and without the search index"""
+    response = object_test_template(
+        api_path=output_data["test_list"]["api_path"],
+        app=fastapi_app,
+        method_type=MethodType.GET,
+        query_data={"count": 10, "search": search},
+    )
+    assert response.status_code == 200
+    assert [item["dispatch_id"][:8] for item in response.json()["items"]] == ["a95d84ad"]
+    assert response.json()["total_count"] == 1
+
+
 def test_delete():
     """Test delete from dispatch list"""
     test_data = output_data["test_delete"]["case1"]
@@ -339,3 +387,29 @@ def test_delete_all_bad_request(mocker):
     assert response.status_code == test_data["status_code"]
     if "response_data" in test_data:
         assert response.json() == test_data["response_data"]
+
+
+def test_retention_running_status():
+    """Test that running dispatches cannot be selected for retention"""
+    test_data = output_data["test_retention"]["case_running_status"]
+    response = object_test_template(
+        api_path=output_data["test_retention"]["api_path"],
+        app=fastapi_app,
+        method_type=MethodType.POST,
+        body_data=test_data["request_data"]["body"],
+    )
+    assert response.status_code == test_data["status_code"]
+    assert response.json() == test_data["response_data"]
+
+
+def test_retention_missing_job():
+    """Test the progress of a retention job which does not exist"""
+    test_data = output_data["test_retention"]["case_missing_job"]
+    response = object_test_template(
+        api_path=output_data["test_retention"]["api_path"] + "/{}",
+        app=fastapi_app,
+        method_type=MethodType.GET,
+        path=test_data["path"],
+    )
+    assert response.status_code == test_data["status_code"]
+    assert response.json() == test_data["response_data"]
@@ -0,0 +1,120 @@
+# Copyright 2023 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Event bus functional test"""
+
+import asyncio
+import threading
+
+import pytest
+
+from covalent_ui.api.main import forward_bus_events
+from covalent_ui.event_bus import EventBus, get_event_bus
+from covalent_ui.result_webhook import UpdatePublisher
+
+pytest_plugins = ("pytest_asyncio",)
+
+
+def test_publish_without_subscribers():
+    """Test that events are not delivered when nobody subscribed"""
+    event_bus = EventBus()
+    assert not event_bus.has_subscribers()
+    assert event_bus.publish("result-updates", {"updates": []}) is False
+
+
+@pytest.mark.asyncio
+async def test_publish_broadcasts_to_subscribers():
+    """Test that every subscriber receives the events published after it subscribed"""
+    event_bus = EventBus()
+    first = event_bus.subscribe()
+    second = event_bus.subscribe()
+
+    assert event_bus.publish("draw-request", {"a": 1}) is True
+    assert await first.get() == ("draw-request", {"a": 1})
+    assert await second.get() == ("draw-request", {"a": 1})
+
+    event_bus.unsubscribe(first)
+    event_bus.publish("draw-request", {"a": 2})
+    assert first.empty()
+    assert await second.get() == ("draw-request", {"a": 2})
+
+
+@pytest.mark.asyncio
+async def test_publish_from_another_thread():
+    """Test that events published from other threads reach the subscriber's loop"""
+    event_bus = EventBus()
+    queue = event_bus.subscribe()
+
+    thread = threading.Thread(target=event_bus.publish, args=("draw-request", {"a": 1}))
+    thread.start()
+    thread.join()
+
+    assert await asyncio.wait_for(queue.get(), timeout=1) == ("draw-request", {"a": 1})
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_drops_oldest_events():
+    """Test that a subscriber which falls behind keeps the latest events"""
+    event_bus = EventBus(maxsize=2)
+    queue = event_bus.subscribe()
+
+    for i in range(3):
+        event_bus.publish("draw-request", {"i": i})
+
+    assert [queue.get_nowait()[1]["i"] for _ in range(queue.qsize())] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_publisher_uses_event_bus(mocker):
+    """Test that updates skip the HTTP webhook when the UI server runs in process"""
+    queue = get_event_bus().subscribe()
+    publisher = UpdatePublisher(interval=0.01)
+    get_session_mock = mocker.patch.object(publisher, "_get_session")
+
+    try:
+        publisher.publish_node("d1", 0, "RUNNING")
+        await publisher._flush_task
+        event, payload = await asyncio.wait_for(queue.get(), timeout=1)
+    finally:
+        get_event_bus().unsubscribe(queue)
+
+    assert event == "result-updates"
+    assert payload == {
+        "updates": [{"dispatch_id": "d1", "nodes": [{"node_id": 0, "status": "RUNNING"}]}]
+    }
+    get_session_mock.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_forward_bus_events(mocker):
+    """Test that the UI server forwards events from the bus to the clients"""
+    emit_mock = mocker.patch("covalent_ui.api.main.sio.emit", new=mocker.AsyncMock())
+    forwarder = asyncio.create_task(forward_bus_events())
+    await asyncio.sleep(0)
+
+    nodes = [{"node_id": 0, "status": "RUNNING"}]
+    get_event_bus().publish("result-updates", {"updates": [{"dispatch_id": "d1", "nodes": nodes}]})
+    get_event_bus().publish("draw-request", {"event": "draw-request"})
+    await asyncio.sleep(0.01)
+
+    forwarder.cancel()
+    await asyncio.gather(forwarder, return_exceptions=True)
+
+    assert emit_mock.mock_calls == [
+        mocker.call("node-updates", {"dispatch_id": "d1", "nodes": nodes}, room="d1"),
+        mocker.call("draw_request", {"event": "draw-request"}),
+    ]
+    assert not get_event_bus().has_subscribers()
@@ -16,9 +16,21 @@
 
 """Lattice functional test"""
 
+import os
 import shutil
-
-from covalent_ui.api.v1.utils.file_handle import FileHandler, transportable_object, validate_data
+import time
+
+import pytest
+
+from covalent_ui.api.v1.utils.file_handle import (
+    FileHandler,
+    FileReadTimeoutError,
+    FileTooLargeError,
+    PreviewCache,
+    run_file_read,
+    transportable_object,
+    validate_data,
+)
 from tests.covalent_ui_backend_tests.utils.assert_data.file_handle import mock_file_data
 from tests.covalent_ui_backend_tests.utils.assert_data.lattices import seed_lattice_data
 from tests.covalent_ui_backend_tests.utils.client_template import TestClientTemplate
@@ -87,6 +99,68 @@ def test_read_from_text_exception():
     remove_mock_files()
 
 
+def test_read_tail(tmp_path):
+    """Test reading text files in chunks from an offset"""
+    (tmp_path / "stdout.log").write_text("0123456789")
+    handler = FileHandler(str(tmp_path))
+
+    assert handler.read_tail("stdout.log", max_bytes=4) == ("6789", 10)
+    assert handler.read_tail("stdout.log", offset=2, max_bytes=4) == ("2345", 6)
+    assert handler.read_tail("stdout.log", offset=20) == ("", 10)
+    assert handler.read_tail("missing.log", offset=3) == (None, 3)
+
+
+def test_preview_cache(tmp_path):
+    """Test that previews are cached until their file changes and evicted least recently used"""
+    cache = PreviewCache(maxsize=2)
+    renders = []
+
+    def render(path):
+        renders.append(path)
+        return open(path).read()
+
+    paths = []
+    for name in ["a", "b", "c"]:
+        paths.append(str(tmp_path / name))
+        with open(paths[-1], "w") as f:
+            f.write(name)
+
+    assert cache.get("text", paths[:1], lambda: render(paths[0])) == "a"
+    assert cache.get("text", paths[:1], lambda: render(paths[0])) == "a"
+    assert renders == [paths[0]]
+
+    with open(paths[0], "w") as f:
+        f.write("changed")
+    os.utime(paths[0], ns=(0, 0))
+    assert cache.get("text", paths[:1], lambda: render(paths[0])) == "changed"
+    assert len(renders) == 2
+
+    cache.get("text", paths[1:2], lambda: render(paths[1]))
+    cache.get("text", paths[2:3], lambda: render(paths[2]))
+    cache.get("text", paths[:1], lambda: render(paths[0]))
+    assert renders[2:] == [paths[1], paths[2], paths[0]]
+
+    # Missing files are rendered every time
+    missing = [str(tmp_path / "missing")]
+    assert cache.get("text", missing, lambda: None) is None
+
+
+def test_file_read_limits(tmp_path, mocker):
+    """Test the timeout and size caps of file reads"""
+    with pytest.raises(FileReadTimeoutError):
+        run_file_read(time.sleep, 1, timeout=0.01)
+
+    mocker.patch("covalent_ui.api.v1.utils.file_handle.MAX_PREVIEW_BYTES", 4)
+    with open(tmp_path / "log.txt", "w") as f:
+        f.write("0123456789")
+    with open(tmp_path / "large.pkl", "wb") as f:
+        f.write(b"0123456789")
+    handler = FileHandler(str(tmp_path))
+    assert handler.read_from_text("log.txt") == "0123"
+    with pytest.raises(FileTooLargeError):
+        handler.read_from_pickle("large.pkl")
+
+
 def test_unpickle_data_exception():
     """Test unpickling data with exceptions"""
     seed_files()
@@ -0,0 +1,107 @@
+# Copyright 2023 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Log index functional test"""
+
+import pytest
+
+from covalent_ui.api.v1.utils import log_index
+from covalent_ui.api.v1.utils.log_index import LogIndex, parse_entry
+
+LOG_LINES = [
+    "[2022-09-23 07:43:59,752] [INFO] Started server process [41482]\n",
+    "[2022-09-23 07:45:01,753] [ERROR] Connection refused\n",
+    "Traceback (most recent call last):\n",
+    "[2022-09-23 07:44:01,753] [INFO] Application startup complete.\n",
+]
+
+
+@pytest.fixture
+def log_path(tmp_path):
+    path = tmp_path / "covalent_ui.log"
+    path.write_text("".join(LOG_LINES))
+    return str(path)
+
+
+def test_parse_entry():
+    """Test parsing an entry with continuation lines"""
+    assert parse_entry(LOG_LINES[1] + LOG_LINES[2]) == {
+        "log_date": "2022-09-23 07:45:01.753000",
+        "status": "ERROR",
+        "message": " Connection refused\n\nTraceback (most recent call last):\n",
+    }
+    assert parse_entry("Killed\n") == {"log_date": None, "status": "INFO", "message": "Killed\n"}
+
+
+def test_log_index_pages(log_path):
+    """Test sorting, searching and paginating log entries"""
+    index = LogIndex(log_path)
+
+    entries, total_count = index.get_entries("log_date", descending=True, count=2)
+    assert total_count == 3
+    assert [entry["log_date"] for entry in entries] == [
+        "2022-09-23 07:45:01.753000",
+        "2022-09-23 07:44:01.753000",
+    ]
+
+    entries, _ = index.get_entries("status", descending=False, count=10, offset=1)
+    assert [entry["status"] for entry in entries] == ["INFO", "INFO"]
+
+    entries, total_count = index.get_entries(search="TRACEBACK", count=10)
+    assert total_count == 1
+    assert entries[0]["status"] == "ERROR"
+
+    # All entries in the order of the log
+    entries, _ = index.get_entries(count=0, offset=1)
+    assert [entry["status"] for entry in entries] == ["ERROR", "INFO"]
+
+
+def test_log_index_incremental_update(log_path, mocker):
+    """Test that only appended entries are parsed and the last entry is extended"""
+    index = LogIndex(log_path)
+    index.update()
+
+    with open(log_path, "a") as logfile:
+        logfile.write("  continued\n")
+        logfile.write("[2022-09-23 07:46:00,000] [WARNING] Disk almost full\n")
+
+    parse_line_spy = mocker.spy(log_index, "_parse_line")
+    index.update()
+    assert parse_line_spy.call_count == 3
+
+    entries, total_count = index.get_entries(count=0)
+    assert total_count == 4
+    assert entries[2]["message"] == " Application startup complete.\n\n  continued\n"
+    assert entries[3]["log_date"] == "2022-09-23 07:46:00"
+
+
+def test_log_index_rebuilt_when_log_is_replaced(log_path):
+    """Test that the index is rebuilt when the log is truncated or rewritten"""
+    index = LogIndex(log_path)
+    index.update()
+
+    with open(log_path, "w") as logfile:
+        logfile.write("[2022-09-24 00:00:00,000] [INFO] Rotated\n")
+
+    entries, total_count = index.get_entries(count=10)
+    assert total_count == 1
+    assert entries[0]["message"] == " Rotated\n"
+
+
+def test_log_index_invalid_sort(log_path):
+    """Test that entries can only be sorted by indexed fields"""
+    with pytest.raises(ValueError):
+        LogIndex(log_path).get_entries(sort_by="message")
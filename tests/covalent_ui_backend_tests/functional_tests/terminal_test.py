@@ -0,0 +1,128 @@
+# Copyright 2023 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Terminal session functional test"""
+
+import asyncio
+import os
+
+import pytest
+
+from covalent_ui.terminal import TerminalSession
+
+pytest_plugins = ("pytest_asyncio",)
+
+
+async def _wait_for(outputs, text, timeout=5):
+    async def contains():
+        while text not in "".join(outputs):
+            await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(contains(), timeout)
+
+
+@pytest.mark.asyncio
+async def test_terminal_sessions(monkeypatch):
+    """Test that concurrent sessions run their own shell and only receive their own output"""
+    monkeypatch.setenv("SHELL", "/bin/sh")
+    outputs = {"a": [], "b": []}
+
+    def emitter(name):
+        async def emit(output):
+            outputs[name].append(output)
+
+        return emit
+
+    sessions = {name: TerminalSession(emitter(name)) for name in outputs}
+    for session in sessions.values():
+        session.start(rows=24, cols=80)
+
+    try:
+        sessions["a"].write("echo session-$((20+1))\n")
+        sessions["b"].write("echo session-$((20+2))\n")
+        await _wait_for(outputs["a"], "session-21")
+        await _wait_for(outputs["b"], "session-22")
+        assert "session-22" not in "".join(outputs["a"])
+    finally:
+        for session in sessions.values():
+            pid = session.pid
+            await session.close()
+            with pytest.raises(ChildProcessError):
+                os.waitpid(pid, os.WNOHANG)
+            assert session.fd is None
+
+
+@pytest.mark.asyncio
+async def test_terminal_backpressure(monkeypatch, mocker):
+    """Test that the terminal is not read while too much output waits for a slow client"""
+    monkeypatch.setenv("SHELL", "/bin/sh")
+    mocker.patch("covalent_ui.terminal.MAX_BUFFERED_BYTES", 1024)
+    sending = asyncio.Event()
+    release = asyncio.Event()
+    outputs = []
+
+    async def slow_emit(output):
+        outputs.append(output)
+        sending.set()
+        await release.wait()
+
+    session = TerminalSession(slow_emit)
+    session.start()
+    try:
+        session.write("yes | head -c 100000\n")
+        await asyncio.wait_for(sending.wait(), 5)
+        await asyncio.sleep(0.2)
+        assert len(outputs) == 1
+        assert not session._reading
+
+        release.set()
+
+        async def drained():
+            # The terminal translates line feeds to carriage return and line feed
+            while "".join(outputs).count("y\r\n") < 50000:
+                await asyncio.sleep(0.01)
+
+        await asyncio.wait_for(drained(), 10)
+    finally:
+        release.set()
+        await session.close()
+
+
+@pytest.mark.asyncio
+async def test_terminal_shell_exits(monkeypatch):
+    """Test that a shell which exits on its own is reaped without closing the session"""
+    monkeypatch.setenv("SHELL", "/bin/sh")
+    outputs = []
+
+    async def emit(output):
+        outputs.append(output)
+
+    session = TerminalSession(emit)
+    session.start()
+    pid = session.pid
+    try:
+        session.write("echo bye; exit\n")
+
+        async def reaped():
+            while session.pid is not None:
+                await asyncio.sleep(0.01)
+
+        await asyncio.wait_for(reaped(), 5)
+        assert "bye" in "".join(outputs)
+        with pytest.raises(ChildProcessError):
+            os.waitpid(pid, os.WNOHANG)
+    finally:
+        await session.close()
@@ -17,13 +17,22 @@
 """Result webhook functional test"""
 
 
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+
 import pytest
 
 import covalent as ct
 from covalent._results_manager import Result
 from covalent._shared_files.config import get_config
 from covalent._workflow.lattice import Lattice
-from covalent_ui.result_webhook import get_ui_url, send_draw_request, send_update
+from covalent_ui.result_webhook import (
+    UpdatePublisher,
+    get_publisher,
+    get_ui_url,
+    send_draw_request,
+    send_update,
+)
 from tests.covalent_ui_backend_tests.utils.assert_data.sample_result_webhook import (
     result_mock_data,
 )
@@ -69,6 +78,84 @@ async def test_send_update():
     response = await send_update(result_object)
     print(response)
     assert response is None
+    await get_publisher().close()
+
+
+@pytest.mark.asyncio
+async def test_update_publisher_coalesces_updates(mocker):
+    """Test that updates made within the interval are sent in a single request"""
+    posted = []
+
+    @asynccontextmanager
+    async def post(url, json):
+        posted.append(json)
+        yield mocker.AsyncMock(status=200)
+
+    publisher = UpdatePublisher(interval=0.01)
+    mocker.patch.object(publisher, "_get_session", return_value=mocker.Mock(post=post))
+
+    result_object = get_mock_result()
+    started_at = datetime(2023, 1, 1, tzinfo=timezone.utc)
+    publisher.publish_node(result_object.dispatch_id, 0, "RUNNING", start_time=started_at)
+    publisher.publish_node(result_object.dispatch_id, 0, "COMPLETED")
+    publisher.publish_node(result_object.dispatch_id, 1, "RUNNING")
+    publisher.publish_result(result_object)
+    await publisher._flush_task
+
+    assert posted == [
+        {
+            "event": "result-updates",
+            "updates": [
+                {
+                    "dispatch_id": result_object.dispatch_id,
+                    "nodes": [
+                        {
+                            "node_id": 0,
+                            "status": "COMPLETED",
+                            "started_at": started_at.isoformat(),
+                        },
+                        {"node_id": 1, "status": "RUNNING"},
+                    ],
+                    "result": {
+                        "dispatch_id": result_object.dispatch_id,
+                        "results_dir": result_object.results_dir,
+                        "status": str(result_object.status),
+                    },
+                }
+            ],
+        }
+    ]
+
+    # Nothing is sent when there are no new updates
+    await publisher.flush()
+    assert len(posted) == 1
+
+
+@pytest.mark.asyncio
+async def test_update_publisher_updates_during_post(mocker):
+    """Test that updates published while others are being sent are sent afterwards"""
+    posted = []
+
+    @asynccontextmanager
+    async def post(url, json):
+        posted.append(json)
+        if len(posted) == 1:
+            publisher.publish_node("dispatch", 1, "RUNNING")
+        yield mocker.AsyncMock(status=200)
+
+    publisher = UpdatePublisher(interval=0.01)
+    mocker.patch.object(publisher, "_get_session", return_value=mocker.Mock(post=post))
+
+    publisher.publish_node("dispatch", 0, "RUNNING")
+    first_flush = publisher._flush_task
+    await first_flush
+    assert publisher._flush_task is not first_flush
+    await publisher._flush_task
+
+    assert [json["updates"][0]["nodes"] for json in posted] == [
+        [{"node_id": 0, "status": "RUNNING"}],
+        [{"node_id": 1, "status": "RUNNING"}],
+    ]
 
 
 def test_send_draw_request():
@@ -233,5 +233,61 @@ def seed_graph_data():
                     ("5", "kwarg", 5, 5, None),
                 ]
             },
-        }
+        },
+        "test_graph_summary": {
+            "api_path": "api/v1/dispatches/{}/graph/summary",
+            "case_group_by_name": {
+                "status_code": 200,
+                "path": {"dispatch_id": VALID_DISPATCH_ID},
+                "query_data": {"group_by": "name"},
+                "groups": [
+                    ("hello", 1, {"COMPLETED": 1}),
+                    ("moniker", 1, {"COMPLETED": 1}),
+                    (":parameter:shore", 1, {"COMPLETED": 1}),
+                    ("join", 1, {"COMPLETED": 1}),
+                    ("join_+_ !!", 1, {"COMPLETED": 1}),
+                    (":parameter: !!", 1, {"COMPLETED": 1}),
+                ],
+                "links": [
+                    {"source": ":parameter: !!", "target": "join_+_ !!", "edge_count": 1},
+                    {"source": ":parameter:shore", "target": "moniker", "edge_count": 1},
+                    {"source": "hello", "target": "join", "edge_count": 1},
+                    {"source": "join", "target": "join_+_ !!", "edge_count": 1},
+                    {"source": "moniker", "target": "join", "edge_count": 1},
+                ],
+            },
+            "case_invalid_dispatch_id": {
+                "status_code": 400,
+                "path": {"dispatch_id": INVALID_DISPATCH_ID},
+                "query_data": {"group_by": "task_group"},
+            },
+        },
+        "test_graph_group": {
+            "api_path": "api/v1/dispatches/{}/graph/group",
+            "case_group_by_name": {
+                "status_code": 200,
+                "path": {"dispatch_id": VALID_DISPATCH_ID},
+                "query_data": {"group_by": "name", "group": "join"},
+                "group": "join",
+                "node_ids": [3],
+                "links": [
+                    ("hello", "join"),
+                    ("join", "join_+_ !!"),
+                    ("moniker", "join"),
+                ],
+            },
+            "case_group_by_task_group": {
+                "status_code": 200,
+                "path": {"dispatch_id": VALID_DISPATCH_ID},
+                "query_data": {"group_by": "task_group", "group": "3"},
+                "group": 3,
+                "node_ids": [3],
+                "links": [(0, 3), (1, 3), (3, 4)],
+            },
+            "case_invalid_task_group": {
+                "status_code": 400,
+                "path": {"dispatch_id": VALID_DISPATCH_ID},
+                "query_data": {"group_by": "task_group", "group": "join"},
+            },
+        },
     }
@@ -245,7 +245,7 @@ def seed_logs_data():
         "test_download_logs": {
             "api_path": "/api/v1/logs/download",
             "case1": {"status_code": 200},
-            "case_functional_1": {"response_type": "Response"},
+            "case_functional_1": {"response_type": "StreamingResponse"},
         },
         "test_logs_handler": {
             "handler_format1": handler_format_1,
@@ -95,6 +95,7 @@ def seed_summary_data():
                         },
                     ],
                     "total_count": 3,
+                    "next_cursor": None,
                 },
             },
             "case2": {
@@ -122,6 +123,7 @@ def seed_summary_data():
                         }
                     ],
                     "total_count": 3,
+                    "next_cursor": "WzIsIDFd",
                 },
             },
             "case3": {
@@ -315,4 +317,19 @@ def seed_summary_data():
                 },
             },
         },
+        "test_retention": {
+            "api_path": "/api/v1/dispatches/retention",
+            "case_running_status": {
+                "status_code": 400,
+                "request_data": {"body": {"max_age_days": 30, "statuses": ["RUNNING"]}},
+                "response_data": {
+                    "detail": [{"msg": "Dispatches with status RUNNING cannot be deleted"}]
+                },
+            },
+            "case_missing_job": {
+                "status_code": 400,
+                "path": {"job_id": "missing"},
+                "response_data": {"detail": [{"msg": "Retention job missing does not exist"}]},
+            },
+        },
     }
@@ -0,0 +1,88 @@
+# Copyright 2023 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+
+from locust import HttpUser, between, task
+
+DISPATCHES_PATH = "/api/v1/dispatches"
+
+LATTICE_FILES = ["result", "function_string", "inputs", "executor", "transport_graph"]
+ELECTRON_FILES = ["inputs", "function_string", "result", "stdout", "executor"]
+
+
+class UIUser(HttpUser):
+    """
+    Locust HttpUser instance used to browse the dispatches of the Covalent UI
+    concurrently, reading the lattice and electron files of the listed dispatches
+    with a duration anywhere between [0.5, 2] seconds
+    """
+
+    host = "http://localhost:48008"
+    wait_time = between(0.5, 2)
+
+    def on_start(self):
+        self.dispatch_ids = []
+        self.refresh_dispatches()
+
+    def _dispatch_id(self):
+        return random.choice(self.dispatch_ids) if self.dispatch_ids else None
+
+    @task(2)
+    def refresh_dispatches(self):
+        response = self.client.get(
+            f"{DISPATCHES_PATH}/list", params={"count": 50, "sort_by": "started_at"}
+        )
+        if response.ok:
+            self.dispatch_ids = [item["dispatch_id"] for item in response.json()["items"]]
+
+    @task
+    def get_overview(self):
+        self.client.get(f"{DISPATCHES_PATH}/overview")
+
+    @task(2)
+    def get_lattice_files(self):
+        dispatch_id = self._dispatch_id()
+        if dispatch_id is None:
+            return
+        self.client.get(f"{DISPATCHES_PATH}/{dispatch_id}", name="/dispatches/[id]")
+        for name in LATTICE_FILES:
+            self.client.get(
+                f"{DISPATCHES_PATH}/{dispatch_id}/details/{name}",
+                name=f"/dispatches/[id]/details/{name}",
+            )
+
+    @task(4)
+    def get_electron_files(self):
+        dispatch_id = self._dispatch_id()
+        if dispatch_id is None:
+            return
+        response = self.client.get(
+            f"{DISPATCHES_PATH}/{dispatch_id}/graph", name="/dispatches/[id]/graph"
+        )
+        if not response.ok or not response.json()["graph"]["nodes"]:
+            return
+
+        node_id = random.choice(response.json()["graph"]["nodes"])["node_id"]
+        self.client.get(
+            f"{DISPATCHES_PATH}/{dispatch_id}/electron/{node_id}",
+            name="/dispatches/[id]/electron/[node_id]",
+        )
+        for name in ELECTRON_FILES:
+            self.client.get(
+                f"{DISPATCHES_PATH}/{dispatch_id}/electron/{node_id}/details/{name}",
+                name=f"/dispatches/[id]/electron/[node_id]/details/{name}",
+            )
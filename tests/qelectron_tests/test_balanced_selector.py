@@ -0,0 +1,135 @@
+# Copyright 2021 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=no-member
+
+from collections import Counter
+from unittest.mock import MagicMock
+
+import pennylane as qml
+import pytest
+
+import covalent as ct
+from covalent.executor.qbase import QCResult
+from covalent.quantum.qclient.core import middleware
+from covalent.quantum.qcluster.default_selectors import BalancedSelector
+from covalent.quantum.qcluster.load_tracker import ExecutorLoadTracker, get_executor_key
+from covalent.quantum.qserver.cache import ResultCache
+from covalent.quantum.qserver.core import FuturesTable, QServer
+
+
+@pytest.fixture
+def load_tracker(mocker):
+    tracker = ExecutorLoadTracker()
+    mocker.patch("covalent.quantum.qcluster.default_selectors.executor_load", tracker)
+    mocker.patch("covalent.quantum.qserver.core.executor_load", tracker)
+    return tracker
+
+
+def test_executor_key():
+    """
+    Test that executors are identified by their settings.
+    """
+
+    assert get_executor_key(ct.executor.Simulator()) == get_executor_key(ct.executor.Simulator())
+    assert get_executor_key(ct.executor.Simulator()) != get_executor_key(
+        ct.executor.Simulator(workers=2)
+    )
+
+
+def test_load_tracker(mocker, load_tracker):
+    """
+    Test in-flight counts from the futures table and latency percentiles.
+    """
+
+    executor = ct.executor.Simulator()
+    futures_table = FuturesTable()
+
+    batch_id = futures_table.add_executor_future_pairs([[executor, {0: None, 1: None}]], [0, 1])
+    assert load_tracker.in_flight(executor) == 2
+
+    # Circuits are in flight until their results are retrieved.
+    futures_table.pop_executor_future_pairs(batch_id)
+    assert load_tracker.in_flight(executor) == 2
+
+    server = MagicMock(_result_cache=ResultCache())
+    mocker.patch.object(
+        ct.executor.Simulator, "batch_get_results", side_effect=RuntimeError("failed")
+    )
+    with pytest.raises(RuntimeError):
+        QServer._get_sub_batch_results(server, executor, {0: None}, {})
+    assert load_tracker.in_flight(executor) == 1
+
+    mocker.patch.object(
+        ct.executor.Simulator, "batch_get_results", return_value=[QCResult(execution_time=1.0)]
+    )
+    QServer._get_sub_batch_results(server, executor, {1: None}, {})
+    assert load_tracker.in_flight(executor) == 0
+
+    load_tracker.record_latencies(executor, [2.0, 3.0, None])
+    assert load_tracker.latency(executor) == 2.0
+    assert load_tracker.stats(executor)["p90"] == pytest.approx(2.8)
+
+
+def test_balanced_selector_split(load_tracker):
+    """
+    Test that batches are split across executors in proportion to their throughput.
+    """
+
+    fast = ct.executor.Simulator(workers=1)
+    slow = ct.executor.Simulator(workers=2)
+    load_tracker.record_latencies(fast, [1.0])
+    load_tracker.record_latencies(slow, [6.0])
+
+    selector = BalancedSelector()
+    counts = Counter(
+        get_executor_key(ex) for ex in selector.select_batch([None] * 8, [fast, slow])
+    )
+    assert counts == {get_executor_key(fast): 6, get_executor_key(slow): 2}
+
+    # Circuits already in flight are taken into account.
+    load_tracker.add_in_flight(fast, 3)
+    counts = Counter(
+        get_executor_key(ex) for ex in selector.select_batch([None] * 2, [fast, slow])
+    )
+    assert counts == {get_executor_key(fast): 1, get_executor_key(slow): 1}
+
+    # Costs are traded off against completion times.
+    selector = BalancedSelector(costs=[10.0, 0.0], cost_weight=1.0)
+    assert selector(None, [fast, slow]) is slow
+
+    with pytest.raises(ValueError, match="one cost per executor"):
+        BalancedSelector(costs=[10.0]).select_batch([None], [fast, slow])
+
+
+def test_balanced_qcluster(mocker, load_tracker):
+    """
+    Test that a QCluster with the balanced selector returns correct results.
+    """
+
+    mocker.patch.object(middleware.qclient.qserver, "_result_cache", ResultCache())
+
+    executors = [ct.executor.Simulator(workers=1), ct.executor.Simulator(workers=2)]
+
+    @ct.qelectron(executors=ct.executor.QCluster(executors=executors, selector="balanced"))
+    @qml.qnode(qml.device("default.qubit", wires=1), diff_method="parameter-shift")
+    def circuit(param):
+        qml.RX(param, wires=0)
+        return qml.expval(qml.PauliZ(0))
+
+    param = qml.numpy.array(0.5, requires_grad=True)
+    assert qml.math.allclose(qml.grad(circuit)(param), -qml.math.sin(0.5))
+    assert all(load_tracker.latency(ex) is not None for ex in executors)
@@ -0,0 +1,179 @@
+# Copyright 2021 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+# pylint: disable=protected-access
+
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+from covalent.quantum.qserver import database
+from covalent.quantum.qserver.database import Database
+
+
+def test_environment_reused(tmp_path):
+    """
+    Test that databases are opened once per process and reopened after deletion.
+    """
+
+    db = Database(tmp_path)
+    db.set(["a"], [{"x": 1}], dispatch_id="d", node_id=0)
+
+    path = str(db._get_db_path("d", 0))
+    env = database._environments._envs[path].env
+
+    assert db.get("a", dispatch_id="d", node_id=0) == {"x": 1}
+    assert Database(tmp_path).get_db(dispatch_id="d", node_id=0) == {"a": {"x": 1}}
+    assert database._environments._envs[path].env is env
+
+    shutil.rmtree(tmp_path / "d")
+    db.set(["b"], [{"x": 2}], dispatch_id="d", node_id=0)
+    assert database._environments._envs[path].env is not env
+    assert db.get_db(dispatch_id="d", node_id=0) == {"b": {"x": 2}}
+
+
+def test_set_merges_values(tmp_path):
+    """
+    Test that values stored for existing keys are merged with the new values.
+    """
+
+    db = Database(tmp_path)
+    db.set(["a", "b"], [{"x": 1}, {"x": 2}], dispatch_id="d", node_id=0)
+    db.set(["a", "c"], [{"y": 3}, {"y": 4}], dispatch_id="d", node_id=0)
+
+    assert db.get_db(dispatch_id="d", node_id=0) == {
+        "a": {"x": 1, "y": 3},
+        "b": {"x": 2},
+        "c": {"y": 4},
+    }
+    assert sorted(db.get_circuit_ids(dispatch_id="d", node_id=0)) == ["a", "b", "c"]
+    assert dict(db.iter_items(["c", "missing"], dispatch_id="d", node_id=0)) == {"c": {"y": 4}}
+
+
+def test_map_size_grows(tmp_path):
+    """
+    Test that writes beyond the initial map size grow the database.
+    """
+
+    db = Database(tmp_path, map_size=2**16)
+    values = [{"data": str(i) * 1000} for i in range(200)]
+    db.set([str(i) for i in range(200)], values, dispatch_id="d", node_id=0)
+
+    assert len(db.get_db(dispatch_id="d", node_id=0)) == 200
+
+
+def test_concurrent_writes(tmp_path):
+    """
+    Test that threads can read and write the same database concurrently,
+    while it grows.
+    """
+
+    db = Database(tmp_path, map_size=2**16)
+
+    def write(i):
+        keys = [f"{i}-{j}" for j in range(20)]
+        db.set(keys, [{"data": "x" * 500}] * 20, dispatch_id="d", node_id=0)
+        assert len(list(db.iter_items(dispatch_id="d", node_id=0))) >= 20
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(write, range(16)))
+
+    assert len(db.get_circuit_ids(dispatch_id="d", node_id=0)) == 320
+
+
+def test_environments_evicted(tmp_path, mocker):
+    """
+    Test that the least recently used databases are closed beyond the maximum.
+    """
+
+    mocker.patch.object(database, "_environments", database._EnvironmentCache(max_size=2))
+
+    db = Database(tmp_path)
+    for node_id in range(3):
+        db.set(["a"], [{"node": node_id}], dispatch_id="d", node_id=node_id)
+
+    assert len(database._environments._envs) == 2
+    assert db.get("a", dispatch_id="d", node_id=0) == {"node": 0}
+
+
+def test_environment_pinned(tmp_path, mocker):
+    """
+    Test that databases in use are only closed once they are no longer used.
+    """
+
+    mocker.patch.object(database, "_environments", database._EnvironmentCache(max_size=1))
+
+    db = Database(tmp_path)
+    db.set(["a", "b"], [{"x": 1}, {"x": 2}], dispatch_id="d", node_id=0)
+
+    items = db.iter_items(dispatch_id="d", node_id=0)
+    assert next(items) == ("a", {"x": 1})
+
+    # Opening another database cannot evict the one being read.
+    db.set(["a"], [{"x": 3}], dispatch_id="d", node_id=1)
+    assert len(database._environments._envs) == 2
+
+    # Replacing the database being read defers closing it until it is released.
+    path = str(db._get_db_path("d", 0))
+    entry = database._environments._envs[path]
+    shutil.rmtree(tmp_path / "d" / "node-0")
+    db.set(["c"], [{"x": 4}], dispatch_id="d", node_id=0)
+    assert entry.evicted and entry.refs == 1
+
+    assert list(items) == [("b", {"x": 2})]
+    assert entry.refs == 0
+    assert len(database._environments._envs) == 1
+
+
+def test_jobs_index(tmp_path):
+    """
+    Test that the summary and jobs index are maintained as circuits are stored.
+    """
+
+    db = Database(tmp_path)
+    circuit_ids = [f"circuit_{i}" for i in range(5)]
+    db.set(
+        circuit_ids,
+        [{"save_time": f"2024-01-01 00:00:0{i}"} for i in range(5)],
+        dispatch_id="d",
+        node_id=0,
+    )
+    db.set(
+        circuit_ids[1:3],
+        [{"execution_time": 1.5, "result": [1.0], "result_metadata": {"executor_name": "E"}}] * 2,
+        dispatch_id="d",
+        node_id=0,
+    )
+
+    assert db.get_summary(dispatch_id="d", node_id=0) == {
+        "num_circuits": 5,
+        "total_execution_time": 3.0,
+    }
+    assert sorted(db.get_db(dispatch_id="d", node_id=0)) == circuit_ids
+
+    jobs, cursor = db.get_jobs(limit=3, dispatch_id="d", node_id=0)
+    assert [job["job_id"] for job in jobs] == circuit_ids[:1:-1]
+    assert [job["status"] for job in jobs] == ["RUNNING", "RUNNING", "COMPLETED"]
+
+    jobs, cursor = db.get_jobs(cursor, limit=3, dispatch_id="d", node_id=0)
+    assert [job["job_id"] for job in jobs] == circuit_ids[1::-1]
+    assert jobs[0]["executor"] == "E"
+    assert cursor is None
+
+    jobs, cursor = db.get_jobs(limit=2, descending=False, dispatch_id="d", node_id=0)
+    assert [job["job_id"] for job in jobs] == circuit_ids[:2]
+    jobs, _ = db.get_jobs(cursor, descending=False, dispatch_id="d", node_id=0)
+    assert [job["job_id"] for job in jobs] == circuit_ids[2:]
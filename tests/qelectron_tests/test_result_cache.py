@@ -0,0 +1,152 @@
+# Copyright 2021 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=no-member
+
+import pennylane as qml
+import pytest
+from numpy import isclose
+
+import covalent as ct
+from covalent._shared_files.qinfo import QElectronInfo
+from covalent.executor.qbase import QCResult
+from covalent.quantum.qclient.core import middleware
+from covalent.quantum.qserver.cache import ResultCache, get_circuit_hash
+from covalent.quantum.qserver.database import Database
+
+
+def _make_qscript(param):
+    with qml.tape.QuantumTape() as tape:
+        qml.RX(param, wires=0)
+        qml.CNOT(wires=[0, 1])
+        qml.expval(qml.PauliZ(1))
+    return tape
+
+
+def _make_executor(**kwargs):
+    executor = ct.executor.Simulator(**kwargs)
+    executor.qelectron_info = QElectronInfo(
+        name="circuit",
+        device_name="default.qubit",
+        device_import_path="pennylane.devices.default_qubit:DefaultQubit",
+        device_shots=None,
+        device_wires=2,
+        pennylane_active_return=True,
+    )
+    return executor
+
+
+def test_circuit_hash():
+    """
+    Test that circuits hash equal only if their results are expected to be equal.
+    """
+
+    executor = _make_executor()
+    key = get_circuit_hash(_make_qscript(0.3), executor)
+
+    assert key == get_circuit_hash(_make_qscript(0.3), executor)
+    assert key != get_circuit_hash(_make_qscript(0.4), executor)
+    assert key != get_circuit_hash(_make_qscript(0.3), _make_executor(shots=100))
+
+
+def test_use_result_cache():
+    """
+    Test that simulators use the cache by default only when deterministic.
+    """
+
+    assert _make_executor().use_result_cache
+    assert not _make_executor(shots=100).use_result_cache
+    assert _make_executor(shots=100, cache_results=True).use_result_cache
+    assert not _make_executor(cache_results=False).use_result_cache
+
+
+def test_result_cache(tmp_path):
+    """
+    Test the in-memory LRU and the persistent tier of the result cache.
+    """
+
+    database = Database(tmp_path)
+    cache = ResultCache(database, max_size=1)
+
+    cache.set("a", QCResult(results=[1.0]))
+    cache.set("b", QCResult(results=[2.0]))
+    assert list(cache._results) == ["b"]
+
+    # Evicted results are read back from the database.
+    assert cache.get("a").results == [1.0]
+    assert list(cache._results) == ["a"]
+    assert cache.get("c") is None
+    assert cache.stats == {"hits": 1, "misses": 1}
+
+    assert ResultCache(database).get("b").results == [2.0]
+
+
+def test_result_cache_eviction(tmp_path):
+    """
+    Test that the persistent tier keeps only the most recently used results.
+    """
+
+    database = Database(tmp_path, result_cache_size=2)
+
+    database.set_cached_results({"a": QCResult(results=[1.0]), "b": QCResult(results=[2.0])})
+    assert database.get_cached_result("a").results == [1.0]
+
+    # "b" is the least recently used result.
+    database.set_cached_result("c", QCResult(results=[3.0]))
+    assert database.get_cached_result("b") is None
+    assert database.get_cached_result("a").results == [1.0]
+    assert database.get_cached_result("c").results == [3.0]
+
+    # Storing a result again does not count it twice.
+    database.set_cached_result("c", QCResult(results=[4.0]))
+    assert database.get_cached_result("a").results == [1.0]
+    assert database.get_cached_result("c").results == [4.0]
+
+
+def test_qelectron_result_cache(mocker):
+    """
+    Test that repeated circuits are served from the cache with the same results.
+    """
+
+    mocker.patch.object(middleware.qclient.qserver, "_result_cache", ResultCache())
+    qserver = middleware.qclient.qserver
+
+    @ct.qelectron(executors=ct.executor.Simulator())
+    @qml.qnode(qml.device("default.qubit", wires=2))
+    def circuit(param):
+        qml.RX(param, wires=0)
+        qml.CNOT(wires=[0, 1])
+        return qml.expval(qml.PauliZ(1))
+
+    @ct.qelectron(executors=ct.executor.Simulator())
+    @qml.qnode(qml.device("default.qubit", wires=2, shots=1000))
+    def sampled_circuit(param):
+        qml.RX(param, wires=0)
+        return qml.expval(qml.PauliZ(0))
+
+    result_1 = circuit(0.3)
+    assert qserver.cache_stats == {"hits": 0, "misses": 1}
+
+    result_2 = circuit(0.3)
+    assert qserver.cache_stats == {"hits": 1, "misses": 1}
+    assert result_1 == result_2
+
+    assert isclose(circuit(0.4), qml.math.cos(0.4))
+    assert qserver.cache_stats == {"hits": 1, "misses": 2}
+
+    # Circuits run with shots are not cached by default.
+    sampled_circuit(0.3)
+    assert qserver.cache_stats == {"hits": 1, "misses": 2}
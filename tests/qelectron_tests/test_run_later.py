@@ -16,6 +16,8 @@
 
 # pylint: disable=no-member
 
+import asyncio
+
 import pennylane as qml
 import pytest
 from numpy import isclose
@@ -90,3 +92,32 @@ def test_multi_return_async(executor):
     msg = "Call and run later results are different"
     for o1, o2 in zip(output_1, output_2):
         assert isclose(o1, o2, atol=0.1).all(), msg
+
+
+@pytest.mark.parametrize("executor", EXECUTORS)
+def test_await_run_later(executor):
+    """
+    Test that awaiting `run_later` futures produces the same result as the normal call.
+    """
+
+    @qml.qnode(qml.device("default.qubit", wires=2, shots=4096))
+    def circuit(theta):
+        qml.Hadamard(wires=0)
+        qml.CNOT(wires=[0, 1])
+        qml.RY(theta, wires=0)
+        return qml.expval(qml.PauliZ(0) @ qml.PauliZ(1))
+
+    qe_circuit = ct.qelectron(circuit, executors=[executor, ct.executor.Simulator()])
+
+    thetas = [0.1, 0.5, 0.9]
+
+    output_1 = [circuit(theta) for theta in thetas]
+
+    async def run_all():
+        return await asyncio.gather(*(qe_circuit.run_later(theta) for theta in thetas))
+
+    output_2 = asyncio.run(run_all())
+
+    msg = "Call and awaited run later results are different"
+    for o1, o2 in zip(output_1, output_2):
+        assert isclose(o1, o2, atol=0.1), msg
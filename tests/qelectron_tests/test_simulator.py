@@ -0,0 +1,148 @@
+# Copyright 2023 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=no-member
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import pennylane as qml
+import pytest
+
+import covalent as ct
+from covalent.executor.qbase import BatchedBaseQExecutor, SyncBaseQExecutor, get_device
+from covalent.quantum.qclient.core import middleware
+from covalent.quantum.qcluster.simulator import get_simulator_backend
+from covalent.quantum.qserver.cache import ResultCache
+
+
+def test_get_device():
+    """
+    Test that devices are reused within a thread but not shared between threads.
+    """
+
+    dev = get_device("default.qubit", 2, None)
+    assert dev is get_device("default.qubit", 2, None)
+    assert dev is not get_device("default.qubit", 2, 100)
+    assert dev is not get_device("default.qubit", 3, None)
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        assert pool.submit(get_device, "default.qubit", 2, None).result() is not dev
+
+
+def test_get_simulator_backend():
+    """
+    Test that Simulator backends are reused for the same settings.
+    """
+
+    backend = get_simulator_backend("thread", 2, "default.qubit")
+    assert backend is get_simulator_backend("thread", 2, "default.qubit")
+    assert backend is not get_simulator_backend("thread", 4, "default.qubit")
+    assert get_simulator_backend("sync", 2, "default.qubit").__class__.__name__ == (
+        "SyncBaseQExecutor"
+    )
+
+
+@pytest.mark.parametrize("parallel", ["thread", "sync"])
+def test_simulator_reused_devices(mocker, parallel):
+    """
+    Test that repeated executions on reused devices give correct results.
+    """
+
+    mocker.patch.object(middleware.qclient.qserver, "_result_cache", ResultCache())
+
+    @ct.qelectron(executors=ct.executor.Simulator(parallel=parallel, cache_results=False))
+    @qml.qnode(qml.device("default.qubit", wires=2), diff_method="parameter-shift")
+    def circuit(params):
+        qml.RX(params[0], wires=0)
+        qml.RY(params[1], wires=1)
+        qml.CNOT(wires=[0, 1])
+        return qml.expval(qml.PauliZ(1))
+
+    for x in [0.1, 0.2]:
+        params = qml.numpy.array([x, 2 * x], requires_grad=True)
+        expected = qml.math.cos(x) * qml.math.cos(2 * x)
+        assert qml.math.allclose(circuit(params), expected)
+
+        grad = qml.grad(circuit)(params)
+        expected_grad = [
+            -qml.math.sin(x) * qml.math.cos(2 * x),
+            -2 * qml.math.cos(x) * qml.math.sin(2 * x),
+        ]
+        assert qml.math.allclose(grad[0], expected_grad[0])
+
+
+def test_batched_executor_results():
+    """
+    Test that broadcasting structurally identical circuits preserves their results and order.
+    """
+
+    def make_qscript(x, y, measure_probs=False):
+        ops = [qml.RX(x, wires=0), qml.RY(y, wires=1), qml.CNOT(wires=[0, 1])]
+        measurements = [qml.expval(qml.PauliZ(1))]
+        if measure_probs:
+            measurements.append(qml.probs(wires=[0]))
+        return qml.tape.QuantumScript(ops, measurements)
+
+    qscripts = [
+        make_qscript(0.1, 0.2),
+        make_qscript(0.3, 0.4, measure_probs=True),
+        make_qscript(0.5, 0.6),
+        make_qscript(0.7, 0.8, measure_probs=True),
+        qml.tape.QuantumScript([qml.Hadamard(0)], [qml.expval(qml.PauliZ(0))]),
+        make_qscript(0.9, 1.0),
+    ]
+    device_args = ("default.qubit", 2, None)
+
+    batched = BatchedBaseQExecutor()
+    results = batched.run_all_circuits(qscripts, device_args)
+    expected = SyncBaseQExecutor().run_all_circuits(qscripts, device_args)
+
+    assert len(results) == len(qscripts)
+    for result, expected_result in zip(results, expected):
+        result, expected_result = result.results[0], expected_result.results[0]
+        assert type(result) is type(expected_result)
+        if isinstance(result, tuple):
+            assert all(map(qml.math.allclose, result, expected_result))
+        else:
+            assert qml.math.allclose(result, expected_result)
+
+    # Three structures for the six circuits.
+    with mock.patch("covalent.executor.qbase.qml.execute", wraps=qml.execute) as mock_execute:
+        batched.run_all_circuits(qscripts, device_args)
+    assert len(mock_execute.call_args_list[0][0][0]) == 3
+
+
+def test_batched_simulator(mocker):
+    """
+    Test that the batched Simulator computes parameter-shift gradients correctly.
+    """
+
+    mocker.patch.object(middleware.qclient.qserver, "_result_cache", ResultCache())
+
+    @ct.qelectron(executors=ct.executor.Simulator(parallel="batched", cache_results=False))
+    @qml.qnode(qml.device("default.qubit", wires=2), diff_method="parameter-shift")
+    def circuit(params):
+        qml.RX(params[0], wires=0)
+        qml.RY(params[1], wires=1)
+        qml.CNOT(wires=[0, 1])
+        return qml.expval(qml.PauliZ(1))
+
+    params = qml.numpy.array([0.1, 0.2], requires_grad=True)
+    assert qml.math.allclose(circuit(params), qml.math.cos(0.1) * qml.math.cos(0.2))
+
+    grad = qml.grad(circuit)(params)
+    assert qml.math.allclose(grad[1], -qml.math.cos(0.1) * qml.math.sin(0.2))
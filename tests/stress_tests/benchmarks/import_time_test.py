@@ -0,0 +1,63 @@
+# Copyright 2023 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark for the time taken by `import covalent` in a fresh interpreter."""
+
+import json
+import logging
+import os
+import subprocess
+import sys
+import time
+
+# Seconds `import covalent` may take on top of interpreter startup before the benchmark fails
+IMPORT_TIME_THRESHOLD = float(os.environ.get("COVALENT_IMPORT_TIME_THRESHOLD", "1.0"))
+NUM_RUNS = 5
+
+# Modules which must only be imported once the quantum stack or a plugin is used
+DEFERRED_MODULES = ["pennylane", "mpire", "lmdb", "orjson", "pkg_resources"]
+
+
+def _time_command(code: str) -> float:
+    """Return the best wall time out of `NUM_RUNS` runs of `code` in a new interpreter"""
+
+    timings = []
+    for _ in range(NUM_RUNS):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def test_import_time():
+    """Test that importing covalent stays below the regression threshold."""
+
+    import_time = _time_command("import covalent") - _time_command("pass")
+    logging.getLogger("metricsLogger").info(f"import covalent: {import_time:.3f}s")
+
+    assert import_time < IMPORT_TIME_THRESHOLD
+
+
+def test_import_defers_heavy_modules():
+    """Test that importing covalent does not pull in the quantum stack or plugin discovery."""
+
+    code = (
+        "import json, sys, covalent; "
+        f"print(json.dumps([m for m in {DEFERRED_MODULES!r} if m in sys.modules]))"
+    )
+    output = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True)
+
+    assert json.loads(output.stdout.decode().splitlines()[-1]) == []
@@ -0,0 +1,85 @@
+# Copyright 2021 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Batches of circuits run on a QCluster of unequal Simulator executors
+# Compares the makespan of the "cyclic" and "balanced" selectors
+
+import os
+import time
+
+import pennylane as qml
+import yaml
+from pennylane import numpy as pnp
+
+import covalent as ct
+
+benchmark_name = "qcluster_selectors"
+benchmark_dir = f"benchmark_results/{benchmark_name}/current"
+
+if not os.path.isdir(benchmark_dir):
+    os.makedirs(benchmark_dir)
+
+selectors = ["cyclic", "balanced"]
+num_params = [4, 16, 32]
+num_qubits = 12
+trials_per_size = 3
+
+
+def make_circuit(selector):
+    executors = [
+        ct.executor.Simulator(parallel="thread", workers=1),
+        ct.executor.Simulator(parallel="thread", workers=4),
+        ct.executor.Simulator(parallel="thread", workers=8),
+    ]
+
+    @ct.qelectron(executors=ct.executor.QCluster(executors=executors, selector=selector))
+    @qml.qnode(qml.device("default.qubit", wires=num_qubits), diff_method="parameter-shift")
+    def circuit(params):
+        for i, param in enumerate(params):
+            qml.RX(param, wires=i % num_qubits)
+            qml.CNOT(wires=[i % num_qubits, (i + 1) % num_qubits])
+        return qml.expval(qml.PauliZ(0))
+
+    return circuit
+
+
+for selector in selectors:
+    circuit = make_circuit(selector)
+
+    # Warm up to collect execution times for the "balanced" selector
+    circuit(pnp.zeros(num_qubits))
+
+    for n in num_params:
+        for i in range(trials_per_size):
+            # Distinct parameters so that no results are served from the result cache
+            params = pnp.array(pnp.random.uniform(size=n), requires_grad=True)
+
+            start = time.time()
+            qml.grad(circuit)(params)
+            end = time.time()
+
+            outfile = f"{benchmark_dir}/{selector}_params_{n}_trial_{i}"
+            with open(outfile, "w") as f:
+                yaml.dump(
+                    {
+                        "test": benchmark_name,
+                        "selector": selector,
+                        "num_circuits": 2 * n,
+                        "runtime": end - start,
+                    },
+                    f,
+                )
+            print(f"{selector} runtime for {2 * n} circuits: {end - start} seconds")